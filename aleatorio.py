@@ -0,0 +1,95 @@
+import hashlib
+import random
+
+
+def _restaurar_generador(semilla, ruta, hijos_creados, estado):
+    """Reconstruye un GeneradorAleatorio serializado (ver __reduce__)."""
+    generador = GeneradorAleatorio(semilla, ruta=ruta)
+    generador.hijos_creados = hijos_creados
+    generador.setstate(estado)
+    return generador
+
+
+class GeneradorAleatorio(random.Random):
+    """
+    Generador de números aleatorios de la simulación, reproducible y divisible.
+
+    Es un random.Random sembrado a partir de una semilla y una ruta. La ruta
+    identifica al generador dentro del árbol de flujos: el generador raíz
+    tiene ruta vacía y cada hijo agrega su índice. Dos generadores con la
+    misma semilla y ruta producen la misma secuencia, y generadores con rutas
+    distintas producen secuencias independientes, lo que permite repartir
+    flujos deterministas entre trabajadores paralelos o motores en lote.
+
+    Attributes:
+        semilla (int): Semilla raíz del árbol de flujos
+        ruta (tuple): Posición de este generador dentro del árbol
+        hijos_creados (int): Cuántos flujos hijos se han derivado
+    """
+
+    def __init__(self, semilla=None, ruta=()):
+        """
+        Inicializa el generador.
+
+        Args:
+            semilla (int): Semilla raíz. Si es None, se toma de la entropía del sistema
+                           (y queda guardada para poder repetir la ejecución)
+            ruta (tuple): Ruta del flujo dentro del árbol. Default: raíz
+        """
+        if semilla is None:
+            semilla = random.SystemRandom().getrandbits(64)
+        self.semilla = semilla
+        self.ruta = tuple(ruta)
+        self.hijos_creados = 0
+        super().__init__(self.semilla_derivada())
+
+    def semilla_derivada(self):
+        """
+        Calcula la semilla efectiva de este flujo a partir de la semilla y la ruta.
+
+        Returns:
+            int: Entero de 128 bits
+        """
+        clave = repr((self.semilla, self.ruta)).encode()
+        return int.from_bytes(hashlib.sha256(clave).digest()[:16], 'big')
+
+    def generar_hijo(self):
+        """
+        Deriva un flujo hijo independiente.
+
+        El hijo depende solo de la semilla, la ruta y el orden de creación,
+        no de cuántos números haya sorteado ya este generador.
+
+        Returns:
+            GeneradorAleatorio: Nuevo generador hijo
+        """
+        hijo = GeneradorAleatorio(self.semilla, ruta=self.ruta + (self.hijos_creados,))
+        self.hijos_creados += 1
+        return hijo
+
+    def generar_hijos(self, cantidad):
+        """
+        Deriva varios flujos hijos independientes.
+
+        Args:
+            cantidad (int): Número de hijos
+
+        Returns:
+            list: Lista de GeneradorAleatorio
+        """
+        return [self.generar_hijo() for _ in range(cantidad)]
+
+    def generador_numpy(self):
+        """
+        Crea un generador de NumPy determinista para este flujo.
+
+        Returns:
+            numpy.random.Generator: Generador sembrado con la semilla derivada
+        """
+        import numpy as np
+
+        return np.random.default_rng(np.random.SeedSequence(self.semilla_derivada()))
+
+    def __reduce__(self):
+        return (_restaurar_generador,
+                (self.semilla, self.ruta, self.hijos_creados, self.getstate()))
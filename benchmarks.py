@@ -0,0 +1,418 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos del núcleo que deben importarse rápido y sin la capa gráfica
+MODULOS_NUCLEO = ('entorno', 'simulacion')
+MODULOS_PESADOS = ('matplotlib', 'numpy')
+
+_CODIGO_ARRANQUE = """
+import json, sys, time
+inicio = time.perf_counter()
+for modulo in {modulos!r}:
+    __import__(modulo)
+duracion = time.perf_counter() - inicio
+pesados = [m for m in {pesados!r} if m in sys.modules]
+print(json.dumps({{'segundos': duracion, 'pesados': pesados}}))
+"""
+
+
+def medir_arranque(modulos=MODULOS_NUCLEO, repeticiones=5):
+    """
+    Mide cuánto tarda en importarse el núcleo en un intérprete nuevo.
+
+    Cada repetición usa un proceso limpio para que no influyan módulos ya
+    cargados; se reporta el mejor tiempo.
+
+    Args:
+        modulos (tuple): Módulos a importar
+        repeticiones (int): Cuántos procesos lanzar
+
+    Returns:
+        dict: 'segundos' (mejor tiempo) y 'pesados' (módulos pesados que se cargaron)
+    """
+    codigo = _CODIGO_ARRANQUE.format(modulos=tuple(modulos), pesados=MODULOS_PESADOS)
+    mejor = None
+    pesados = set()
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, '-c', codigo], cwd=DIRECTORIO,
+                                capture_output=True, text=True, check=True).stdout
+        resultado = json.loads(salida)
+        pesados.update(resultado['pesados'])
+        if mejor is None or resultado['segundos'] < mejor:
+            mejor = resultado['segundos']
+    return {'segundos': mejor, 'pesados': sorted(pesados)}
+
+
+def comando_arranque(args):
+    """
+    Verifica que importar el núcleo quede dentro del presupuesto de tiempo.
+
+    Returns:
+        int: 0 si cumple, 1 si excede el presupuesto o carga módulos pesados
+    """
+    resultado = medir_arranque(repeticiones=args.repeticiones)
+    milisegundos = resultado['segundos'] * 1000
+    print(f"Importar {', '.join(MODULOS_NUCLEO)}: {milisegundos:.1f} ms "
+          f"(presupuesto: {args.presupuesto_ms:.0f} ms)")
+
+    ok = True
+    if milisegundos > args.presupuesto_ms:
+        print("  ✗ Excede el presupuesto de arranque")
+        ok = False
+    if resultado['pesados']:
+        print(f"  ✗ Se cargaron modulos pesados: {', '.join(resultado['pesados'])}")
+        ok = False
+    if ok:
+        print("  ✓ Arranque dentro del presupuesto")
+    return 0 if ok else 1
+
+
+# Escalas del benchmark del núcleo: lados del mapa (cuadrado) y poblaciones
+ESCALAS = {
+    'rapida': {'lados': (40, 400), 'poblaciones': (10, 1000)},
+    'completa': {'lados': (40, 400, 4000), 'poblaciones': (10, 1000, 100000)},
+}
+
+# Pruebas del núcleo; las de POR_MAPA no dependen de la población
+PRUEBAS = ('realizar_paso', 'generar_comida', 'ataques', 'simular_dia', 'random_walk')
+POR_MAPA = ('generar_comida', 'random_walk')
+
+SEMILLA = 12345
+
+# Casos más cortos que esto varían demasiado entre corridas: se muestran pero no
+# se marcan como regresión
+MINIMO_SEGUNDOS = 0.1
+REPETICIONES = 5
+# La base depende de la máquina: no se versiona, se crea en la primera corrida
+BASE_POR_DEFECTO = os.path.join(DIRECTORIO, 'benchmarks_base.json')
+
+_CODIGO_CASO = """
+import json
+import benchmarks
+print(json.dumps(benchmarks.ejecutar_caso({prueba!r}, {lado!r}, {poblacion!r}, {pasos!r},
+                                          {comida_densa!r}, {repeticiones!r})))
+"""
+
+
+def _memoria_pico_mb():
+    """Memoria residente máxima del proceso en MB, o None si no se puede medir."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa kilobytes; macOS, bytes
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+def _crear_simulacion(lado, poblacion, pasos, comida_densa, depredadores):
+    """Simulación de prueba con semilla fija y sin guardar caminos."""
+    from entorno import Entorno
+    from simulacion import Simulacion
+
+    entorno = Entorno(ancho=lado, alto=lado, comida_densa=comida_densa, semilla=SEMILLA)
+    return Simulacion(entorno, num_particulas_inicial=poblacion, pasos_por_dia=pasos,
+                      frecuencia_depredadores=1 if depredadores else 0,
+                      cantidad_depredadores=depredadores, max_dias_guardados=0,
+                      politica_rastro='ninguno')
+
+
+def _medir_una_vez(prueba, lado, poblacion, pasos, comida_densa):
+    """Prepara una prueba y devuelve (segundos, operaciones) de una corrida."""
+    from entorno import Entorno
+    from random_walk import RandomWalk
+
+    if prueba == 'realizar_paso':
+        simulacion = _crear_simulacion(lado, poblacion, pasos, comida_densa, 0)
+        particulas = simulacion.particulas
+        inicio = time.perf_counter()
+        for _ in range(pasos):
+            for particula in particulas:
+                particula.realizar_paso(depredadores=[])
+        operaciones = pasos * len(particulas)
+    elif prueba == 'generar_comida':
+        entorno = Entorno(ancho=lado, alto=lado, comida_densa=comida_densa, semilla=SEMILLA)
+        inicio = time.perf_counter()
+        for _ in range(pasos):
+            entorno._generar_comida()
+        operaciones = pasos
+    elif prueba == 'ataques':
+        simulacion = _crear_simulacion(lado, poblacion, pasos, comida_densa,
+                                       max(1, poblacion // 10))
+        simulacion.iniciar_dia()
+        simulacion.avanzar_paso(min(10, pasos))
+        inicio = time.perf_counter()
+        for _ in range(pasos):
+            simulacion._procesar_ataques_depredadores()
+        operaciones = pasos
+    elif prueba == 'simular_dia':
+        simulacion = _crear_simulacion(lado, poblacion, pasos, comida_densa,
+                                       max(1, poblacion // 100))
+        inicio = time.perf_counter()
+        simulacion.simular_dia()
+        operaciones = pasos * poblacion
+    elif prueba == 'random_walk':
+        entorno = Entorno(ancho=lado, alto=lado, comida_densa=comida_densa, semilla=SEMILLA)
+        entorno.pos_inicial = (lado // 2, lado // 2)
+        caminante = RandomWalk(entorno)
+        operaciones = 1000 * pasos
+        inicio = time.perf_counter()
+        caminante.simular(operaciones, mostrar_progreso=False, mostrar_cada=operaciones + 1)
+    else:
+        raise ValueError(f"Prueba desconocida: {prueba!r}")
+    segundos = time.perf_counter() - inicio
+    return segundos, operaciones
+
+
+def ejecutar_caso(prueba, lado, poblacion, pasos, comida_densa=False, repeticiones=REPETICIONES):
+    """
+    Ejecuta una prueba del núcleo y mide su tiempo (sin contar la preparación).
+
+    Pruebas:
+        'realizar_paso': Particula.realizar_paso de toda la población, `pasos` veces
+        'generar_comida': Entorno._generar_comida, `pasos` veces
+        'ataques': Simulacion._procesar_ataques_depredadores con una población
+            ya dispersa y un depredador cada 10 partículas, `pasos` veces
+        'simular_dia': un día completo de `pasos` pasos, con un depredador
+            cada 100 partículas
+        'random_walk': RandomWalk.simular de 1000 * `pasos` pasos
+
+    Pensada para correr en un proceso propio (ver medir_nucleo), de modo que
+    la memoria pico sea la de este caso.
+
+    Args:
+        prueba (str): Nombre de la prueba (ver PRUEBAS)
+        lado (int): Lado del mapa cuadrado
+        poblacion (int): Partículas iniciales (None en las pruebas POR_MAPA)
+        pasos (int): Repeticiones o pasos por día de la prueba
+        comida_densa (bool): Si el entorno usa la rejilla densa de comida
+        repeticiones (int): Corridas (cada una con su preparación); se toma la más rápida
+
+    Returns:
+        dict: Parámetros del caso más 'segundos', 'operaciones', 'por_segundo'
+              y 'memoria_pico_mb'
+    """
+    segundos = None
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        for _ in range(repeticiones):
+            duracion, operaciones = _medir_una_vez(prueba, lado, poblacion, pasos, comida_densa)
+            if segundos is None or duracion < segundos:
+                segundos = duracion
+
+    return {
+        'prueba': prueba,
+        'lado': lado,
+        'poblacion': poblacion,
+        'pasos': pasos,
+        'comida_densa': comida_densa,
+        'segundos': segundos,
+        'operaciones': operaciones,
+        'por_segundo': operaciones / segundos if segundos > 0 else None,
+        'memoria_pico_mb': _memoria_pico_mb(),
+    }
+
+
+def casos_nucleo(escala, pruebas=PRUEBAS):
+    """
+    Lista los casos (prueba, lado, poblacion) de una escala.
+
+    Se omiten las poblaciones mayores que el número de celdas del mapa.
+
+    Args:
+        escala (str): Clave de ESCALAS
+        pruebas (tuple): Pruebas a incluir
+
+    Returns:
+        list: Tuplas (prueba, lado, poblacion)
+    """
+    lados = ESCALAS[escala]['lados']
+    poblaciones = ESCALAS[escala]['poblaciones']
+    casos = []
+    for prueba in pruebas:
+        for lado in lados:
+            if prueba in POR_MAPA:
+                casos.append((prueba, lado, None))
+                continue
+            for poblacion in poblaciones:
+                if poblacion <= lado * lado:
+                    casos.append((prueba, lado, poblacion))
+    return casos
+
+
+def medir_nucleo(escala='rapida', pasos=20, comida_densa=False, pruebas=PRUEBAS,
+                 repeticiones=REPETICIONES):
+    """
+    Ejecuta los casos de una escala, cada uno en un intérprete nuevo.
+
+    Args:
+        escala (str): Clave de ESCALAS
+        pasos (int): Repeticiones o pasos por día de cada prueba
+        comida_densa (bool): Si los entornos usan la rejilla densa de comida
+        pruebas (tuple): Pruebas a incluir
+        repeticiones (int): Corridas por caso; se toma la más rápida
+
+    Returns:
+        list: Resultados de ejecutar_caso, uno por caso
+    """
+    resultados = []
+    for prueba, lado, poblacion in casos_nucleo(escala, pruebas):
+        codigo = _CODIGO_CASO.format(prueba=prueba, lado=lado, poblacion=poblacion,
+                                     pasos=pasos, comida_densa=comida_densa,
+                                     repeticiones=repeticiones)
+        salida = subprocess.run([sys.executable, '-c', codigo], cwd=DIRECTORIO,
+                                capture_output=True, text=True, check=True).stdout
+        resultado = json.loads(salida.strip().splitlines()[-1])
+        _imprimir_resultado(resultado)
+        resultados.append(resultado)
+    return resultados
+
+
+def _clave(resultado):
+    return (resultado['prueba'], resultado['lado'], resultado['poblacion'],
+            resultado['pasos'], resultado['comida_densa'])
+
+
+def _imprimir_resultado(resultado, base=None):
+    poblacion = '-' if resultado['poblacion'] is None else resultado['poblacion']
+    memoria = resultado['memoria_pico_mb']
+    linea = (f"{resultado['prueba']:<15} {resultado['lado']:>5}x{resultado['lado']:<5} "
+             f"pob {poblacion:>7}  {resultado['segundos']:9.4f} s  "
+             f"{resultado['por_segundo']:14,.0f} op/s  "
+             f"{'-' if memoria is None else f'{memoria:8.1f}'} MB")
+    if base is not None:
+        linea += f"  ({resultado['por_segundo'] / base['por_segundo'] - 1:+.0%} vs base)"
+    print(linea, flush=True)
+
+
+def comparar_con_base(resultados, base, tolerancia):
+    """
+    Compara resultados con los de una base guardada.
+
+    Los casos que duran menos de MINIMO_SEGUNDOS no cuentan como regresión:
+    con menos tiempo, el ruido de la máquina supera la tolerancia.
+
+    Args:
+        resultados (list): Resultados de medir_nucleo
+        base (list): Resultados guardados con la misma forma
+        tolerancia (float): Caída relativa de op/s permitida (0.2 = 20%)
+
+    Returns:
+        list: Resultados que empeoraron más que la tolerancia
+    """
+    por_clave = {_clave(r): r for r in base}
+    regresiones = []
+    for resultado in resultados:
+        anterior = por_clave.get(_clave(resultado))
+        if anterior is None or not anterior['por_segundo'] or not resultado['por_segundo']:
+            continue
+        _imprimir_resultado(resultado, anterior)
+        if min(resultado['segundos'], anterior['segundos']) < MINIMO_SEGUNDOS:
+            continue
+        if resultado['por_segundo'] < anterior['por_segundo'] * (1 - tolerancia):
+            regresiones.append(resultado)
+    return regresiones
+
+
+def comando_nucleo(args):
+    """
+    Mide el núcleo a varias escalas y lo compara con la base guardada; si aún no
+    hay base, la crea con esta corrida.
+
+    Returns:
+        int: 0 si no hay regresiones, 1 si alguna prueba empeoró más que la tolerancia
+    """
+    pruebas = tuple(args.pruebas) if args.pruebas else PRUEBAS
+    print(f"Benchmarks del nucleo: escala {args.escala}, {args.pasos} pasos, "
+          f"semilla {SEMILLA}{', comida densa' if args.comida_densa else ''}")
+    resultados = medir_nucleo(args.escala, args.pasos, args.comida_densa, pruebas,
+                              args.repeticiones)
+
+    entorno_medicion = {
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+    }
+    if args.guardar_base or not os.path.exists(args.base):
+        # La primera corrida en una máquina crea la base contra la que se comparan las demás
+        contenido = dict(entorno_medicion, resultados=resultados)
+        with open(args.base, 'w', encoding='utf-8') as archivo:
+            json.dump(contenido, archivo, ensure_ascii=False, indent=1)
+        print(f"Base guardada en {args.base}")
+        return 0
+
+    with open(args.base, encoding='utf-8') as archivo:
+        contenido = json.load(archivo)
+    if any(contenido.get(clave) != valor for clave, valor in entorno_medicion.items()):
+        print(f"La base de {args.base} se midio con Python {contenido.get('python')} en "
+              f"{contenido.get('plataforma')}: no se compara (use --guardar-base para rehacerla)")
+        return 0
+    base = contenido['resultados']
+    print(f"\nComparacion con {args.base} (tolerancia {args.tolerancia:.0%}):")
+    regresiones = comparar_con_base(resultados, base, args.tolerancia)
+    if regresiones:
+        print(f"  ✗ {len(regresiones)} prueba(s) mas lentas que la base")
+        return 1
+    print("  ✓ Sin regresiones respecto de la base")
+    return 0
+
+
+def crear_parser():
+    """Crea el intérprete de opciones de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmarks de la simulacion de poblacion.")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    arranque = subcomandos.add_parser('arranque', help="Tiempo de importacion del nucleo")
+    arranque.add_argument('--presupuesto-ms', type=float, default=50.0,
+                          help="Tiempo maximo permitido en milisegundos (default: 50)")
+    arranque.add_argument('--repeticiones', type=int, default=5,
+                          help="Procesos a lanzar; se toma el mejor tiempo (default: 5)")
+    arranque.set_defaults(funcion=comando_arranque)
+
+    nucleo = subcomandos.add_parser('nucleo', help="Velocidad y memoria del nucleo a varias escalas")
+    nucleo.add_argument('--escala', choices=sorted(ESCALAS), default='rapida',
+                        help="rapida: mapas 40-400, hasta 1000 particulas; "
+                             "completa: mapas 40-4000, hasta 100000 (default: rapida)")
+    nucleo.add_argument('--pasos', type=int, default=20,
+                        help="Repeticiones o pasos por dia de cada prueba (default: 20)")
+    nucleo.add_argument('--pruebas', nargs='+', choices=PRUEBAS,
+                        help="Pruebas a ejecutar (default: todas)")
+    nucleo.add_argument('--repeticiones', type=int, default=REPETICIONES,
+                        help=f"Corridas por caso; se toma la mas rapida (default: {REPETICIONES})")
+    nucleo.add_argument('--comida-densa', action='store_true',
+                        help="Usar la rejilla densa de comida en los entornos")
+    nucleo.add_argument('--base', default=BASE_POR_DEFECTO,
+                        help="Archivo de resultados base (default: benchmarks_base.json); "
+                             "si no existe, esta corrida lo crea")
+    nucleo.add_argument('--guardar-base', action='store_true',
+                        help="Guardar estos resultados como base en lugar de comparar")
+    nucleo.add_argument('--tolerancia', type=float, default=0.25,
+                        help="Caida de op/s tolerada antes de marcar regresion (default: 0.25)")
+    nucleo.set_defaults(funcion=comando_nucleo)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de los benchmarks.
+
+    Args:
+        argv (list): Argumentos de la línea de comandos (por defecto sys.argv)
+
+    Returns:
+        int: Código de salida
+    """
+    args = crear_parser().parse_args(argv)
+    return args.funcion(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
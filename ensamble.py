@@ -0,0 +1,255 @@
+import contextlib
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from statistics import fmean, variance
+
+from aleatorio import GeneradorAleatorio
+from lote import PARAMETROS_POR_DEFECTO, crear_simulacion, validar_configuracion
+
+
+# Métricas de historial_dias que se agregan por defecto
+METRICAS_POR_DEFECTO = (
+    'particulas_finales', 'muertes', 'reproducciones', 'comida_consumida',
+    'normales', 'velocidad', 'prioridad', 'muertes_por_depredador'
+)
+
+
+def rejilla_parametros(**valores):
+    """
+    Genera todas las combinaciones de una rejilla de parámetros.
+
+    Ejemplo: rejilla_parametros(pasos_por_dia=[50, 80], frecuencia_depredadores=[1, 2])
+    produce cuatro configuraciones.
+
+    Args:
+        **valores: Para cada parámetro, la lista de valores a probar
+
+    Returns:
+        list: Lista de configuraciones (dict)
+    """
+    claves = list(valores)
+    return [dict(zip(claves, combinacion))
+            for combinacion in itertools.product(*(valores[c] for c in claves))]
+
+
+def _ejecutar_replica(indice_config, indice_replica, config, semilla, ruta):
+    """
+    Ejecuta una réplica en un proceso trabajador.
+
+    Args:
+        indice_config (int): Índice de la configuración
+        indice_replica (int): Índice de la réplica
+        config (dict): Configuración completa
+        semilla (int): Semilla raíz del ensamble
+        ruta (tuple): Ruta del flujo aleatorio de esta réplica
+
+    Returns:
+        tuple: (indice_config, indice_replica, historial_dias)
+    """
+    simulacion = crear_simulacion(config, rng=GeneradorAleatorio(semilla, ruta=ruta))
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        historial = simulacion.ejecutar_simulacion_completa(max_dias=config['max_dias'],
+                                                            mostrar_progreso=False)
+    return indice_config, indice_replica, list(historial)
+
+
+def ejecutar_ensamble(configuraciones, replicas, semilla=None, max_trabajadores=None):
+    """
+    Ejecuta réplicas de varias configuraciones en un grupo de procesos.
+
+    Cada réplica usa el flujo aleatorio (indice_config, indice_replica) de la
+    semilla raíz, así que el resultado de cada una no depende del número de
+    trabajadores ni del orden en que terminen. Los historiales se entregan a
+    medida que cada réplica termina.
+
+    Args:
+        configuraciones (list): Configuraciones (dict); lo que falte se toma de
+            lote.PARAMETROS_POR_DEFECTO
+        replicas (int): Réplicas por configuración
+        semilla (int): Semilla raíz. Si es None, se sortea una
+        max_trabajadores (int): Procesos a usar. Default: núcleos disponibles
+
+    Yields:
+        tuple: (indice_config, indice_replica, historial_dias)
+    """
+    completas = []
+    for config in configuraciones:
+        completa = dict(PARAMETROS_POR_DEFECTO)
+        completa.update(config)
+        error = validar_configuracion(completa)
+        if error:
+            raise ValueError(f"Configuracion invalida {config}: {error}")
+        completas.append(completa)
+
+    semilla = GeneradorAleatorio(semilla).semilla
+
+    with ProcessPoolExecutor(max_workers=max_trabajadores) as grupo:
+        futuros = [
+            grupo.submit(_ejecutar_replica, i, j, config, semilla, (i, j))
+            for i, config in enumerate(completas)
+            for j in range(replicas)
+        ]
+        for futuro in as_completed(futuros):
+            yield futuro.result()
+
+
+def _cuantil(ordenados, q):
+    """Cuantil q de una lista ordenada, con interpolación lineal."""
+    posicion = (len(ordenados) - 1) * q
+    abajo = int(posicion)
+    arriba = min(abajo + 1, len(ordenados) - 1)
+    return ordenados[abajo] + (ordenados[arriba] - ordenados[abajo]) * (posicion - abajo)
+
+
+class AgregadorEnsamble:
+    """
+    Acumula historiales de réplicas y calcula estadísticas por configuración.
+
+    Una réplica extinta deja de tener días en su historial; en la tabla cuenta
+    con valor 0 en los días siguientes (hasta el último día de la réplica más
+    larga), así que las medias y cuantiles son sobre todas las réplicas y no
+    solo sobre las que siguen vivas. Por eso las métricas deben ser conteos
+    de población o de eventos, que valen 0 sin partículas.
+
+    Attributes:
+        metricas (tuple): Métricas de historial_dias a agregar
+        cuantiles (tuple): Cuantiles a reportar (entre 0 y 1)
+        valores (dict): (config, dia, metrica) -> lista de valores
+        ultimo_dia (dict): config -> lista con el último día de cada réplica
+        extinciones (dict): config -> lista con el día de extinción de cada réplica (o None)
+    """
+
+    def __init__(self, metricas=METRICAS_POR_DEFECTO, cuantiles=(0.05, 0.5, 0.95)):
+        """
+        Inicializa el agregador.
+
+        Args:
+            metricas (tuple): Métricas de historial_dias a agregar
+            cuantiles (tuple): Cuantiles a reportar (entre 0 y 1)
+        """
+        self.metricas = tuple(metricas)
+        self.cuantiles = tuple(cuantiles)
+        self.valores = {}
+        self.ultimo_dia = {}
+        self.extinciones = {}
+
+    def agregar(self, indice_config, indice_replica, historial):
+        """
+        Incorpora el historial de una réplica.
+
+        Args:
+            indice_config (int): Índice de la configuración
+            indice_replica (int): Índice de la réplica (solo informativo)
+            historial (list): historial_dias de la réplica
+        """
+        for dia in historial:
+            for metrica in self.metricas:
+                self.valores.setdefault((indice_config, dia['dia'], metrica), []).append(dia[metrica])
+
+        ultimo = historial[-1]['dia'] if historial else 0
+        extinta = bool(historial) and historial[-1]['particulas_finales'] == 0
+        self.ultimo_dia.setdefault(indice_config, []).append(ultimo)
+        self.extinciones.setdefault(indice_config, []).append(ultimo if extinta else None)
+
+    def probabilidad_extincion(self, indice_config, hasta_dia=None):
+        """
+        Fracción de réplicas extintas, en total o hasta un día dado.
+
+        Args:
+            indice_config (int): Índice de la configuración
+            hasta_dia (int): Si se indica, solo cuenta extinciones hasta ese día
+
+        Returns:
+            float: Probabilidad estimada de extinción
+        """
+        dias = self.extinciones.get(indice_config, [])
+        if not dias:
+            return 0.0
+        extintas = sum(1 for d in dias if d is not None and (hasta_dia is None or d <= hasta_dia))
+        return extintas / len(dias)
+
+    def tabla(self):
+        """
+        Calcula la tabla de estadísticas por configuración, día y métrica.
+
+        Returns:
+            list: Filas (dict) con config, dia, metrica, n, media, varianza,
+                  un campo por cuantil (q5, q50, ...) y extincion acumulada.
+                  n incluye las réplicas ya extintas, que cuentan como 0
+        """
+        filas = []
+        for (indice_config, dia, metrica) in sorted(self.valores):
+            # Las réplicas extintas antes de este día aportan un 0
+            extintas = sum(1 for d in self.extinciones[indice_config] if d is not None and d < dia)
+            valores = self.valores[(indice_config, dia, metrica)] + [0] * extintas
+            ordenados = sorted(valores)
+            fila = {
+                'config': indice_config,
+                'dia': dia,
+                'metrica': metrica,
+                'n': len(valores),
+                'media': fmean(valores),
+                'varianza': variance(valores) if len(valores) > 1 else 0.0,
+            }
+            for q in self.cuantiles:
+                fila[f'q{round(q * 100):g}'] = _cuantil(ordenados, q)
+            fila['extincion'] = self.probabilidad_extincion(indice_config, hasta_dia=dia)
+            filas.append(fila)
+        return filas
+
+    def resumen(self):
+        """
+        Resumen por configuración.
+
+        Returns:
+            list: Filas (dict) con config, replicas, probabilidad de extinción y
+                  día medio de extinción (None si ninguna se extinguió)
+        """
+        filas = []
+        for indice_config in sorted(self.ultimo_dia):
+            dias_extincion = [d for d in self.extinciones[indice_config] if d is not None]
+            filas.append({
+                'config': indice_config,
+                'replicas': len(self.ultimo_dia[indice_config]),
+                'probabilidad_extincion': self.probabilidad_extincion(indice_config),
+                'dia_medio_extincion': fmean(dias_extincion) if dias_extincion else None,
+            })
+        return filas
+
+    def guardar_csv(self, ruta):
+        """
+        Escribe la tabla de estadísticas en un archivo CSV.
+
+        Args:
+            ruta (str): Archivo de salida
+        """
+        filas = self.tabla()
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=list(filas[0]) if filas else [])
+            escritor.writeheader()
+            escritor.writerows(filas)
+
+
+def ejecutar_y_agregar(configuraciones, replicas, semilla=None, max_trabajadores=None,
+                       metricas=METRICAS_POR_DEFECTO, cuantiles=(0.05, 0.5, 0.95)):
+    """
+    Ejecuta un ensamble completo y devuelve el agregador con los resultados.
+
+    Args:
+        configuraciones (list): Configuraciones (dict)
+        replicas (int): Réplicas por configuración
+        semilla (int): Semilla raíz
+        max_trabajadores (int): Procesos a usar
+        metricas (tuple): Métricas a agregar
+        cuantiles (tuple): Cuantiles a reportar
+
+    Returns:
+        AgregadorEnsamble: Agregador con todas las réplicas incorporadas
+    """
+    agregador = AgregadorEnsamble(metricas=metricas, cuantiles=cuantiles)
+    for indice_config, indice_replica, historial in ejecutar_ensamble(
+            configuraciones, replicas, semilla=semilla, max_trabajadores=max_trabajadores):
+        agregador.agregar(indice_config, indice_replica, historial)
+    return agregador
@@ -1,4 +1,6 @@
-import random
+from array import array
+
+from aleatorio import GeneradorAleatorio
 
 class Entorno:
     """
@@ -11,12 +13,22 @@ class Entorno:
         porcentaje_comida_max (float): Porcentaje máximo de comida
         porcentaje_comida_actual (float): Porcentaje actual de comida del día
         posiciones_comida (set): Conjunto de posiciones (x, y) con comida
+        comida_densa (bool): Si la comida se guarda en una rejilla de bytes en lugar de un conjunto
+        rng (GeneradorAleatorio): Generador aleatorio compartido por toda la simulación
         comida_total (int): Cantidad total de comida inicial
         comida_actual (int): Cantidad de comida restante
         particulas_en_posicion (dict): Diccionario de posiciones -> lista de partículas
+        ocupacion (dict): Índice de celda (x, y) -> partículas vivas fuera de la casa
+        depredadores_en_celda (dict): Índice de celda (x, y) -> depredadores en esa celda
+        registro_consumo (list): Posiciones consumidas desde la última extracción,
+            o None si el registro está desactivado
     """
     
-    def __init__(self, ancho=100, alto=100, porcentaje_comida_min=0.10, porcentaje_comida_max=0.25):
+    # Direcciones posibles, en el mismo orden que Particula.DIRECCIONES
+    DIRECCIONES = ((0, -1), (0, 1), (-1, 0), (1, 0))
+    
+    def __init__(self, ancho=100, alto=100, porcentaje_comida_min=0.10, porcentaje_comida_max=0.25,
+                 comida_densa=False, semilla=None, rng=None):
         """
         Inicializa el entorno con dimensiones y rango de comida variable.
         
@@ -25,16 +37,34 @@ class Entorno:
             alto (int): Alto del entorno. Default: 100
             porcentaje_comida_min (float): Porcentaje mínimo de comida. Default: 0.10
             porcentaje_comida_max (float): Porcentaje máximo de comida. Default: 0.25
+            comida_densa (bool): Si True, la comida se guarda en una rejilla de bytes
+                (un byte por celda, índice x * alto + y) con consultas sin asignar
+                memoria y operaciones en lote. Default: False
+            semilla (int): Semilla del generador aleatorio. Default: None (entropía del sistema)
+            rng (GeneradorAleatorio): Generador a usar en lugar de crear uno con la semilla
         """
         self.ancho = ancho
         self.alto = alto
         self.porcentaje_comida_min = porcentaje_comida_min
         self.porcentaje_comida_max = porcentaje_comida_max
         self.porcentaje_comida_actual = 0.0
-        self.posiciones_comida = set()
+        self.comida_densa = comida_densa
+        self.rng = rng if rng is not None else GeneradorAleatorio(semilla)
+        self._posiciones_comida = set()
+        self._rejilla_comida = bytearray(ancho * alto) if comida_densa else None
         self.comida_total = 0
         self.comida_actual = 0
         self.particulas_en_posicion = {}
+        self.ocupacion = {}
+        self.depredadores_en_celda = {}
+        self.registro_consumo = None
+        
+        # Tablas de movimientos válidos (ver movimientos_validos)
+        self._tabla_movimientos = self._construir_tabla_movimientos()
+        self._ejes_presa = (self._mascaras_eje(ancho, 0, ancho - 1),
+                            self._mascaras_eje(alto, 0, alto - 1))
+        self._ejes_depredador = (self._mascaras_eje(ancho, 1, ancho - 2),
+                                 self._mascaras_eje(alto, 1, alto - 2))
         
         self._generar_comida()
     
@@ -42,42 +72,164 @@ class Entorno:
         """
         Genera comida aleatoriamente SOLO en el área interna (no en los bordes).
         La cantidad varía entre porcentaje_comida_min y porcentaje_comida_max.
+        
+        Las posiciones se sortean directamente como índices lineales del área
+        interna, sin construir la lista de todas sus celdas, de modo que el
+        costo depende de la cantidad de comida y no del tamaño del mapa.
         """
         # Determinar porcentaje aleatorio para este día
-        self.porcentaje_comida_actual = random.uniform(self.porcentaje_comida_min, 
-                                                       self.porcentaje_comida_max)
+        self.porcentaje_comida_actual = self.rng.uniform(self.porcentaje_comida_min, 
+                                                         self.porcentaje_comida_max)
         
         # Generar solo en el área interna (excluyendo los bordes)
-        posiciones_internas = [
-            (x, y) 
-            for x in range(1, self.ancho - 1) 
-            for y in range(1, self.alto - 1)
-        ]
-        
-        total_celdas_internas = len(posiciones_internas)
+        alto_interno = max(self.alto - 2, 0)
+        total_celdas_internas = max(self.ancho - 2, 0) * alto_interno
         cantidad_comida = int(total_celdas_internas * self.porcentaje_comida_actual)
         
         # Asegurar que haya al menos algo de comida
         if cantidad_comida == 0 and total_celdas_internas > 0:
             cantidad_comida = 1
         
+        # La comida anterior desaparece por completo: sus consumos ya no aplican
+        if self.registro_consumo is not None:
+            self.registro_consumo = []
+        
         # Generar posiciones aleatorias únicas para la comida
-        if cantidad_comida > 0 and len(posiciones_internas) > 0:
-            posiciones_seleccionadas = random.sample(posiciones_internas, 
-                                                    min(cantidad_comida, len(posiciones_internas)))
-            self.posiciones_comida = set(posiciones_seleccionadas)
+        indices = self._muestrear_indices(total_celdas_internas,
+                                          min(cantidad_comida, total_celdas_internas))
+        
+        if self.comida_densa:
+            self._rejilla_comida = bytearray(self.ancho * self.alto)
+            for i in indices:
+                x, y = divmod(i, alto_interno)
+                self._rejilla_comida[(x + 1) * self.alto + y + 1] = 1
         else:
-            self.posiciones_comida = set()
+            self._posiciones_comida = {
+                (1 + i // alto_interno, 1 + i % alto_interno) for i in indices
+            }
         
-        self.comida_total = len(self.posiciones_comida)
+        self.comida_total = len(indices)
         self.comida_actual = self.comida_total
     
+    def _muestrear_indices(self, total, cantidad):
+        """
+        Elige cantidad índices distintos en range(total) con el algoritmo de Floyd.
+        
+        Hace exactamente un sorteo por índice elegido y nunca materializa el rango.
+        
+        Args:
+            total (int): Tamaño del rango
+            cantidad (int): Cuántos índices elegir (cantidad <= total)
+            
+        Returns:
+            set: Índices elegidos
+        """
+        elegidos = set()
+        for j in range(total - cantidad, total):
+            t = self.rng.randrange(j + 1)
+            elegidos.add(j if t in elegidos else t)
+        return elegidos
+    
+    @property
+    def posiciones_comida(self):
+        """
+        Conjunto de posiciones (x, y) con comida.
+        
+        Con la rejilla densa el conjunto se construye en cada llamada; para
+        dibujar conviene usar obtener_coordenadas_comida.
+        """
+        if self.comida_densa:
+            return {divmod(i, self.alto) for i, hay in enumerate(self._rejilla_comida) if hay}
+        return self._posiciones_comida
+    
     def reestablecer_comida(self):
         """
         Reestablece la comida con una cantidad aleatoria dentro del rango establecido.
         """
         self._generar_comida()
     
+    def usar_generador(self, rng):
+        """
+        Reemplaza el generador aleatorio y vuelve a sortear la comida del día
+        con él, para que toda la ejecución dependa de una sola semilla.
+        
+        Args:
+            rng (GeneradorAleatorio): El nuevo generador
+        """
+        self.rng = rng
+        self._generar_comida()
+    
+    def usar_comida_densa(self):
+        """
+        Pasa la comida a la rejilla de bytes, conservando la comida actual.
+        
+        Las comidas siguientes se sortean igual con las dos representaciones,
+        así que el cambio no altera la ejecución.
+        """
+        if self.comida_densa:
+            return
+        alto = self.alto
+        self._rejilla_comida = bytearray(self.ancho * alto)
+        for x, y in self._posiciones_comida:
+            self._rejilla_comida[x * alto + y] = 1
+        self._posiciones_comida = set()
+        self.comida_densa = True
+    
+    def exportar_estado(self):
+        """
+        Estado del entorno para un punto de control.
+        
+        La comida se guarda como la rejilla de bytes (comida densa) o como un
+        array de índices lineales x * alto + y. El generador se guarda completo,
+        con su estado interno, para que la ejecución siga igual al restaurar.
+        
+        Returns:
+            dict: Estado serializable del entorno
+        """
+        estado = {
+            'ancho': self.ancho,
+            'alto': self.alto,
+            'porcentaje_comida_min': self.porcentaje_comida_min,
+            'porcentaje_comida_max': self.porcentaje_comida_max,
+            'porcentaje_comida_actual': self.porcentaje_comida_actual,
+            'comida_densa': self.comida_densa,
+            'comida_total': self.comida_total,
+            'comida_actual': self.comida_actual,
+            'rng': self.rng,
+        }
+        if self.comida_densa:
+            estado['comida'] = bytes(self._rejilla_comida)
+        else:
+            alto = self.alto
+            estado['comida'] = array('q', [x * alto + y for x, y in self._posiciones_comida])
+        return estado
+    
+    @classmethod
+    def desde_estado(cls, estado):
+        """
+        Reconstruye un entorno a partir de exportar_estado().
+        
+        Args:
+            estado (dict): Estado guardado
+            
+        Returns:
+            Entorno: El entorno restaurado
+        """
+        # La comida que sortea el constructor se descarta enseguida
+        entorno = cls(estado['ancho'], estado['alto'],
+                      estado['porcentaje_comida_min'], estado['porcentaje_comida_max'],
+                      comida_densa=estado['comida_densa'], rng=GeneradorAleatorio(0))
+        entorno.rng = estado['rng']
+        entorno.porcentaje_comida_actual = estado['porcentaje_comida_actual']
+        entorno.comida_total = estado['comida_total']
+        entorno.comida_actual = estado['comida_actual']
+        if entorno.comida_densa:
+            entorno._rejilla_comida = bytearray(estado['comida'])
+        else:
+            alto = entorno.alto
+            entorno._posiciones_comida = {divmod(i, alto) for i in estado['comida']}
+        return entorno
+    
     def obtener_info_comida(self):
         """
         Obtiene información sobre la comida del día actual.
@@ -135,6 +287,67 @@ class Entorno:
         return (x == 0 or x == self.ancho - 1 or 
                 y == 0 or y == self.alto - 1)
     
+    @staticmethod
+    def _mascaras_eje(tamano, minimo, maximo):
+        """
+        Clasifica cada coordenada de un eje según qué vecinos son transitables.
+        
+        La máscara de la coordenada v tiene el bit 0 si v-1 está en [minimo, maximo],
+        el bit 1 si v lo está y el bit 2 si v+1 lo está.
+        
+        Args:
+            tamano (int): Número de coordenadas del eje
+            minimo (int): Menor coordenada transitable
+            maximo (int): Mayor coordenada transitable
+            
+        Returns:
+            list: Máscara (0-7) de cada coordenada
+        """
+        return [(minimo <= v - 1 <= maximo)
+                | (minimo <= v <= maximo) << 1
+                | (minimo <= v + 1 <= maximo) << 2
+                for v in range(tamano)]
+    
+    @classmethod
+    def _construir_tabla_movimientos(cls):
+        """
+        Precalcula las direcciones válidas para cada par de máscaras de eje.
+        
+        Una dirección (dx, dy) es válida si el destino es transitable en ambos
+        ejes, es decir, si la máscara X tiene el bit dx+1 y la máscara Y el bit dy+1.
+        
+        Returns:
+            tuple: tabla[mascara_x][mascara_y] -> tupla de direcciones válidas
+        """
+        return tuple(
+            tuple(
+                tuple((dx, dy) for dx, dy in cls.DIRECCIONES
+                      if mascara_x >> (dx + 1) & 1 and mascara_y >> (dy + 1) & 1)
+                for mascara_y in range(8)
+            )
+            for mascara_x in range(8)
+        )
+    
+    def movimientos_validos(self, x, y, es_depredador=False):
+        """
+        Direcciones en las que se puede mover algo que está en (x, y).
+        
+        Las presas pueden ir a cualquier celda del mapa; los depredadores
+        además no pueden entrar a la casa. La respuesta sale de tablas
+        precalculadas por eje, así que un paso se sortea con una sola
+        elección entre las direcciones válidas, sin reintentos en los bordes.
+        
+        Args:
+            x (int): Coordenada X
+            y (int): Coordenada Y
+            es_depredador (bool): Si se aplican las restricciones de los depredadores
+            
+        Returns:
+            tuple: Direcciones (dx, dy) válidas, en el orden de DIRECCIONES
+        """
+        ejes_x, ejes_y = self._ejes_depredador if es_depredador else self._ejes_presa
+        return self._tabla_movimientos[ejes_x[x]][ejes_y[y]]
+    
     def hay_comida(self, x, y):
         """
         Verifica si hay comida en una posición específica.
@@ -146,7 +359,9 @@ class Entorno:
         Returns:
             bool: True si hay comida en esa posición
         """
-        return (x, y) in self.posiciones_comida
+        if self.comida_densa:
+            return self._rejilla_comida[x * self.alto + y] == 1
+        return (x, y) in self._posiciones_comida
     
     def consumir_comida(self, x, y, particula):
         """
@@ -160,40 +375,125 @@ class Entorno:
         Returns:
             bool: True si se consumió comida, False si no había comida o perdió por prioridad
         """
-        if (x, y) not in self.posiciones_comida:
+        if not self.hay_comida(x, y):
             return False
         
-        # Registrar que esta partícula está en esta posición
-        pos_key = (x, y)
-        if pos_key not in self.particulas_en_posicion:
-            self.particulas_en_posicion[pos_key] = []
-        
-        # Verificar si ya hay partículas con prioridad en esta posición
-        particulas_aqui = self.particulas_en_posicion[pos_key]
-        
-        # Si la partícula actual tiene prioridad
-        if particula.mutacion == 'prioridad':
-            # Consume la comida sin importar quién más esté
-            self.posiciones_comida.remove((x, y))
-            self.comida_actual -= 1
+        # Si no tiene prioridad, verificar si hay alguien con prioridad registrado aquí
+        if self.particulas_en_posicion:
+            pos_key = (x, y)
+            if not particula.reglas.prioridad_comida:
+                for p in self.particulas_en_posicion.get(pos_key, ()):
+                    if p.reglas.prioridad_comida:
+                        # Hay una partícula con prioridad, esta no come
+                        return False
             # Limpiar registro de esta posición
-            if pos_key in self.particulas_en_posicion:
-                del self.particulas_en_posicion[pos_key]
-            return True
+            self.particulas_en_posicion.pop(pos_key, None)
+        
+        if self.comida_densa:
+            self._rejilla_comida[x * self.alto + y] = 0
         else:
-            # Si no tiene prioridad, verificar si hay alguien con prioridad
-            for p in particulas_aqui:
-                if p.mutacion == 'prioridad':
-                    # Hay una partícula con prioridad, esta no come
-                    return False
+            self._posiciones_comida.remove((x, y))
+        self.comida_actual -= 1
+        if self.registro_consumo is not None:
+            self.registro_consumo.append((x, y))
+        return True
+    
+    def rejilla_comida(self):
+        """
+        Vista NumPy de la rejilla de comida, sin copiar (solo con comida_densa).
+        
+        Returns:
+            ndarray: Arreglo uint8 de forma (ancho, alto); 1 indica comida
+        """
+        import numpy as np
+        
+        if not self.comida_densa:
+            raise ValueError("La rejilla de comida solo existe con comida_densa=True")
+        return np.frombuffer(self._rejilla_comida, dtype=np.uint8).reshape(self.ancho, self.alto)
+    
+    def hay_comida_lote(self, indices):
+        """
+        Verifica en lote si hay comida en varias celdas.
+        
+        Args:
+            indices (ndarray): Índices lineales x * alto + y
             
-            # No hay partículas con prioridad, puede comer
-            self.posiciones_comida.remove((x, y))
-            self.comida_actual -= 1
-            # Limpiar registro de esta posición
-            if pos_key in self.particulas_en_posicion:
-                del self.particulas_en_posicion[pos_key]
-            return True
+        Returns:
+            ndarray: Máscara booleana, True donde hay comida
+        """
+        import numpy as np
+        
+        if self.comida_densa:
+            return self.rejilla_comida().ravel()[indices] != 0
+        return np.fromiter((divmod(i, self.alto) in self._posiciones_comida for i in indices.tolist()),
+                           dtype=bool, count=len(indices))
+    
+    def consumir_comida_lote(self, indices):
+        """
+        Consume la comida de varias celdas a la vez (para motores en lote).
+        
+        La resolución de conflictos y prioridad queda a cargo de quien llama:
+        los índices no deben repetirse.
+        
+        Args:
+            indices (ndarray): Índices lineales x * alto + y sin repetir
+            
+        Returns:
+            int: Cantidad de unidades de comida consumidas
+        """
+        if self.comida_densa:
+            rejilla = self.rejilla_comida().ravel()
+            consumidas = int(rejilla[indices].sum())
+            if self.registro_consumo is not None:
+                self.registro_consumo.extend(
+                    divmod(i, self.alto) for i in indices[rejilla[indices] != 0].tolist())
+            rejilla[indices] = 0
+        else:
+            consumidas = 0
+            for i in indices.tolist():
+                pos = divmod(i, self.alto)
+                if pos in self._posiciones_comida:
+                    self._posiciones_comida.remove(pos)
+                    consumidas += 1
+                    if self.registro_consumo is not None:
+                        self.registro_consumo.append(pos)
+        self.comida_actual -= consumidas
+        return consumidas
+    
+    def activar_registro_consumo(self):
+        """
+        Empieza a registrar las posiciones donde se consume comida, para que
+        quien dibuja pueda aplicar solo los cambios en lugar de toda la comida.
+        """
+        self.registro_consumo = []
+    
+    def extraer_registro_consumo(self):
+        """
+        Devuelve las posiciones consumidas desde la última llamada y vacía el registro.
+        
+        Returns:
+            list: Posiciones (x, y) consumidas (vacía si el registro está desactivado)
+        """
+        if self.registro_consumo is None:
+            return []
+        consumidas = self.registro_consumo
+        self.registro_consumo = []
+        return consumidas
+    
+    def obtener_coordenadas_comida(self):
+        """
+        Obtiene las coordenadas de toda la comida para dibujarla.
+        
+        Returns:
+            ndarray: Arreglo (n, 2) con las posiciones (x, y) con comida
+        """
+        import numpy as np
+        
+        if self.comida_densa:
+            return np.argwhere(self.rejilla_comida())
+        if not self._posiciones_comida:
+            return np.empty((0, 2), dtype=np.int64)
+        return np.array(list(self._posiciones_comida), dtype=np.int64)
     
     def registrar_particula_en_posicion(self, x, y, particula):
         """
@@ -216,6 +516,116 @@ class Entorno:
         """
         self.particulas_en_posicion = {}
     
+    def mover_ocupante(self, particula, pos_anterior, pos_nueva):
+        """
+        Actualiza el índice de ocupación cuando una partícula se mueve.
+        
+        Solo se indexan las celdas fuera de la casa, que son las únicas donde
+        los depredadores pueden atacar.
+        
+        Args:
+            particula (Particula): La partícula que se movió
+            pos_anterior (tuple): Posición (x, y) de la que sale
+            pos_nueva (tuple): Posición (x, y) a la que llega
+        """
+        if not self.es_casa(pos_anterior[0], pos_anterior[1]):
+            ocupantes = self.ocupacion.get(pos_anterior)
+            if ocupantes and particula in ocupantes:
+                ocupantes.remove(particula)
+                if not ocupantes:
+                    del self.ocupacion[pos_anterior]
+        if not self.es_casa(pos_nueva[0], pos_nueva[1]):
+            self.ocupacion.setdefault(pos_nueva, []).append(particula)
+    
+    def retirar_ocupante(self, particula):
+        """
+        Quita una partícula del índice de ocupación (por ejemplo, al morir).
+        
+        Args:
+            particula (Particula): La partícula a retirar
+        """
+        pos = particula.posicion_actual
+        ocupantes = self.ocupacion.get(pos)
+        if ocupantes and particula in ocupantes:
+            ocupantes.remove(particula)
+            if not ocupantes:
+                del self.ocupacion[pos]
+    
+    def ocupantes_en(self, x, y):
+        """
+        Obtiene las partículas indexadas en una celda.
+        
+        Args:
+            x (int): Coordenada X
+            y (int): Coordenada Y
+            
+        Returns:
+            list: Partículas vivas en esa celda (vacía si no hay ninguna)
+        """
+        return self.ocupacion.get((x, y), [])
+    
+    def limpiar_ocupacion(self):
+        """
+        Vacía el índice de ocupación (al terminar el día todas vuelven a casa).
+        """
+        self.ocupacion = {}
+    
+    def registrar_depredador(self, depredador):
+        """
+        Agrega un depredador recién creado al índice de depredadores.
+        
+        Args:
+            depredador (Particula): El depredador a registrar
+        """
+        self.depredadores_en_celda.setdefault(depredador.posicion_actual, []).append(depredador)
+    
+    def mover_depredador(self, depredador, pos_anterior, pos_nueva):
+        """
+        Actualiza el índice de depredadores cuando uno se mueve.
+        
+        Args:
+            depredador (Particula): El depredador que se movió
+            pos_anterior (tuple): Posición (x, y) de la que sale
+            pos_nueva (tuple): Posición (x, y) a la que llega
+        """
+        depredadores = self.depredadores_en_celda.get(pos_anterior)
+        if depredadores and depredador in depredadores:
+            depredadores.remove(depredador)
+            if not depredadores:
+                del self.depredadores_en_celda[pos_anterior]
+        self.depredadores_en_celda.setdefault(pos_nueva, []).append(depredador)
+    
+    def depredador_adyacente(self, x, y):
+        """
+        Busca un depredador a exactamente un paso de una posición.
+        
+        Si hay varios, devuelve el de menor ID, que es el primero en la lista
+        de depredadores de la simulación.
+        
+        Args:
+            x (int): Coordenada X
+            y (int): Coordenada Y
+            
+        Returns:
+            tuple: Posición del depredador encontrado o None
+        """
+        if not self.depredadores_en_celda:
+            return None
+        
+        encontrado = None
+        for celda in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            for depredador in self.depredadores_en_celda.get(celda, ()):
+                if encontrado is None or depredador.id < encontrado.id:
+                    encontrado = depredador
+        
+        return encontrado.posicion_actual if encontrado is not None else None
+    
+    def limpiar_depredadores(self):
+        """
+        Vacía el índice de depredadores (desaparecen al terminar el día).
+        """
+        self.depredadores_en_celda = {}
+    
     def obtener_dimensiones(self):
         """
         Retorna las dimensiones del entorno.
@@ -239,18 +649,18 @@ class Entorno:
         """
         if es_depredador:
             # Depredadores aparecen dentro del área interna
-            x = random.randint(1, self.ancho - 2)
-            y = random.randint(1, self.alto - 2)
+            x = self.rng.randint(1, self.ancho - 2)
+            y = self.rng.randint(1, self.alto - 2)
             return (x, y)
         else:
             # Partículas normales aparecen en los bordes
-            borde = random.choice(['arriba', 'abajo', 'izquierda', 'derecha'])
+            borde = self.rng.choice(['arriba', 'abajo', 'izquierda', 'derecha'])
             
             if borde == 'arriba':
-                return (random.randint(0, self.ancho - 1), 0)
+                return (self.rng.randint(0, self.ancho - 1), 0)
             elif borde == 'abajo':
-                return (random.randint(0, self.ancho - 1), self.alto - 1)
+                return (self.rng.randint(0, self.ancho - 1), self.alto - 1)
             elif borde == 'izquierda':
-                return (0, random.randint(0, self.alto - 1))
+                return (0, self.rng.randint(0, self.alto - 1))
             else:  # derecha
-                return (self.ancho - 1, random.randint(0, self.alto - 1))
\ No newline at end of file
+                return (self.ancho - 1, self.rng.randint(0, self.alto - 1))
\ No newline at end of file
@@ -0,0 +1,397 @@
+import json
+import os
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from particula import REGLAS_MUTACION, Particula
+
+
+FORMATO = 'simulacion-poblacion/grabacion'
+VERSION = 1
+
+# Código de tipo de los depredadores; las partículas usan su código de mutación
+TIPO_DEPREDADOR = len(REGLAS_MUTACION)
+TIPO_VACIO = -1
+
+# Color de cada tipo, indexado por el código de tipo
+COLORES_TIPO = tuple(r.color for r in REGLAS_MUTACION) + (Particula.COLOR_DEPREDADOR,)
+
+
+class GrabadorTrayectorias:
+    """
+    Graba cada paso de una simulación en archivos mapeados en memoria.
+
+    Las posiciones y los indicadores de vida se escriben en arreglos .npy
+    reservados de antemano con forma [días, pasos + 1, entidades] (el paso 0
+    es la posición de partida), de modo que la memoria usada no depende del
+    largo de la ejecución. Cada entidad (partícula o depredador) ocupa una
+    columna durante un día; qué id y tipo tiene cada columna se guarda por
+    día, y los nacimientos y muertes van a un índice aparte (indice.json):
+    por cada día, las muertes por depredador con su paso, las muertes al
+    cerrar el día y los hijos nacidos al cerrarlo.
+    Opcionalmente también se graba la comida de cada paso como bits.
+
+    Attributes:
+        directorio (str): Carpeta de la grabación
+        max_dias (int): Días que caben en la grabación
+        pasos_por_dia (int): Pasos de cada día
+        max_entidades (int): Columnas por día; las entidades que no entran no se graban
+        posiciones (numpy.memmap): [día, paso, entidad, (x, y)]
+        vivas (numpy.memmap): [día, paso, entidad]
+        ids (numpy.memmap): [día, entidad], -1 en columnas vacías
+        tipos (numpy.memmap): [día, entidad], TIPO_VACIO en columnas vacías
+        comida (numpy.memmap): [día, paso, bytes] con la rejilla de comida en bits, o None
+        indice (dict): Metadatos y eventos de cada día grabado
+    """
+
+    def __init__(self, directorio, max_dias, pasos_por_dia, max_entidades, ancho, alto,
+                 con_comida=True):
+        """
+        Crea la grabación vacía, reservando sus archivos.
+
+        Args:
+            directorio (str): Carpeta de la grabación (se crea si no existe)
+            max_dias (int): Días que caben en la grabación
+            pasos_por_dia (int): Pasos de cada día
+            max_entidades (int): Máximo de partículas más depredadores por día
+            ancho (int): Ancho del entorno
+            alto (int): Alto del entorno
+            con_comida (bool): Si se graba la comida de cada paso
+
+        Raises:
+            ValueError: Si la carpeta ya tiene una grabación (no se sobrescribe)
+        """
+        os.makedirs(directorio, exist_ok=True)
+        if os.path.exists(os.path.join(directorio, 'indice.json')):
+            raise ValueError(f"{directorio} ya tiene una grabacion: use otra carpeta "
+                             f"(o borre la anterior) para no sobrescribirla")
+        self.directorio = directorio
+        self.max_dias = max_dias
+        self.pasos_por_dia = pasos_por_dia
+        self.max_entidades = max_entidades
+        self.ancho = ancho
+        self.alto = alto
+
+        pasos = pasos_por_dia + 1
+        self.posiciones = self._crear('posiciones', (max_dias, pasos, max_entidades, 2), np.int16)
+        self.vivas = self._crear('vivas', (max_dias, pasos, max_entidades), bool)
+        self.ids = self._crear('ids', (max_dias, max_entidades), np.int64)
+        self.tipos = self._crear('tipos', (max_dias, max_entidades), np.int8)
+        self.ids[:] = -1
+        self.tipos[:] = TIPO_VACIO
+        self.comida = None
+        if con_comida:
+            bytes_rejilla = (ancho * alto + 7) // 8
+            self.comida = self._crear('comida', (max_dias, pasos, bytes_rejilla), np.uint8)
+
+        self.indice = {
+            'formato': FORMATO,
+            'version': VERSION,
+            'pasos_por_dia': pasos_por_dia,
+            'max_entidades': max_entidades,
+            'ancho': ancho,
+            'alto': alto,
+            'con_comida': con_comida,
+            'dias': [],
+        }
+        self._dia = None
+        self._particulas = set()
+        self._n = 0
+        self._vivas_anteriores = None
+        self._guardar_indice()
+
+    @staticmethod
+    def tamano_reservado(max_dias, pasos_por_dia, max_entidades, ancho, alto, con_comida=True):
+        """
+        Bytes que reservan los archivos de una grabación con estas dimensiones.
+
+        Args:
+            max_dias (int): Días que caben en la grabación
+            pasos_por_dia (int): Pasos de cada día
+            max_entidades (int): Máximo de partículas más depredadores por día
+            ancho (int): Ancho del entorno
+            alto (int): Alto del entorno
+            con_comida (bool): Si se graba la comida de cada paso
+
+        Returns:
+            int: Tamaño total en bytes
+        """
+        pasos = pasos_por_dia + 1
+        # posiciones (2 x int16) y vivas (bool) por paso; ids (int64) y tipos (int8) por día
+        por_entidad = pasos * (2 * 2 + 1) + 8 + 1
+        tamano = max_dias * max_entidades * por_entidad
+        if con_comida:
+            tamano += max_dias * pasos * ((ancho * alto + 7) // 8)
+        return tamano
+
+    @classmethod
+    def para_simulacion(cls, directorio, simulacion, max_dias, max_entidades, con_comida=True):
+        """
+        Crea una grabación con las dimensiones de una simulación.
+
+        Args:
+            directorio (str): Carpeta de la grabación
+            simulacion (Simulacion): Simulación (o SimulacionVectorizada) a grabar
+            max_dias (int): Días que caben en la grabación
+            max_entidades (int): Máximo de partículas más depredadores por día
+            con_comida (bool): Si se graba la comida de cada paso
+
+        Returns:
+            GrabadorTrayectorias: El grabador
+        """
+        entorno = simulacion.entorno
+        return cls(directorio, max_dias, simulacion.pasos_por_dia, max_entidades,
+                   entorno.ancho, entorno.alto, con_comida=con_comida)
+
+    def _crear(self, nombre, forma, dtype):
+        """Reserva un arreglo .npy mapeado en memoria."""
+        ruta = os.path.join(self.directorio, f"{nombre}.npy")
+        return open_memmap(ruta, mode='w+', dtype=dtype, shape=forma)
+
+    def _guardar_indice(self):
+        """Reemplaza indice.json de forma atómica."""
+        ruta = os.path.join(self.directorio, 'indice.json')
+        temporal = f"{ruta}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump(self.indice, archivo)
+        os.replace(temporal, ruta)
+
+    @property
+    def dias_grabados(self):
+        """Cuántos días tiene ya la grabación."""
+        return len(self.indice['dias'])
+
+    def iniciar_dia(self, simulacion):
+        """
+        Asigna las columnas del día y graba el paso 0.
+
+        Debe llamarse después de simulacion.iniciar_dia(), cuando ya
+        aparecieron los depredadores.
+
+        Args:
+            simulacion (Simulacion): La simulación grabada
+
+        Raises:
+            ValueError: Si la grabación ya está llena
+        """
+        if self.dias_grabados >= self.max_dias:
+            raise ValueError(f"La grabacion solo tiene lugar para {self.max_dias} dias")
+
+        d = self.dias_grabados
+        estado = simulacion.obtener_posiciones()
+        total = len(estado['id'])
+        n = min(total, self.max_entidades)
+        tipos = np.where(estado['depredador'], TIPO_DEPREDADOR, estado['mutacion'])
+        self.ids[d, :n] = estado['id'][:n]
+        self.tipos[d, :n] = tipos[:n]
+
+        self._dia = {
+            'dia': simulacion.dia_actual,
+            'entidades': n,
+            'sin_grabar': total - n,
+            'muertes': [],
+            'muertes_fin_dia': [],
+            'nacimientos': [],
+        }
+        self._particulas = set(estado['id'][~estado['depredador']].tolist())
+        self._n = n
+        self._vivas_anteriores = None
+        self.indice['dias'].append(self._dia)
+        self.grabar_paso(simulacion, estado)
+
+    def grabar_paso(self, simulacion, estado=None):
+        """
+        Graba las posiciones, vidas y comida del paso actual.
+
+        Args:
+            simulacion (Simulacion): La simulación grabada
+            estado (dict): Resultado de obtener_posiciones(), si ya se tiene
+        """
+        if estado is None:
+            estado = simulacion.obtener_posiciones()
+        d = self.dias_grabados - 1
+        paso = simulacion.paso_actual
+        n = self._n
+
+        self.posiciones[d, paso, :n, 0] = estado['x'][:n]
+        self.posiciones[d, paso, :n, 1] = estado['y'][:n]
+        vivas = estado['viva'][:n]
+        self.vivas[d, paso, :n] = vivas
+
+        if self._vivas_anteriores is not None:
+            for columna in np.flatnonzero(self._vivas_anteriores & ~vivas).tolist():
+                self._dia['muertes'].append([int(self.ids[d, columna]), paso])
+        self._vivas_anteriores = vivas.copy()
+
+        if self.comida is not None:
+            self.comida[d, paso] = np.packbits(self._rejilla_comida(simulacion.entorno))
+
+    def _rejilla_comida(self, entorno):
+        """Máscara booleana plana (x * alto + y) de las celdas con comida."""
+        if entorno.comida_densa:
+            return entorno.rejilla_comida().ravel() != 0
+        mascara = np.zeros(self.ancho * self.alto, dtype=bool)
+        coordenadas = entorno.obtener_coordenadas_comida()
+        if len(coordenadas):
+            mascara[coordenadas[:, 0] * self.alto + coordenadas[:, 1]] = True
+        return mascara
+
+    def cerrar_dia(self, simulacion):
+        """
+        Anota las muertes y nacimientos del cierre del día y lo escribe a disco.
+
+        Debe llamarse después de simulacion.cerrar_dia().
+
+        Args:
+            simulacion (Simulacion): La simulación grabada
+        """
+        estado = simulacion.obtener_posiciones()
+        siguientes = set(estado['id'][~estado['depredador']].tolist())
+        por_depredador = {id for id, _ in self._dia['muertes']}
+        self._dia['muertes_fin_dia'] = sorted(self._particulas - por_depredador - siguientes)
+        self._dia['nacimientos'] = sorted(siguientes - self._particulas)
+
+        for arreglo in (self.posiciones, self.vivas, self.ids, self.tipos, self.comida):
+            if arreglo is not None:
+                arreglo.flush()
+        self._guardar_indice()
+
+    def simular_dia(self, simulacion, mostrar_progreso=False):
+        """
+        Simula un día completo paso a paso, grabándolo.
+
+        Args:
+            simulacion (Simulacion): La simulación a avanzar
+            mostrar_progreso (bool): Si True, muestra información del progreso
+
+        Returns:
+            dict: Estadísticas del día
+        """
+        if not simulacion.dia_en_curso:
+            simulacion.iniciar_dia(mostrar_progreso)
+        self.iniciar_dia(simulacion)
+        while not simulacion.dia_terminado:
+            simulacion.avanzar_paso(1, mostrar_progreso)
+            self.grabar_paso(simulacion)
+        estadisticas = simulacion.cerrar_dia(mostrar_progreso)
+        self.cerrar_dia(simulacion)
+        return estadisticas
+
+
+class Grabacion:
+    """
+    Lectura de una grabación hecha con GrabadorTrayectorias.
+
+    Los arreglos se abren mapeados en memoria y de solo lectura: ir a
+    cualquier día y paso solo lee esa parte de los archivos.
+
+    Attributes:
+        directorio (str): Carpeta de la grabación
+        indice (dict): Metadatos y eventos de cada día grabado
+        posiciones, vivas, ids, tipos, comida (numpy.memmap): Ver GrabadorTrayectorias
+    """
+
+    def __init__(self, directorio):
+        """
+        Abre una grabación.
+
+        Args:
+            directorio (str): Carpeta de la grabación
+
+        Raises:
+            ValueError: Si la carpeta no tiene una grabación de esta versión
+        """
+        with open(os.path.join(directorio, 'indice.json'), encoding='utf-8') as archivo:
+            self.indice = json.load(archivo)
+        if self.indice.get('formato') != FORMATO or self.indice.get('version') != VERSION:
+            raise ValueError(f"{directorio} no es una grabacion de la simulacion")
+        self.directorio = directorio
+
+        def abrir(nombre):
+            return np.load(os.path.join(directorio, f"{nombre}.npy"), mmap_mode='r')
+
+        self.posiciones = abrir('posiciones')
+        self.vivas = abrir('vivas')
+        self.ids = abrir('ids')
+        self.tipos = abrir('tipos')
+        self.comida = abrir('comida') if self.indice['con_comida'] else None
+
+    @property
+    def num_dias(self):
+        """Días grabados."""
+        return len(self.indice['dias'])
+
+    @property
+    def pasos_por_dia(self):
+        return self.indice['pasos_por_dia']
+
+    def numero_dia(self, d):
+        """Número de día de la simulación del d-ésimo día grabado."""
+        return self.indice['dias'][d]['dia']
+
+    def validar_posicion(self, d, paso):
+        """
+        Verifica que un día y un paso existan en la grabación.
+
+        Args:
+            d (int): Índice del día en la grabación
+            paso (int): Paso del día
+
+        Raises:
+            ValueError: Si el día o el paso están fuera de rango
+        """
+        if not 0 <= d < self.num_dias:
+            raise ValueError(f"Dia {d} fuera de rango: la grabacion tiene {self.num_dias} "
+                             f"dia(s), de 0 a {self.num_dias - 1}")
+        if not 0 <= paso <= self.pasos_por_dia:
+            raise ValueError(f"Paso {paso} fuera de rango: debe estar entre 0 y "
+                             f"{self.pasos_por_dia}")
+
+    def fotograma(self, d, paso):
+        """
+        Estado de un paso de un día grabado.
+
+        Args:
+            d (int): Índice del día en la grabación (0 = primer día grabado)
+            paso (int): Paso del día (0 = posiciones de partida)
+
+        Returns:
+            dict: 'posiciones' (n, 2), 'vivas' (n,), 'ids' (n,), 'tipos' (n,)
+                  y 'comida' (coordenadas (k, 2), o None si no se grabó)
+
+        Raises:
+            ValueError: Si el día o el paso están fuera de rango
+        """
+        self.validar_posicion(d, paso)
+        n = self.indice['dias'][d]['entidades']
+        comida = None
+        if self.comida is not None:
+            ancho, alto = self.indice['ancho'], self.indice['alto']
+            bits = np.unpackbits(self.comida[d, paso], count=ancho * alto)
+            comida = np.argwhere(bits.reshape(ancho, alto))
+        return {
+            'posiciones': np.asarray(self.posiciones[d, paso, :n]),
+            'vivas': np.asarray(self.vivas[d, paso, :n]),
+            'ids': np.asarray(self.ids[d, :n]),
+            'tipos': np.asarray(self.tipos[d, :n]),
+            'comida': comida,
+        }
+
+    def caminos(self, d, paso):
+        """
+        Caminos del día hasta un paso, de todas las entidades.
+
+        Args:
+            d (int): Índice del día en la grabación
+            paso (int): Último paso incluido
+
+        Returns:
+            numpy.ndarray: Arreglo (n, paso + 1, 2) de posiciones
+
+        Raises:
+            ValueError: Si el día o el paso están fuera de rango
+        """
+        self.validar_posicion(d, paso)
+        n = self.indice['dias'][d]['entidades']
+        return np.asarray(self.posiciones[d, :paso + 1, :n]).swapaxes(0, 1)
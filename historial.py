@@ -0,0 +1,288 @@
+import json
+import os
+from array import array
+
+
+FORMATO = 'simulacion-poblacion/historial'
+VERSION = 1
+
+# Tipo de cada columna -> código de array (y de dtype de NumPy) con que se guarda
+CODIGOS = {'entero': 'q', 'real': 'd', 'categoria': 'h'}
+
+
+class AlmacenHistorial:
+    """
+    Historial de días guardado en disco por columnas, solo agregando al final.
+
+    Cada estadística va en su propio archivo binario (<nombre>.bin) y un
+    esquema.json guarda los nombres, los tipos y cuántas filas hay escritas.
+    Las filas se acumulan en memoria y se escriben de a `tamano_lote`, así que
+    la memoria usada no crece con el número de días. Las columnas de texto
+    (como 'tipo_dia') se guardan como códigos enteros de una lista de categorías.
+
+    Se usa como la lista historial_dias: admite append, len, índices
+    (incluido [-1]) e iteración, que devuelven diccionarios. Para graficar,
+    columna() lee una estadística completa con un memmap de NumPy sin cargar
+    el resto.
+
+    Attributes:
+        directorio (str): Carpeta del almacén
+        tamano_lote (int): Cuántas filas acumular antes de escribirlas
+        columnas (list): Pares (nombre, tipo) en el orden de las filas
+        categorias (dict): Valores posibles de cada columna de texto
+        filas_en_disco (int): Filas ya escritas en los archivos
+    """
+
+    def __init__(self, directorio, filas=None, tamano_lote=256):
+        """
+        Abre (o crea) un almacén en una carpeta.
+
+        Si la carpeta ya tiene un almacén se sigue agregando a él. Con `filas`
+        se descartan las filas posteriores: filas=0 empieza un historial
+        vacío y al reanudar un punto de control se vuelve a las filas que
+        había al guardarlo. Solo se tocan los archivos de las columnas que
+        figuran en el esquema; una carpeta con otros archivos y sin esquema
+        no se usa.
+
+        Args:
+            directorio (str): Carpeta del almacén
+            filas (int): Si se indica, cuántas filas conservar
+            tamano_lote (int): Cuántas filas acumular antes de escribirlas
+
+        Raises:
+            ValueError: Si la carpeta no está vacía y no tiene un historial, o si
+                tiene menos filas que `filas`
+        """
+        os.makedirs(directorio, exist_ok=True)
+        self.directorio = directorio
+        self.tamano_lote = tamano_lote
+        self.columnas = []
+        self.categorias = {}
+        self.filas_en_disco = 0
+        self._pendientes = []
+        self._mapas = {}
+
+        ruta = self._ruta_esquema()
+        if os.path.exists(ruta):
+            with open(ruta, encoding='utf-8') as archivo:
+                esquema = json.load(archivo)
+            if esquema.get('formato') != FORMATO or esquema.get('version') != VERSION:
+                raise ValueError(f"{directorio} no es un historial de la simulacion")
+            self.columnas = [tuple(c) for c in esquema['columnas']]
+            self.categorias = esquema['categorias']
+            self.filas_en_disco = esquema['filas']
+        elif os.listdir(directorio):
+            raise ValueError(f"{directorio} no esta vacia y no tiene un historial de la "
+                             f"simulacion: use una carpeta nueva o vacia")
+
+        if filas is not None:
+            if filas > self.filas_en_disco:
+                raise ValueError(f"El historial de {directorio} tiene {self.filas_en_disco} "
+                                 f"filas, no {filas}")
+            self.filas_en_disco = filas
+        # Un corte durante guardar() puede dejar datos más allá de lo que dice
+        # el esquema: se recortan para que todas las columnas coincidan
+        self._recortar_archivos()
+        if self.filas_en_disco == 0:
+            # Las columnas se vuelven a deducir de la primera fila nueva
+            for nombre, _ in self.columnas:
+                os.remove(self._ruta_columna(nombre))
+            self.columnas = []
+            self.categorias = {}
+        self._escribir_esquema()
+
+    def _ruta_esquema(self):
+        return os.path.join(self.directorio, 'esquema.json')
+
+    def _ruta_columna(self, nombre):
+        return os.path.join(self.directorio, f"{nombre}.bin")
+
+    def _recortar_archivos(self):
+        """Deja cada archivo de columna del esquema con exactamente filas_en_disco valores."""
+        for nombre, tipo in self.columnas:
+            ruta = self._ruta_columna(nombre)
+            tamano = self.filas_en_disco * array(CODIGOS[tipo]).itemsize
+            with open(ruta, 'ab') as archivo:
+                archivo.truncate(tamano)
+
+    def _escribir_esquema(self):
+        """Reemplaza esquema.json de forma atómica."""
+        ruta = self._ruta_esquema()
+        temporal = f"{ruta}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump({'formato': FORMATO, 'version': VERSION, 'filas': self.filas_en_disco,
+                       'columnas': self.columnas, 'categorias': self.categorias},
+                      archivo, ensure_ascii=False)
+        os.replace(temporal, ruta)
+
+    def _definir_columnas(self, fila):
+        """Deduce las columnas y sus tipos de la primera fila."""
+        for nombre, valor in fila.items():
+            if isinstance(valor, str):
+                self.columnas.append((nombre, 'categoria'))
+                self.categorias[nombre] = []
+            elif isinstance(valor, float):
+                self.columnas.append((nombre, 'real'))
+            else:
+                self.columnas.append((nombre, 'entero'))
+
+    def _codigo(self, nombre, valor):
+        """Código entero de un valor de una columna de texto."""
+        categorias = self.categorias[nombre]
+        if valor not in categorias:
+            categorias.append(valor)
+        return categorias.index(valor)
+
+    def append(self, fila):
+        """
+        Agrega las estadísticas de un día.
+
+        Args:
+            fila (dict): Estadísticas del día, siempre con las mismas claves
+        """
+        if not self.columnas:
+            self._definir_columnas(fila)
+        elif len(fila) != len(self.columnas):
+            raise ValueError("La fila no tiene las mismas columnas que el historial")
+        self._pendientes.append(fila)
+        if len(self._pendientes) >= self.tamano_lote:
+            self.guardar()
+
+    def guardar(self):
+        """Escribe en disco las filas pendientes y actualiza el esquema."""
+        if not self._pendientes:
+            return
+        pendientes = self._pendientes
+        for nombre, tipo in self.columnas:
+            if tipo == 'categoria':
+                valores = [self._codigo(nombre, fila[nombre]) for fila in pendientes]
+            elif tipo == 'real':
+                valores = [float(fila[nombre]) for fila in pendientes]
+            else:
+                valores = [int(fila[nombre]) for fila in pendientes]
+            with open(self._ruta_columna(nombre), 'ab') as archivo:
+                array(CODIGOS[tipo], valores).tofile(archivo)
+        self.filas_en_disco += len(pendientes)
+        self._pendientes = []
+        self._mapas = {}
+        self._escribir_esquema()
+
+    def _mapa(self, nombre, tipo):
+        """Memmap de solo lectura de las filas de una columna ya escritas."""
+        import numpy as np
+
+        mapa = self._mapas.get(nombre)
+        if mapa is None:
+            dtype = np.dtype(CODIGOS[tipo])
+            if self.filas_en_disco == 0:
+                mapa = np.empty(0, dtype=dtype)
+            else:
+                mapa = np.memmap(self._ruta_columna(nombre), dtype=dtype, mode='r',
+                                 shape=(self.filas_en_disco,))
+            self._mapas[nombre] = mapa
+        return mapa
+
+    def columna(self, nombre):
+        """
+        Devuelve una estadística de todos los días.
+
+        Las filas escritas se leen con un memmap: NumPy solo trae de disco
+        las partes del archivo que se usan.
+
+        Args:
+            nombre (str): Nombre de la estadística
+
+        Returns:
+            numpy.ndarray: Un valor por día (texto para las columnas de categoría)
+        """
+        import numpy as np
+
+        tipos = dict(self.columnas)
+        if nombre not in tipos:
+            raise KeyError(nombre)
+        tipo = tipos[nombre]
+        valores = self._mapa(nombre, tipo)
+        if tipo == 'categoria':
+            valores = np.asarray(self.categorias[nombre] or [''])[valores]
+        if self._pendientes:
+            valores = np.concatenate([valores, [fila[nombre] for fila in self._pendientes]])
+        return valores
+
+    def _filas_en_disco(self, inicio, fin):
+        """Lista de diccionarios con las filas escritas entre inicio y fin."""
+        listas = []
+        for nombre, tipo in self.columnas:
+            valores = self._mapa(nombre, tipo)[inicio:fin].tolist()
+            if tipo == 'categoria':
+                categorias = self.categorias[nombre]
+                valores = [categorias[codigo] for codigo in valores]
+            listas.append(valores)
+        nombres = [nombre for nombre, _ in self.columnas]
+        return [dict(zip(nombres, valores)) for valores in zip(*listas)]
+
+    def __len__(self):
+        return self.filas_en_disco + len(self._pendientes)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Indice de historial fuera de rango")
+        if indice >= self.filas_en_disco:
+            return self._pendientes[indice - self.filas_en_disco]
+        return self._filas_en_disco(indice, indice + 1)[0]
+
+    def __iter__(self):
+        # De a un lote por vez, para no cargar todo el historial
+        for inicio in range(0, self.filas_en_disco, self.tamano_lote):
+            yield from self._filas_en_disco(inicio, min(inicio + self.tamano_lote,
+                                                        self.filas_en_disco))
+        yield from list(self._pendientes)
+
+    def __reduce__(self):
+        # En un punto de control solo se guarda dónde está el almacén y
+        # cuántas filas tiene; al cargarlo se vuelve a abrir en ese punto
+        self.guardar()
+        return (AlmacenHistorial, (self.directorio, self.filas_en_disco, self.tamano_lote))
+
+
+def columna(historial, nombre, defecto=0):
+    """
+    Devuelve una estadística de todos los días de un historial.
+
+    Args:
+        historial: Lista de diccionarios o AlmacenHistorial
+        nombre (str): Nombre de la estadística
+        defecto: Valor para los días que no la tienen o la tienen en None
+                 (solo en listas)
+
+    Returns:
+        numpy.ndarray: Un valor por día
+    """
+    import numpy as np
+
+    if isinstance(historial, AlmacenHistorial):
+        return historial.columna(nombre)
+    valores = (dia.get(nombre) for dia in historial)
+    return np.asarray([defecto if valor is None else valor for valor in valores])
+
+
+def copiar_historial(historial):
+    """
+    Copia un historial para exportar el estado de una simulación.
+
+    Las listas se copian; un AlmacenHistorial se devuelve tal cual, porque al
+    guardarse en un punto de control solo se guardan su carpeta y su número
+    de filas.
+
+    Args:
+        historial: Lista de diccionarios o AlmacenHistorial
+
+    Returns:
+        list o AlmacenHistorial
+    """
+    if isinstance(historial, AlmacenHistorial):
+        return historial
+    return list(historial)
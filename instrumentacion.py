@@ -0,0 +1,183 @@
+import time
+
+
+# Fases medidas: método (del objeto indicado) que las delimita.
+# Los tiempos son exclusivos: el de 'movimiento' no incluye el de las
+# huidas, la comida ni los ataques, que ocurren dentro de avanzar_paso.
+FASES = (
+    ('movimiento', 'simulacion', 'avanzar_paso'),
+    ('huida', 'entorno', 'depredador_adyacente'),
+    ('comida', 'entorno', 'consumir_comida'),
+    ('ataques', 'simulacion', '_procesar_ataques_depredadores'),
+    ('fin_dia', 'simulacion', '_evaluar_fin_dia'),
+    ('regeneracion_comida', 'entorno', 'reestablecer_comida'),
+)
+
+# Métodos del generador que cuentan como un sorteo. Los que llaman a otros
+# de la lista (uniform usa random, por ejemplo) cuentan una sola vez
+METODOS_SORTEO = ('random', 'choice', 'choices', 'randrange', 'randint', 'sample',
+                  'shuffle', 'uniform')
+
+DIRECCIONES_POSIBLES = 4
+
+
+class Instrumentacion:
+    """
+    Mide dónde se va el tiempo de cada día de una Simulacion.
+
+    Al activarse envuelve, solo en esa simulación, su entorno y su generador,
+    los métodos que delimitan cada fase (ver FASES), y cuenta tiempo y
+    llamadas por fase, sorteos aleatorios y movimientos rechazados. Como los
+    envoltorios son atributos de instancia y se quitan al desactivarla,
+    cuando está apagada el código de la simulación no hace ningún trabajo extra.
+
+    Al cerrar cada día se agrega una fila a simulacion.metricas_dias con:
+        segundos_<fase>, llamadas_<fase>: por cada fase de FASES
+        sorteos_rng: números aleatorios sorteados
+        movimientos_rechazados: huidas bloqueadas por un borde y pasos sin
+            ninguna dirección válida
+        direcciones_bloqueadas: direcciones descartadas por las tablas de
+            movimientos (los choques que evita sortear solo entre las válidas)
+
+    Attributes:
+        simulacion (Simulacion): La simulación medida
+        tiempos (dict): Segundos exclusivos por fase en el día en curso
+        llamadas (dict): Llamadas por fase en el día en curso
+        contadores (dict): sorteos_rng, movimientos_rechazados y direcciones_bloqueadas
+    """
+
+    def __init__(self, simulacion):
+        """
+        Prepara la instrumentación de una simulación (sin activarla).
+
+        Args:
+            simulacion (Simulacion): La simulación a medir
+        """
+        self.simulacion = simulacion
+        self._envueltos = []
+        # Tiempo de fases anidadas, por nivel, para restarlo a la fase que las contiene
+        self._anidado = []
+        self._en_sorteo = False
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Pone en cero los tiempos y contadores del día."""
+        self.tiempos = {fase: 0.0 for fase, _, _ in FASES}
+        self.llamadas = {fase: 0 for fase, _, _ in FASES}
+        self.contadores = {'sorteos_rng': 0, 'movimientos_rechazados': 0,
+                           'direcciones_bloqueadas': 0}
+
+    @property
+    def activa(self):
+        """True si los envoltorios están puestos."""
+        return bool(self._envueltos)
+
+    def activar(self):
+        """Envuelve los métodos medidos de la simulación, su entorno y su generador."""
+        if self.activa:
+            return
+        simulacion = self.simulacion
+        objetos = {'simulacion': simulacion, 'entorno': simulacion.entorno}
+        for fase, objeto, metodo in FASES:
+            original = getattr(objetos[objeto], metodo)
+            self._envolver(objetos[objeto], metodo, self._medir_fase(fase, original))
+
+        entorno = simulacion.entorno
+        self._envolver(entorno, 'movimientos_validos', self._contar_opciones(entorno.movimientos_validos))
+        self._envolver(entorno, 'es_posicion_valida', self._contar_huida(entorno.es_posicion_valida))
+        self._envolver(simulacion, 'cerrar_dia', self._registrar_dia(simulacion.cerrar_dia))
+        for metodo in METODOS_SORTEO:
+            self._envolver(entorno.rng, metodo, self._contar_sorteo(getattr(entorno.rng, metodo)))
+
+    def desactivar(self):
+        """Quita los envoltorios: los métodos originales vuelven a usarse directamente."""
+        for objeto, metodo in self._envueltos:
+            delattr(objeto, metodo)
+        self._envueltos = []
+
+    def _envolver(self, objeto, metodo, envoltorio):
+        setattr(objeto, metodo, envoltorio)
+        self._envueltos.append((objeto, metodo))
+
+    def _medir_fase(self, fase, original):
+        """Envoltorio que suma tiempo exclusivo y una llamada a una fase."""
+        reloj = time.perf_counter
+        anidado = self._anidado
+
+        def medido(*args, **kwargs):
+            anidado.append(0.0)
+            inicio = reloj()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                duracion = reloj() - inicio
+                interno = anidado.pop()
+                self.tiempos[fase] += duracion - interno
+                self.llamadas[fase] += 1
+                if anidado:
+                    anidado[-1] += duracion
+
+        return medido
+
+    def _contar_opciones(self, original):
+        """Envoltorio de movimientos_validos que cuenta direcciones descartadas."""
+        def contado(*args, **kwargs):
+            opciones = original(*args, **kwargs)
+            self.contadores['direcciones_bloqueadas'] += DIRECCIONES_POSIBLES - len(opciones)
+            if not opciones:
+                self.contadores['movimientos_rechazados'] += 1
+            return opciones
+
+        return contado
+
+    def _contar_huida(self, original):
+        """Envoltorio de es_posicion_valida (usado al huir) que cuenta huidas bloqueadas."""
+        def contado(*args, **kwargs):
+            valida = original(*args, **kwargs)
+            if not valida:
+                self.contadores['movimientos_rechazados'] += 1
+            return valida
+
+        return contado
+
+    def _contar_sorteo(self, original):
+        """Envoltorio de un método del generador que cuenta un sorteo por llamada externa."""
+        def contado(*args, **kwargs):
+            if self._en_sorteo:
+                return original(*args, **kwargs)
+            self._en_sorteo = True
+            try:
+                self.contadores['sorteos_rng'] += 1
+                return original(*args, **kwargs)
+            finally:
+                self._en_sorteo = False
+
+        return contado
+
+    def _registrar_dia(self, original):
+        """Envoltorio de cerrar_dia que guarda la fila de métricas del día."""
+        def registrado(*args, **kwargs):
+            dia = self.simulacion.dia_actual
+            estadisticas = original(*args, **kwargs)
+            self.simulacion.metricas_dias.append(self.fila(dia))
+            self.reiniciar()
+            return estadisticas
+
+        return registrado
+
+    def fila(self, dia):
+        """
+        Arma la fila de métricas del día en curso.
+
+        Args:
+            dia (int): Número de día
+
+        Returns:
+            dict: Métricas planas del día (ver la documentación de la clase)
+        """
+        fila = {'dia': dia}
+        for fase, _, _ in FASES:
+            fila[f'segundos_{fase}'] = self.tiempos[fase]
+            fila[f'llamadas_{fase}'] = self.llamadas[fase]
+        fila.update(self.contadores)
+        return fila
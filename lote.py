@@ -0,0 +1,304 @@
+import argparse
+import csv
+import json
+import os
+import sys
+
+from entorno import Entorno
+from historial import AlmacenHistorial
+from punto_control import restaurar_simulacion
+from rastro import PoliticaRastro
+from simulacion import Simulacion
+
+
+# Mismos valores por defecto que las preguntas de main.py
+PARAMETROS_POR_DEFECTO = {
+    'ancho': 40,
+    'alto': 40,
+    'porcentaje_comida_min': 0.10,
+    'porcentaje_comida_max': 0.25,
+    'num_particulas': 3,
+    'pasos_por_dia': 80,
+    'frecuencia_depredadores': 2,
+    'cantidad_depredadores': 1,
+    'max_dias': 100,
+    'semilla': None,
+    'motor': 'objetos',
+    'comida_densa': False,
+    'rastro': 'ninguno',
+}
+
+
+def cargar_configuracion(args):
+    """
+    Combina los valores por defecto, el archivo de configuración y las opciones.
+
+    Las opciones de la línea de comandos tienen prioridad sobre el archivo.
+
+    Args:
+        args (argparse.Namespace): Opciones ya interpretadas
+
+    Returns:
+        dict: Configuración completa de la simulación
+    """
+    config = dict(PARAMETROS_POR_DEFECTO)
+
+    if args.config:
+        with open(args.config, encoding='utf-8') as archivo:
+            desde_archivo = json.load(archivo)
+        desconocidas = set(desde_archivo) - set(PARAMETROS_POR_DEFECTO)
+        if desconocidas:
+            raise ValueError(f"Parametros desconocidos en {args.config}: {', '.join(sorted(desconocidas))}")
+        config.update(desde_archivo)
+
+    for clave in PARAMETROS_POR_DEFECTO:
+        valor = getattr(args, clave, None)
+        if valor is not None:
+            config[clave] = valor
+
+    return config
+
+
+def validar_configuracion(config):
+    """
+    Aplica las mismas validaciones que main.py.
+
+    Args:
+        config (dict): Configuración de la simulación
+
+    Returns:
+        str: Mensaje de error, o None si la configuración es válida
+    """
+    if config['ancho'] <= 0 or config['alto'] <= 0:
+        return "Las dimensiones deben ser positivas"
+    if not 0 <= config['porcentaje_comida_min'] <= 1:
+        return "El porcentaje minimo debe estar entre 0 y 1"
+    if not 0 <= config['porcentaje_comida_max'] <= 1:
+        return "El porcentaje maximo debe estar entre 0 y 1"
+    if config['porcentaje_comida_min'] > config['porcentaje_comida_max']:
+        return "El porcentaje minimo no puede ser mayor que el maximo"
+    if config['num_particulas'] <= 0 or config['pasos_por_dia'] <= 0:
+        return "Numero de particulas y pasos deben ser positivos"
+    if config['motor'] not in ('objetos', 'vectorizado'):
+        return "El motor debe ser 'objetos' o 'vectorizado'"
+    try:
+        PoliticaRastro.desde_valor(config['rastro'])
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+def crear_simulacion(config, rng=None, historial=None):
+    """
+    Construye el entorno y la simulación descritos por una configuración.
+
+    Args:
+        config (dict): Configuración de la simulación
+        rng (GeneradorAleatorio): Generador a usar en lugar de config['semilla']
+        historial (AlmacenHistorial): Almacén en disco para el historial de días
+
+    Returns:
+        Simulacion: La simulación lista para ejecutarse (o SimulacionVectorizada)
+    """
+    entorno = Entorno(ancho=config['ancho'], alto=config['alto'],
+                      porcentaje_comida_min=config['porcentaje_comida_min'],
+                      porcentaje_comida_max=config['porcentaje_comida_max'],
+                      # El motor vectorizado trabaja siempre sobre la rejilla densa
+                      comida_densa=config['comida_densa'] or config['motor'] == 'vectorizado',
+                      semilla=config['semilla'], rng=rng)
+
+    parametros = {
+        'entorno': entorno,
+        'num_particulas_inicial': config['num_particulas'],
+        'pasos_por_dia': config['pasos_por_dia'],
+        'frecuencia_depredadores': config['frecuencia_depredadores'],
+        'cantidad_depredadores': config['cantidad_depredadores'],
+        'historial': historial,
+    }
+
+    if config['motor'] == 'vectorizado':
+        # Importación diferida: NumPy solo se carga si se pide este motor.
+        # El motor vectorizado no guarda caminos, así que ignora 'rastro'
+        from motor_vectorizado import SimulacionVectorizada
+        return SimulacionVectorizada(**parametros)
+
+    # En lote nadie dibuja los caminos: por defecto no se guardan
+    return Simulacion(politica_rastro=config['rastro'], max_dias_guardados=0, **parametros)
+
+
+def guardar_historial(historial, ruta):
+    """
+    Escribe el historial de días en disco, como CSV o JSON según la extensión.
+
+    Las filas se escriben de a una mientras se recorre el historial, así que
+    un AlmacenHistorial no se carga entero en memoria. El JSON queda igual
+    que con json.dump(lista, indent=1).
+
+    Args:
+        historial (list): Historial de estadísticas por día (o un AlmacenHistorial)
+        ruta (str): Archivo de salida (.csv o .json)
+    """
+    if ruta.endswith('.csv'):
+        columnas = list(historial[0].keys()) if len(historial) else []
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=columnas)
+            escritor.writeheader()
+            escritor.writerows(historial)
+    else:
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            separador = '[\n '
+            for fila in historial:
+                # Los textos JSON no tienen saltos de línea sin escapar: se
+                # puede sangrar cada línea de la fila como dentro de la lista
+                texto = json.dumps(fila, ensure_ascii=False, indent=1)
+                archivo.write(separador + texto.replace('\n', '\n '))
+                separador = ',\n '
+            archivo.write('[]' if separador == '[\n ' else '\n]')
+
+
+def crear_parser():
+    """Crea el intérprete de opciones de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Ejecuta la simulacion de poblacion sin interfaz grafica "
+                    "y guarda el historial de dias en disco."
+    )
+    parser.add_argument('--config', help="Archivo JSON con parametros (las opciones lo sobrescriben)")
+    parser.add_argument('--salida', default='historial.json',
+                        help="Archivo de salida .json o .csv (default: historial.json)")
+    parser.add_argument('--ancho', type=int, help="Ancho del entorno (default: 40)")
+    parser.add_argument('--alto', type=int, help="Alto del entorno (default: 40)")
+    parser.add_argument('--comida-min', dest='porcentaje_comida_min', type=float,
+                        help="Porcentaje minimo de comida 0-1 (default: 0.10)")
+    parser.add_argument('--comida-max', dest='porcentaje_comida_max', type=float,
+                        help="Porcentaje maximo de comida 0-1 (default: 0.25)")
+    parser.add_argument('--particulas', dest='num_particulas', type=int,
+                        help="Numero de particulas iniciales (default: 3)")
+    parser.add_argument('--pasos', dest='pasos_por_dia', type=int, help="Pasos por dia (default: 80)")
+    parser.add_argument('--frecuencia-depredadores', type=int,
+                        help="Cada cuantos dias aparecen depredadores, 0=nunca (default: 2)")
+    parser.add_argument('--cantidad-depredadores', type=int,
+                        help="Cuantos depredadores aparecen cada vez (default: 1)")
+    parser.add_argument('--max-dias', type=int, help="Numero maximo de dias (default: 100)")
+    parser.add_argument('--semilla', type=int, help="Semilla para repetir la ejecucion")
+    parser.add_argument('--motor', choices=['objetos', 'vectorizado'],
+                        help="Motor de simulacion (default: objetos)")
+    parser.add_argument('--comida-densa', action='store_const', const=True,
+                        help="Guardar la comida en una rejilla densa (el motor vectorizado "
+                             "la usa siempre)")
+    parser.add_argument('--rastro',
+                        help="Caminos a guardar: ninguno, completo o N (ultimas N posiciones) "
+                             "(default: ninguno)")
+    parser.add_argument('--punto-control',
+                        help="Archivo de punto de control: si existe se reanuda desde el, "
+                             "y se actualiza cada --cada-dias dias")
+    parser.add_argument('--cada-dias', type=int, default=10,
+                        help="Cada cuantos dias guardar el punto de control (default: 10)")
+    parser.add_argument('--historial-dir',
+                        help="Carpeta donde ir escribiendo el historial por columnas, "
+                             "sin acumularlo en memoria")
+    parser.add_argument('--grabar',
+                        help="Carpeta donde grabar cada paso para reproducirlo con reproducir.py "
+                             "(no debe tener ya una grabacion)")
+    parser.add_argument('--max-entidades', type=int, default=1000,
+                        help="Particulas mas depredadores por dia que caben en la grabacion "
+                             "(default: 1000)")
+    parser.add_argument('--sin-comida', action='store_true',
+                        help="No grabar la comida de cada paso (ocupa ancho*alto/8 bytes "
+                             "por paso)")
+    parser.add_argument('--metricas',
+                        help="Archivo .json o .csv donde guardar tiempo y llamadas por fase "
+                             "de cada dia (solo motor objetos)")
+    parser.add_argument('--progreso', action='store_true', help="Mostrar el detalle de cada dia")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la ejecución por lotes.
+
+    Args:
+        argv (list): Argumentos de la línea de comandos (por defecto sys.argv)
+
+    Returns:
+        int: Código de salida (0 si todo salió bien)
+    """
+    args = crear_parser().parse_args(argv)
+
+    try:
+        config = cargar_configuracion(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    error = validar_configuracion(config)
+    if error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+
+    if args.cada_dias <= 0:
+        print("Error: --cada-dias debe ser positivo", file=sys.stderr)
+        return 2
+
+    if args.max_entidades <= 0:
+        print("Error: --max-entidades debe ser positivo", file=sys.stderr)
+        return 2
+
+    if args.punto_control and os.path.exists(args.punto_control):
+        # Los parámetros de la simulación salen del punto de control
+        try:
+            simulacion = restaurar_simulacion(args.punto_control)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        print(f"Reanudando desde {args.punto_control} (dia {simulacion.dia_actual})")
+    else:
+        historial = None
+        if args.historial_dir:
+            # Un historial nuevo: se descarta el historial que hubiera en la carpeta
+            try:
+                historial = AlmacenHistorial(args.historial_dir, filas=0)
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 2
+        simulacion = crear_simulacion(config, historial=historial)
+
+    if args.metricas:
+        if not hasattr(simulacion, 'activar_instrumentacion'):
+            print("Error: --metricas solo esta disponible con el motor objetos", file=sys.stderr)
+            return 2
+        simulacion.activar_instrumentacion()
+
+    grabador = None
+    if args.grabar:
+        # Importación diferida: NumPy solo se carga si se pide grabar
+        from grabador import GrabadorTrayectorias
+        dias_restantes = max(1, config['max_dias'] - simulacion.dia_actual + 1)
+        con_comida = not args.sin_comida
+        tamano = GrabadorTrayectorias.tamano_reservado(
+            dias_restantes, simulacion.pasos_por_dia, args.max_entidades,
+            simulacion.entorno.ancho, simulacion.entorno.alto, con_comida=con_comida)
+        print(f"Grabacion en {args.grabar}: se reservan {tamano / 2**20:.1f} MB"
+              + ("" if con_comida else " (sin comida)"))
+        try:
+            grabador = GrabadorTrayectorias.para_simulacion(args.grabar, simulacion,
+                                                            dias_restantes, args.max_entidades,
+                                                            con_comida=con_comida)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+
+    historial = simulacion.ejecutar_simulacion_completa(max_dias=config['max_dias'],
+                                                        mostrar_progreso=args.progreso,
+                                                        ruta_punto_control=args.punto_control,
+                                                        cada_n_dias=args.cada_dias,
+                                                        grabador=grabador)
+    guardar_historial(historial, args.salida)
+    print(f"Historial de {len(historial)} dias guardado en {args.salida}")
+    if args.metricas:
+        guardar_historial(simulacion.metricas_dias, args.metricas)
+        print(f"Metricas de {len(simulacion.metricas_dias)} dias guardadas en {args.metricas}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 from entorno import Entorno
+from historial import AlmacenHistorial, columna
 from simulacion import Simulacion
-from visualizador import Visualizador
 
 
 def main():
@@ -37,6 +37,11 @@ def main():
         frecuencia_dep = int(input("Frecuencia: cada cuantos dias aparecen (default: 2, 0=nunca): ") or "2")
         cantidad_dep = int(input("Cantidad: cuantos depredadores aparecen cada vez (default: 1): ") or "1")
         
+        print("\nHISTORIAL")
+        print("-" * 70)
+        print("Para simulaciones largas el historial se puede ir escribiendo en disco")
+        directorio_historial = input("Carpeta del historial (default: en memoria): ").strip()
+        
     except ValueError:
         print("Error: Debe ingresar valores numericos validos")
         return
@@ -67,12 +72,21 @@ def main():
     entorno = Entorno(ancho=ancho, alto=alto, 
                      porcentaje_comida_min=porcentaje_min, 
                      porcentaje_comida_max=porcentaje_max)
+    historial = None
+    if directorio_historial:
+        try:
+            historial = AlmacenHistorial(directorio_historial, filas=0)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            return
     simulacion = Simulacion(
         entorno=entorno,
         num_particulas_inicial=num_particulas,
         pasos_por_dia=pasos_por_dia,
         frecuencia_depredadores=frecuencia_dep,
-        cantidad_depredadores=cantidad_dep
+        cantidad_depredadores=cantidad_dep,
+        max_dias_guardados=Simulacion.DIAS_GUARDADOS,
+        historial=historial
     )
     
     # ==================== EJECUTAR SIMULACIÓN VISUAL ====================
@@ -90,6 +104,9 @@ def main():
     print("o hasta que cierres la ventana de visualizacion")
     print("="*70 + "\n")
     
+    # La capa visual (y matplotlib) se carga solo al abrir la ventana
+    from visualizador import Visualizador
+    
     try:
         Visualizador.simular_visualmente(simulacion=simulacion)
         
@@ -107,14 +124,19 @@ def main():
     print("SIMULACION FINALIZADA")
     print("="*70)
     
+    if historial is not None:
+        # Lo que quede pendiente se escribe antes de leer el almacén
+        historial.guardar()
+    
     if simulacion.historial_dias:
         print(f"\nESTADISTICAS FINALES:")
         print(f"{'='*70}")
         print(f"Dias simulados: {len(simulacion.historial_dias)}")
         print(f"Particulas finales: {simulacion.historial_dias[-1]['particulas_finales']}")
         
-        total_muertes = sum([d['muertes'] for d in simulacion.historial_dias])
-        total_reproducciones = sum([d['reproducciones'] for d in simulacion.historial_dias])
+        # Por columnas: con el historial en disco solo se leen estas dos
+        total_muertes = int(columna(simulacion.historial_dias, 'muertes').sum())
+        total_reproducciones = int(columna(simulacion.historial_dias, 'reproducciones').sum())
         
         print(f"Total de muertes: {total_muertes}")
         print(f"Total de reproducciones: {total_reproducciones}")
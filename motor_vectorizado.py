@@ -0,0 +1,753 @@
+import numpy as np
+
+import punto_control
+from aleatorio import GeneradorAleatorio
+from entorno import Entorno
+from historial import AlmacenHistorial, copiar_historial
+from particula import REGLAS_MUTACION, Mutacion
+
+
+class SimulacionVectorizada:
+    """
+    Motor alternativo de la simulación de población basado en NumPy.
+
+    Mantiene el estado de todas las partículas en arreglos paralelos
+    (estructura de arreglos) en lugar de objetos Particula, y avanza a toda
+    la población en cada paso con sorteos aleatorios en lote y manejo de
+    límites mediante máscaras. Produce el mismo diccionario de estadísticas
+    por día que Simulacion._evaluar_fin_dia.
+
+    La comida se consulta y consume con las operaciones en lote del entorno,
+    directamente sobre su rejilla de bytes: si el entorno guarda la comida en
+    un conjunto, se pasa a la rejilla al crear la simulación (con el conjunto
+    cada consulta sería un bucle de Python por partícula).
+
+    Attributes:
+        entorno (Entorno): El entorno de la simulación
+        num_particulas_inicial (int): Número inicial de partículas
+        pasos_por_dia (int): Número de pasos que dura un día
+        dia_actual (int): Día actual de la simulación
+        contador_id (int): Contador para asignar IDs únicos
+        historial_dias (list): Historial de estadísticas por día (o un AlmacenHistorial)
+        frecuencia_depredadores (int): Cada cuántos días aparecen depredadores
+        cantidad_depredadores (int): Cuántos depredadores aparecen
+        x, y (ndarray): Posición actual de cada partícula
+        inicio_x, inicio_y (ndarray): Posición inicial (casa) de cada partícula
+        mutacion (ndarray): Tipo de mutación (0=ninguna, 1=velocidad, 2=prioridad)
+        comida (ndarray): Comida consumida en el día
+        en_casa (ndarray): Si la partícula está en casa
+        viva (ndarray): Si la partícula sigue viva
+        mordidas (ndarray): Mordidas recibidas en el día
+        ids (ndarray): Identificador de cada partícula
+        generacion (ndarray): Generación de cada partícula
+        dep_x, dep_y (ndarray): Posición de cada depredador
+        dia_en_curso (bool): Si ya se llamó a iniciar_dia y falta cerrar_dia
+        paso_actual (int): Pasos dados en el día en curso
+        muertes_en_dia (int): Muertes por depredador en el día en curso
+        depredadores_en_dia (int): Depredadores que aparecieron en el día en curso
+    """
+
+    NINGUNA = int(Mutacion.NINGUNA)
+    VELOCIDAD = int(Mutacion.VELOCIDAD)
+    PRIORIDAD = int(Mutacion.PRIORIDAD)
+    NOMBRES_MUTACION = ('ninguna', 'velocidad', 'prioridad')
+
+    # Desplazamientos en el mismo orden que Particula.DIRECCIONES
+    DX = np.array([0, 0, -1, 1], dtype=np.int32)
+    DY = np.array([-1, 1, 0, 0], dtype=np.int32)
+
+    # Reglas por mutación (de REGLAS_MUTACION), indexadas por el código de mutación
+    COMIDA_MINIMA_CASA = np.array([r.comida_minima_casa for r in REGLAS_MUTACION], dtype=np.int32)
+    COMIDA_SUPERVIVENCIA = np.array([r.comida_supervivencia for r in REGLAS_MUTACION], dtype=np.int32)
+    COMIDA_REPRODUCCION = np.array([r.comida_reproduccion for r in REGLAS_MUTACION], dtype=np.int32)
+    MORDIDAS_PARA_MORIR = np.array([r.mordidas_para_morir for r in REGLAS_MUTACION], dtype=np.int32)
+    PROB_PASO_EXTRA = np.array([r.prob_paso_extra for r in REGLAS_MUTACION])
+    PRIORIDAD_COMIDA = np.array([r.prioridad_comida for r in REGLAS_MUTACION])
+    HUYE_DE_DEPREDADORES = np.array([r.huye_de_depredadores for r in REGLAS_MUTACION])
+
+    def __init__(self, entorno, num_particulas_inicial=10, pasos_por_dia=100,
+                 frecuencia_depredadores=2, cantidad_depredadores=1, semilla=None,
+                 historial=None):
+        """
+        Inicializa la simulación vectorizada.
+
+        Args:
+            entorno (Entorno): El entorno donde se realizará la simulación
+            num_particulas_inicial (int): Número de partículas al inicio
+            pasos_por_dia (int): Cuántos pasos dura un día
+            frecuencia_depredadores (int): Cada cuántos días aparecen depredadores
+            cantidad_depredadores (int): Cuántos depredadores aparecen
+            semilla (int): Si se indica, reemplaza el generador del entorno por uno con
+                esta semilla. El motor sortea con un flujo hijo del generador del entorno
+            historial (AlmacenHistorial): Si se indica, las estadísticas de cada día
+                se guardan en este almacén en disco en lugar de en una lista
+        """
+        self.entorno = entorno
+        if semilla is not None:
+            entorno.usar_generador(GeneradorAleatorio(semilla))
+        entorno.usar_comida_densa()
+        self.num_particulas_inicial = num_particulas_inicial
+        self.pasos_por_dia = pasos_por_dia
+        self.dia_actual = 1
+        self.contador_id = 0
+        self.historial_dias = [] if historial is None else historial
+        self.frecuencia_depredadores = frecuencia_depredadores
+        self.cantidad_depredadores = cantidad_depredadores
+        self.rng = entorno.rng.generar_hijo().generador_numpy()
+
+        self._crear_particulas_iniciales()
+        self.dep_x = np.empty(0, dtype=np.int32)
+        self.dep_y = np.empty(0, dtype=np.int32)
+
+        # Estado del día en curso (ver iniciar_dia / avanzar_paso / cerrar_dia)
+        self.dia_en_curso = False
+        self.paso_actual = 0
+        self.muertes_en_dia = 0
+        self.depredadores_en_dia = 0
+
+    @property
+    def num_particulas(self):
+        """Número de partículas en la población actual."""
+        return len(self.ids)
+
+    def _crear_particulas_iniciales(self):
+        """Crea las partículas iniciales en posiciones aleatorias de los bordes."""
+        n = self.num_particulas_inicial
+        ancho, alto = self.entorno.ancho, self.entorno.alto
+
+        # Mismo criterio que Entorno.obtener_posicion_inicial_aleatoria
+        borde = self.rng.integers(0, 4, size=n)
+        a_lo_ancho = self.rng.integers(0, ancho, size=n)
+        a_lo_alto = self.rng.integers(0, alto, size=n)
+        x = np.where(borde == 2, 0, np.where(borde == 3, ancho - 1, a_lo_ancho))
+        y = np.where(borde == 0, 0, np.where(borde == 1, alto - 1, a_lo_alto))
+
+        self.inicio_x = x.astype(np.int32)
+        self.inicio_y = y.astype(np.int32)
+        self.mutacion = np.zeros(n, dtype=np.int8)
+        self.generacion = np.zeros(n, dtype=np.int32)
+        self.ids = np.arange(n, dtype=np.int64)
+        self.contador_id = n
+        self._reiniciar_estado_diario()
+
+    def _reiniciar_estado_diario(self):
+        """Devuelve todas las partículas a casa con el estado diario en cero."""
+        n = len(self.ids)
+        self.x = self.inicio_x.copy()
+        self.y = self.inicio_y.copy()
+        self.comida = np.zeros(n, dtype=np.int32)
+        self.mordidas = np.zeros(n, dtype=np.int32)
+        self.en_casa = np.ones(n, dtype=bool)
+        self.viva = np.ones(n, dtype=bool)
+
+    def _es_casa(self, x, y):
+        """Máscara de las posiciones que están en la casa (bordes del mapa)."""
+        return ((x == 0) | (x == self.entorno.ancho - 1) |
+                (y == 0) | (y == self.entorno.alto - 1))
+
+    def _generar_depredadores(self):
+        """Genera depredadores si corresponde al día actual."""
+        if self.frecuencia_depredadores > 0 and self.dia_actual % self.frecuencia_depredadores == 0:
+            n = self.cantidad_depredadores
+            self.dep_x = self.rng.integers(1, self.entorno.ancho - 1, size=n).astype(np.int32)
+            self.dep_y = self.rng.integers(1, self.entorno.alto - 1, size=n).astype(np.int32)
+            self.contador_id += n
+            return True
+        return False
+
+    def _elegir_direcciones(self, validas):
+        """
+        Elige, para cada fila, una dirección uniforme entre las válidas.
+
+        Args:
+            validas (ndarray): Máscara (n, 4) de direcciones permitidas
+
+        Returns:
+            tuple: (direcciones, puede_moverse) con el índice elegido por fila
+                   y la máscara de filas con al menos una dirección válida
+        """
+        cantidad = validas.sum(axis=1)
+        puede_moverse = cantidad > 0
+        # Un solo sorteo por fila: el k-ésimo movimiento válido
+        k = (self.rng.random(len(validas)) * cantidad).astype(np.int32)
+        acumulado = np.cumsum(validas, axis=1)
+        direcciones = np.argmax(acumulado > k[:, None], axis=1)
+        return direcciones, puede_moverse
+
+    def _paso_individual(self, indices):
+        """
+        Mueve un paso aleatorio a las partículas indicadas y resuelve la comida.
+
+        Args:
+            indices (ndarray): Índices de las partículas que se mueven
+        """
+        if len(indices) == 0:
+            return
+        ancho, alto = self.entorno.ancho, self.entorno.alto
+        x = self.x[indices]
+        y = self.y[indices]
+
+        nx = x[:, None] + self.DX
+        ny = y[:, None] + self.DY
+        validas = (nx >= 0) & (nx < ancho) & (ny >= 0) & (ny < alto)
+        direcciones, puede_moverse = self._elegir_direcciones(validas)
+
+        indices = indices[puede_moverse]
+        direcciones = direcciones[puede_moverse]
+        x = x[puede_moverse] + self.DX[direcciones]
+        y = y[puede_moverse] + self.DY[direcciones]
+        self.x[indices] = x
+        self.y[indices] = y
+        self.en_casa[indices] = self._es_casa(x, y)
+
+        # Resolver comida: en conflictos gana la prioridad y luego el orden de la lista
+        lineal = x.astype(np.int64) * alto + y
+        con_comida = self.entorno.hay_comida_lote(lineal)
+        if not con_comida.any():
+            return
+        candidatos = indices[con_comida]
+        lineal = lineal[con_comida]
+        sin_prioridad = ~self.PRIORIDAD_COMIDA[self.mutacion[candidatos]]
+        orden = np.lexsort((candidatos, sin_prioridad, lineal))
+        _, primeros = np.unique(lineal[orden], return_index=True)
+        ganadores = candidatos[orden[primeros]]
+        celdas = lineal[orden[primeros]]
+
+        self.comida[ganadores] += 1
+        self.entorno.consumir_comida_lote(celdas)
+
+    @staticmethod
+    def _buscar_en_celdas(celdas, valores, consultas, defecto):
+        """
+        Busca el valor de cada celda consultada entre unas pocas celdas ordenadas.
+
+        Evita armar una rejilla del tamaño del mapa: el costo depende de la
+        cantidad de celdas y consultas, no del área.
+
+        Args:
+            celdas (ndarray): Índices lineales de celda, ordenados y sin repetir
+            valores (ndarray): Valor de cada una de esas celdas
+            consultas (ndarray): Índices lineales a buscar
+            defecto (int): Valor para las celdas que no están
+
+        Returns:
+            ndarray: Un valor por consulta
+        """
+        posicion = np.minimum(np.searchsorted(celdas, consultas), len(celdas) - 1)
+        return np.where(celdas[posicion] == consultas, valores[posicion], defecto)
+
+    def _huir_de_depredadores(self, indices):
+        """
+        Las partículas que huyen (rojas) con un depredador adyacente intentan alejarse de él.
+
+        Args:
+            indices (ndarray): Índices de partículas activas que huyen de depredadores
+        """
+        if len(indices) == 0 or len(self.dep_x) == 0:
+            return
+        ancho, alto = self.entorno.ancho, self.entorno.alto
+
+        # Celdas con depredadores y el índice del primero de la lista en cada una
+        # (return_index da la primera aparición)
+        sin_depredador = len(self.dep_x)
+        celdas, primero = np.unique(self.dep_x.astype(np.int64) * alto + self.dep_y,
+                                    return_index=True)
+
+        x = self.x[indices]
+        y = self.y[indices]
+        nx = x[:, None] + self.DX
+        ny = y[:, None] + self.DY
+        dentro = (nx >= 0) & (nx < ancho) & (ny >= 0) & (ny < alto)
+        vecinos = np.full(dentro.shape, sin_depredador, dtype=np.int32)
+        vecinos[dentro] = self._buscar_en_celdas(celdas, primero,
+                                                 nx[dentro].astype(np.int64) * alto + ny[dentro],
+                                                 sin_depredador)
+
+        # Igual que la búsqueda lineal: se huye del primer depredador de la lista
+        cercano = vecinos.min(axis=1)
+        amenazadas = cercano < sin_depredador
+        if not amenazadas.any():
+            return
+        direccion = np.argmin(vecinos[amenazadas], axis=1)
+        indices = indices[amenazadas]
+        hx = x[amenazadas] - self.DX[direccion]
+        hy = y[amenazadas] - self.DY[direccion]
+
+        exito = (hx >= 0) & (hx < ancho) & (hy >= 0) & (hy < alto)
+        indices = indices[exito]
+        self.x[indices] = hx[exito]
+        self.y[indices] = hy[exito]
+        self.en_casa[indices] = self._es_casa(hx[exito], hy[exito])
+
+    def _mover_depredadores(self):
+        """Mueve los depredadores sin permitirles entrar a la zona segura."""
+        if len(self.dep_x) == 0:
+            return
+        ancho, alto = self.entorno.ancho, self.entorno.alto
+        nx = self.dep_x[:, None] + self.DX
+        ny = self.dep_y[:, None] + self.DY
+        validas = (nx >= 1) & (nx <= ancho - 2) & (ny >= 1) & (ny <= alto - 2)
+        direcciones, puede_moverse = self._elegir_direcciones(validas)
+        self.dep_x = np.where(puede_moverse, self.dep_x + self.DX[direcciones], self.dep_x)
+        self.dep_y = np.where(puede_moverse, self.dep_y + self.DY[direcciones], self.dep_y)
+
+    def _procesar_ataques_depredadores(self):
+        """
+        Procesa los ataques de depredadores a partículas.
+        Los depredadores solo pueden atacar FUERA de la zona segura.
+
+        Returns:
+            int: Muertes causadas en este paso
+        """
+        if len(self.dep_x) == 0:
+            return 0
+        alto = self.entorno.alto
+        atacan = ~self._es_casa(self.dep_x, self.dep_y)
+        lineal_dep = self.dep_x[atacan].astype(np.int64) * alto + self.dep_y[atacan]
+        if len(lineal_dep) == 0:
+            return 0
+
+        expuestas = np.flatnonzero(self.viva & ~self.en_casa)
+        if len(expuestas) == 0:
+            return 0
+        lineal = self.x[expuestas].astype(np.int64) * alto + self.y[expuestas]
+        celdas, cantidad = np.unique(lineal_dep, return_counts=True)
+        depredadores_aqui = self._buscar_en_celdas(celdas, cantidad, lineal, 0)
+
+        # Cada depredador muerde una vez; tras morir, la partícula ya no recibe más mordidas
+        mordidas = self.mordidas[expuestas]
+        faltantes = self.MORDIDAS_PARA_MORIR[self.mutacion[expuestas]] - mordidas
+        mordidas = mordidas + np.minimum(depredadores_aqui, faltantes)
+        self.mordidas[expuestas] = mordidas
+
+        mueren = depredadores_aqui >= faltantes
+        self.viva[expuestas[mueren]] = False
+        return int(mueren.sum())
+
+    def _realizar_paso(self):
+        """
+        Avanza un paso a toda la población y a los depredadores.
+
+        Returns:
+            int: Muertes por depredador en este paso
+        """
+        en_reposo = self.en_casa & (self.comida >= self.COMIDA_MINIMA_CASA[self.mutacion])
+        activas = np.flatnonzero(self.viva & ~en_reposo)
+
+        mutacion_activas = self.mutacion[activas]
+        self._huir_de_depredadores(activas[self.HUYE_DE_DEPREDADORES[mutacion_activas]])
+
+        # Paso extra según la probabilidad de cada mutación (solo sortean las que la tienen)
+        prob_extra = self.PROB_PASO_EXTRA[mutacion_activas]
+        con_extra = prob_extra > 0
+        extra = activas[con_extra][self.rng.random(int(con_extra.sum())) < prob_extra[con_extra]]
+        self._paso_individual(activas)
+        self._paso_individual(extra)
+
+        self._mover_depredadores()
+        return self._procesar_ataques_depredadores()
+
+    def iniciar_dia(self, mostrar_progreso=False):
+        """
+        Comienza un nuevo día: genera los depredadores si corresponde.
+
+        Args:
+            mostrar_progreso (bool): Si True, muestra información del día
+
+        Returns:
+            int: Número de depredadores que aparecieron
+        """
+        if mostrar_progreso:
+            print(f"\n{'='*70}")
+            print(f"DÍA {self.dia_actual}")
+            print(f"{'='*70}")
+            print(f"Partículas vivas: {self.num_particulas}")
+            print(f"Pasos por día: {self.pasos_por_dia}")
+            print(f"Comida disponible: {self.entorno.comida_actual}")
+
+        self.paso_actual = 0
+        self.muertes_en_dia = 0
+        self.depredadores_en_dia = 0
+        if self._generar_depredadores():
+            self.depredadores_en_dia = len(self.dep_x)
+            if mostrar_progreso:
+                print(f"APARECEN {self.depredadores_en_dia} DEPREDADOR(ES)")
+
+        self.dia_en_curso = True
+        return self.depredadores_en_dia
+
+    def avanzar_paso(self, n=1, mostrar_progreso=False):
+        """
+        Avanza n pasos del día en curso (sin pasar del final del día).
+
+        Args:
+            n (int): Cuántos pasos avanzar
+            mostrar_progreso (bool): Si True, muestra el progreso cada 20 pasos
+
+        Returns:
+            int: Muertes por depredador en estos pasos
+        """
+        muertes = 0
+        for _ in range(min(n, self.pasos_por_dia - self.paso_actual)):
+            muertes += self._realizar_paso()
+            self.paso_actual += 1
+            if mostrar_progreso and self.paso_actual % 20 == 0:
+                progreso = (self.paso_actual / self.pasos_por_dia) * 100
+                print(f"  Progreso del día: {progreso:.0f}%")
+        self.muertes_en_dia += muertes
+        return muertes
+
+    @property
+    def dia_terminado(self):
+        """True si el día en curso ya dio todos sus pasos."""
+        return self.paso_actual >= self.pasos_por_dia
+
+    def cerrar_dia(self, mostrar_progreso=False):
+        """
+        Resuelve el final del día y prepara el siguiente.
+
+        Args:
+            mostrar_progreso (bool): Si True, muestra el resumen del día
+
+        Returns:
+            dict: Estadísticas del día
+        """
+        estadisticas = self._evaluar_fin_dia(mostrar_progreso, self.depredadores_en_dia,
+                                             self.muertes_en_dia)
+
+        self.dep_x = np.empty(0, dtype=np.int32)
+        self.dep_y = np.empty(0, dtype=np.int32)
+        self._preparar_siguiente_dia()
+        self.dia_en_curso = False
+
+        return estadisticas
+
+    def simular_dia(self, mostrar_progreso=False):
+        """
+        Simula un día completo.
+
+        Args:
+            mostrar_progreso (bool): Si True, muestra información del progreso
+
+        Returns:
+            dict: Estadísticas del día
+        """
+        if not self.dia_en_curso:
+            self.iniciar_dia(mostrar_progreso)
+        self.avanzar_paso(self.pasos_por_dia, mostrar_progreso)
+        return self.cerrar_dia(mostrar_progreso)
+
+    @staticmethod
+    def _sortear_mutaciones_hijos(mutacion, comida, sorteo):
+        """
+        Aplica en lote las tablas de descendencia de REGLAS_MUTACION.
+
+        Args:
+            mutacion (ndarray): Mutación de cada padre
+            comida (ndarray): Comida que consumió cada padre
+            sorteo (ndarray): Un número uniforme en [0, 1) por padre
+
+        Returns:
+            ndarray: Mutación del hijo de cada padre (int8)
+        """
+        mutacion_hijo = np.zeros(len(mutacion), dtype=np.int8)
+        for codigo, reglas in enumerate(REGLAS_MUTACION):
+            pendientes = mutacion == codigo
+            for comida_minima, opciones in reglas.descendencia:
+                nivel = pendientes & (comida >= comida_minima)
+                pendientes &= ~nivel
+                # La primera opción cuya probabilidad acumulada supera el sorteo
+                elegida = np.full(len(mutacion), opciones[-1][0], dtype=np.int8)
+                for hijo, acumulada in reversed(opciones[:-1]):
+                    elegida[sorteo < acumulada] = hijo
+                mutacion_hijo[nivel] = elegida[nivel]
+        return mutacion_hijo
+
+    def _evaluar_fin_dia(self, mostrar_info=False, num_depredadores=0, muertes_por_depredador=0):
+        """
+        Evalúa en lote qué partículas sobreviven y se reproducen al final del día.
+
+        Args:
+            mostrar_info (bool): Si True, muestra información
+            num_depredadores (int): Número de depredadores que aparecieron
+            muertes_por_depredador (int): Número de muertes causadas por depredadores
+
+        Returns:
+            dict: Estadísticas del día
+        """
+        mutacion = self.mutacion
+        comida = self.comida
+        comida_total_consumida = int(comida[self.viva].sum())
+
+        sobrevive = self.viva & self.en_casa & (
+            (comida >= self.COMIDA_SUPERVIVENCIA[mutacion]) | (comida == 0))
+        reproduce = sobrevive & (comida >= self.COMIDA_REPRODUCCION[mutacion])
+
+        # Mutación del hijo según la tabla de descendencia del padre
+        mutacion_hijo = self._sortear_mutaciones_hijos(mutacion, comida,
+                                                       self.rng.random(len(mutacion)))
+
+        # Cada sobreviviente va seguido de su hijo, como en la lista original
+        padres = np.flatnonzero(sobrevive)
+        copias = 1 + reproduce[padres]
+        orden = np.repeat(padres, copias)
+        es_hijo = np.zeros(len(orden), dtype=bool)
+        es_hijo[np.cumsum(copias)[reproduce[padres]] - 1] = True
+
+        muertes = len(mutacion) - len(padres)
+        reproducciones = int(es_hijo.sum())
+        mutaciones_hijos = mutacion_hijo[orden[es_hijo]]
+        mutaciones_velocidad = int((mutaciones_hijos == self.VELOCIDAD).sum())
+        mutaciones_prioridad = int((mutaciones_hijos == self.PRIORIDAD).sum())
+
+        ids = self.ids[orden]
+        ids[es_hijo] = np.arange(self.contador_id, self.contador_id + reproducciones)
+        self.contador_id += reproducciones
+
+        self.ids = ids
+        self.inicio_x = self.inicio_x[orden]
+        self.inicio_y = self.inicio_y[orden]
+        self.generacion = self.generacion[orden] + es_hijo
+        self.mutacion = np.where(es_hijo, mutacion_hijo[orden], mutacion[orden]).astype(np.int8)
+
+        conteo = np.bincount(self.mutacion, minlength=3)
+        particulas_finales = len(self.ids)
+
+        estadisticas = {
+            'dia': self.dia_actual,
+            'particulas_iniciales': particulas_finales + muertes,
+            'particulas_finales': particulas_finales,
+            'muertes': muertes,
+            'reproducciones': reproducciones,
+            'comida_consumida': comida_total_consumida,
+            'comida_restante': self.entorno.comida_actual,
+            'comida_inicial': self.entorno.comida_total,
+            'porcentaje_comida': self.entorno.porcentaje_comida_actual,
+            'tipo_dia': self.entorno.obtener_info_comida()['tipo_dia'],
+            'normales': int(conteo[self.NINGUNA]),
+            'velocidad': int(conteo[self.VELOCIDAD]),
+            'prioridad': int(conteo[self.PRIORIDAD]),
+            'nuevas_mutaciones_velocidad': mutaciones_velocidad,
+            'nuevas_mutaciones_prioridad': mutaciones_prioridad,
+            'depredadores_aparecidos': num_depredadores,
+            'muertes_por_depredador': muertes_por_depredador
+        }
+
+        self.historial_dias.append(estadisticas)
+
+        if mostrar_info:
+            print(f"\n  RESUMEN DEL DÍA {self.dia_actual}:")
+            print(f"  Partículas al inicio: {estadisticas['particulas_iniciales']}")
+            print(f"  Muertes: {muertes}")
+            if muertes_por_depredador > 0:
+                print(f"    - Por depredadores: {muertes_por_depredador}")
+            print(f"  Reproducciones: {reproducciones}")
+            print(f"  Partículas sobrevivientes: {particulas_finales}")
+            print(f"  Comida consumida: {comida_total_consumida}")
+            print(f"  Comida restante: {self.entorno.comida_actual}")
+
+        return estadisticas
+
+    def _preparar_siguiente_dia(self):
+        """Prepara la población y la comida para el siguiente día."""
+        self.dia_actual += 1
+        self.entorno.reestablecer_comida()
+        self._reiniciar_estado_diario()
+
+    def obtener_posiciones(self):
+        """
+        Posiciones de partículas y depredadores por columnas, para grabar el día.
+
+        Los depredadores no tienen identificador en este motor: se devuelven con id -1.
+
+        Returns:
+            dict: Arreglos 'id', 'x', 'y', 'mutacion', 'viva' y 'depredador'
+        """
+        n = len(self.dep_x)
+        return {
+            'id': np.concatenate([self.ids, np.full(n, -1, dtype=np.int64)]),
+            'x': np.concatenate([self.x, self.dep_x]),
+            'y': np.concatenate([self.y, self.dep_y]),
+            'mutacion': np.concatenate([self.mutacion, np.zeros(n, dtype=np.int8)]),
+            'viva': np.concatenate([self.viva, np.ones(n, dtype=bool)]),
+            'depredador': np.concatenate([np.zeros(len(self.ids), dtype=bool),
+                                          np.ones(n, dtype=bool)]),
+        }
+
+    def exportar_estado(self):
+        """
+        Estado completo de la simulación entre dos días, para un punto de control.
+
+        Los arreglos de población se guardan tal cual; el estado diario
+        (posición, comida, mordidas) no hace falta porque entre días se
+        reinicia desde la casa.
+
+        Returns:
+            dict: Estado serializable
+
+        Raises:
+            ValueError: Si hay un día en curso
+        """
+        if self.dia_en_curso:
+            raise ValueError("Solo se puede exportar el estado entre dos dias")
+
+        return {
+            'motor': 'vectorizado',
+            'entorno': self.entorno.exportar_estado(),
+            'num_particulas_inicial': self.num_particulas_inicial,
+            'pasos_por_dia': self.pasos_por_dia,
+            'frecuencia_depredadores': self.frecuencia_depredadores,
+            'cantidad_depredadores': self.cantidad_depredadores,
+            'dia_actual': self.dia_actual,
+            'contador_id': self.contador_id,
+            'historial_dias': copiar_historial(self.historial_dias),
+            'rng': self.rng,
+            'particulas': {
+                'ids': self.ids,
+                'inicio_x': self.inicio_x,
+                'inicio_y': self.inicio_y,
+                'generacion': self.generacion,
+                'mutacion': self.mutacion,
+            },
+        }
+
+    @classmethod
+    def desde_estado(cls, estado):
+        """
+        Reconstruye una simulación a partir de exportar_estado().
+
+        No pasa por el constructor, que derivaría un flujo aleatorio nuevo
+        y sortearía una población.
+
+        Args:
+            estado (dict): Estado guardado
+
+        Returns:
+            SimulacionVectorizada: La simulación, lista para seguir con el día guardado
+        """
+        simulacion = cls.__new__(cls)
+        simulacion.entorno = Entorno.desde_estado(estado['entorno'])
+        for clave in ('num_particulas_inicial', 'pasos_por_dia', 'frecuencia_depredadores',
+                      'cantidad_depredadores', 'dia_actual', 'contador_id', 'rng'):
+            setattr(simulacion, clave, estado[clave])
+        simulacion.historial_dias = copiar_historial(estado['historial_dias'])
+        for clave, valores in estado['particulas'].items():
+            setattr(simulacion, clave, valores)
+        simulacion._reiniciar_estado_diario()
+        simulacion.dep_x = np.empty(0, dtype=np.int32)
+        simulacion.dep_y = np.empty(0, dtype=np.int32)
+        simulacion.dia_en_curso = False
+        simulacion.paso_actual = 0
+        simulacion.muertes_en_dia = 0
+        simulacion.depredadores_en_dia = 0
+        return simulacion
+
+    def guardar_punto_control(self, ruta):
+        """
+        Guarda el estado de la simulación en un archivo binario (escritura atómica).
+
+        Args:
+            ruta (str): Archivo de destino
+        """
+        punto_control.guardar_estado(self.exportar_estado(), ruta)
+
+    @classmethod
+    def desde_punto_control(cls, ruta):
+        """
+        Restaura una simulación guardada con guardar_punto_control.
+
+        Args:
+            ruta (str): Archivo del punto de control
+
+        Returns:
+            SimulacionVectorizada: La simulación restaurada
+        """
+        return cls.desde_estado(punto_control.cargar_estado(ruta))
+
+    def ejecutar_simulacion_completa(self, max_dias=100, mostrar_progreso=True,
+                                     ruta_punto_control=None, cada_n_dias=10, grabador=None):
+        """
+        Ejecuta la simulación completa hasta que no queden partículas o se alcance el límite.
+
+        Args:
+            max_dias (int): Número máximo de días a simular
+            mostrar_progreso (bool): Si True, muestra el progreso
+            ruta_punto_control (str): Si se indica, guarda ahí un punto de control
+                cada cada_n_dias días y al terminar
+            cada_n_dias (int): Cada cuántos días guardar el punto de control
+            grabador (GrabadorTrayectorias): Si se indica, graba cada paso para
+                reproducirlo después con Visualizador.reproducir_grabacion
+
+        Returns:
+            list: Historial completo de la simulación
+        """
+        print(f"\n{'='*70}")
+        if self.dia_actual > 1:
+            print(f"REANUDANDO SIMULACIÓN DE POBLACIÓN EN EL DÍA {self.dia_actual} (MOTOR VECTORIZADO)")
+        else:
+            print("INICIANDO SIMULACIÓN DE POBLACIÓN (MOTOR VECTORIZADO)")
+        print(f"{'='*70}")
+        print(f"Dimensiones del entorno: {self.entorno.obtener_dimensiones()}")
+        print(f"Partículas iniciales: {self.num_particulas_inicial}")
+        print(f"Pasos por día: {self.pasos_por_dia}")
+        print(f"Comida inicial: {self.entorno.comida_total}")
+        print(f"{'='*70}\n")
+
+        while self.num_particulas > 0 and self.dia_actual <= max_dias:
+            if grabador is not None:
+                estadisticas = grabador.simular_dia(self, mostrar_progreso=mostrar_progreso)
+            else:
+                estadisticas = self.simular_dia(mostrar_progreso=mostrar_progreso)
+
+            if not mostrar_progreso and self.dia_actual % 5 == 0:
+                print(f"Día {self.dia_actual - 1}: {estadisticas['particulas_finales']} partículas vivas")
+
+            if ruta_punto_control and (self.dia_actual - 1) % cada_n_dias == 0:
+                self.guardar_punto_control(ruta_punto_control)
+
+        if ruta_punto_control:
+            self.guardar_punto_control(ruta_punto_control)
+
+        if isinstance(self.historial_dias, AlmacenHistorial):
+            self.historial_dias.guardar()
+
+        print(f"\n{'='*70}")
+        print("SIMULACIÓN FINALIZADA")
+        print(f"{'='*70}")
+
+        if self.num_particulas == 0:
+            print(f"Todas las partículas han muerto en el día {self.dia_actual - 1}")
+        else:
+            print(f"Simulación detenida en el día {self.dia_actual - 1}")
+            print(f"Partículas sobrevivientes: {self.num_particulas}")
+
+        print(f"{'='*70}\n")
+
+        return self.historial_dias
+
+    def obtener_estado_actual(self):
+        """
+        Obtiene el estado actual de la simulación.
+
+        Returns:
+            dict: Estado actual
+        """
+        return {
+            'dia': self.dia_actual,
+            'num_particulas': self.num_particulas,
+            'particulas': [
+                {
+                    'id': int(self.ids[i]),
+                    'generacion': int(self.generacion[i]),
+                    'posicion': (int(self.x[i]), int(self.y[i])),
+                    'comida_consumida': int(self.comida[i]),
+                    'viva': bool(self.viva[i]),
+                    'en_casa': bool(self.en_casa[i]),
+                    'mutacion': self.NOMBRES_MUTACION[self.mutacion[i]],
+                    'mordidas_recibidas': int(self.mordidas[i])
+                }
+                for i in range(self.num_particulas)
+            ],
+            'comida_restante': self.entorno.comida_actual,
+            'historial': self.historial_dias
+        }
@@ -1,10 +1,180 @@
-import random
+from collections import namedtuple
+from enum import IntEnum
+
+from rastro import RASTRO_COMPLETO
+
+
+class Mutacion(IntEnum):
+    """Tipos de mutación. Los valores coinciden con los códigos del motor vectorizado."""
+    NINGUNA = 0
+    VELOCIDAD = 1
+    PRIORIDAD = 2
+    
+    @staticmethod
+    def desde_valor(valor):
+        """
+        Convierte un nombre o código de mutación en Mutacion.
+        
+        Args:
+            valor (str, int o Mutacion): 'ninguna', 'velocidad', 'prioridad' o su código
+            
+        Returns:
+            Mutacion: El tipo de mutación
+        """
+        if isinstance(valor, str):
+            return Mutacion[valor.upper()]
+        return _MUTACIONES[valor]
+
+
+# Mutaciones indexadas por código (más rápido que llamar a Mutacion(codigo))
+_MUTACIONES = tuple(Mutacion)
+
+
+# Rasgos de cada tipo de mutación:
+#   comida_minima_casa: comida con la que una partícula en casa deja de moverse
+#   comida_supervivencia: comida mínima para sobrevivir (estando en casa)
+#   comida_reproduccion: comida mínima para tener un hijo
+#   mordidas_para_morir: mordidas de depredador que soporta
+#   prob_paso_extra: probabilidad de dar un segundo paso en cada turno
+#   prioridad_comida: si gana la comida en disputa frente a las demás
+#   huye_de_depredadores: si detecta depredadores vecinos y se aleja
+#   descendencia: niveles (comida_minima, opciones) de mayor a menor; se usa el
+#       primero que alcance la comida. Las opciones son pares (mutación del
+#       hijo, probabilidad acumulada) y se sortean con un solo rng.random()
+#   color, velocidad: color y multiplicador de velocidad para mostrar
+ReglasMutacion = namedtuple('ReglasMutacion', [
+    'comida_minima_casa', 'comida_supervivencia', 'comida_reproduccion',
+    'mordidas_para_morir', 'prob_paso_extra', 'prioridad_comida',
+    'huye_de_depredadores', 'descendencia', 'color', 'velocidad'
+])
+
+# Indexadas por Mutacion
+REGLAS_MUTACION = (
+    ReglasMutacion(  # NINGUNA (blanca)
+        comida_minima_casa=1, comida_supervivencia=1, comida_reproduccion=2,
+        mordidas_para_morir=1, prob_paso_extra=0.0, prioridad_comida=False,
+        huye_de_depredadores=False,
+        descendencia=((3, ((Mutacion.VELOCIDAD, 0.5), (Mutacion.PRIORIDAD, 1.0))),
+                      (2, ((Mutacion.NINGUNA, 1.0),))),
+        color=(1.0, 1.0, 1.0), velocidad=1.0),
+    ReglasMutacion(  # VELOCIDAD (roja)
+        comida_minima_casa=2, comida_supervivencia=2, comida_reproduccion=3,
+        mordidas_para_morir=1, prob_paso_extra=0.5, prioridad_comida=False,
+        huye_de_depredadores=True,
+        descendencia=((3, ((Mutacion.VELOCIDAD, 0.75), (Mutacion.NINGUNA, 1.0))),),
+        color=(1.0, 0.0, 0.0), velocidad=1.5),
+    ReglasMutacion(  # PRIORIDAD (verde)
+        comida_minima_casa=1, comida_supervivencia=1, comida_reproduccion=2,
+        mordidas_para_morir=2, prob_paso_extra=0.0, prioridad_comida=True,
+        huye_de_depredadores=False,
+        descendencia=((2, ((Mutacion.PRIORIDAD, 0.75), (Mutacion.NINGUNA, 1.0))),),
+        color=(0.0, 1.0, 0.0), velocidad=1.0),
+)
+
+
+class ContadoresPoblacion:
+    """
+    Conteos de la población viva que se mantienen al día sin recorrerla.
+    
+    Las partículas de una simulación comparten un mismo objeto y lo
+    actualizan ellas mismas cuando entran o salen de la casa, cuando llegan
+    a la comida de supervivencia y cuando reciben una mordida o mueren por
+    un depredador. Los nacimientos y las muertes del final del día los
+    registra quien evalúa el día (Simulacion). Así las estadísticas y la
+    interfaz consultan los conteos en tiempo constante.
+    
+    Attributes:
+        vivas (list): Partículas vivas por tipo, indexadas por Mutacion
+        en_casa (int): Partículas vivas que están en la casa
+        alimentadas (int): Partículas vivas con la comida de supervivencia de su tipo
+        mordidas (int): Partículas vivas con al menos una mordida
+    """
+    
+    __slots__ = ('vivas', 'en_casa', 'alimentadas', 'mordidas')
+    
+    def __init__(self, particulas=()):
+        """
+        Inicializa los conteos.
+        
+        Args:
+            particulas (iterable): Partículas vivas con las que empezar
+        """
+        self.vivas = [0, 0, 0]
+        self.en_casa = 0
+        self.alimentadas = 0
+        self.mordidas = 0
+        for particula in particulas:
+            self.agregar(particula)
+    
+    @property
+    def total(self):
+        """Partículas vivas de todos los tipos."""
+        return sum(self.vivas)
+    
+    def agregar(self, particula):
+        """
+        Cuenta una partícula que nace o se incorpora.
+        
+        Args:
+            particula (Particula): La partícula (viva)
+        """
+        self.vivas[particula.tipo_mutacion] += 1
+        self.en_casa += particula.en_casa
+        self.alimentadas += particula.comida_consumida >= particula.reglas.comida_supervivencia
+        self.mordidas += particula.mordidas_recibidas > 0
+    
+    def quitar(self, particula):
+        """
+        Descuenta una partícula que muere.
+        
+        Args:
+            particula (Particula): La partícula, con el estado que tenía al morir
+        """
+        self.vivas[particula.tipo_mutacion] -= 1
+        self.en_casa -= particula.en_casa
+        self.alimentadas -= particula.comida_consumida >= particula.reglas.comida_supervivencia
+        self.mordidas -= particula.mordidas_recibidas > 0
+    
+    def nuevo_dia(self):
+        """Al empezar el día todas están en casa, sin comida y sin mordidas."""
+        self.en_casa = self.total
+        self.alimentadas = 0
+        self.mordidas = 0
+    
+    def como_dict(self):
+        """
+        Copia de los conteos, con los mismos nombres de tipo que el historial.
+        
+        Returns:
+            dict: 'vivas', 'normales', 'velocidad', 'prioridad', 'en_casa',
+                  'alimentadas' y 'mordidas'
+        """
+        normales, velocidad, prioridad = self.vivas
+        return {
+            'vivas': normales + velocidad + prioridad,
+            'normales': normales,
+            'velocidad': velocidad,
+            'prioridad': prioridad,
+            'en_casa': self.en_casa,
+            'alimentadas': self.alimentadas,
+            'mordidas': self.mordidas,
+        }
+
 
 class Particula:
     """
     Representa una partícula (ser vivo) en la simulación.
+    
+    Usa __slots__: no hay __dict__ por instancia. La mutación se guarda como
+    un entero pequeño (tipo_mutacion) y sus rasgos (reglas) se toman de
+    REGLAS_MUTACION en lugar de guardarse en cada partícula.
     """
     
+    __slots__ = ('id', 'entorno', 'generacion', 'tipo_mutacion', 'reglas', 'es_depredador',
+                 'mordidas_recibidas', 'politica_rastro', 'pos_inicial', 'posicion_actual',
+                 'comida_consumida', 'camino', 'pasos_realizados', 'viva', 'en_casa',
+                 'contadores')
+    
     # Direcciones posibles: arriba, abajo, izquierda, derecha
     DIRECCIONES = [
         (0, -1),   # Arriba
@@ -14,12 +184,16 @@ class Particula:
     ]
     
     # Colores según tipo de partícula
-    COLOR_NORMAL = (1.0, 1.0, 1.0)      # Blanco
-    COLOR_VELOCIDAD = (1.0, 0.0, 0.0)   # Rojo
-    COLOR_PRIORIDAD = (0.0, 1.0, 0.0)   # Verde
+    COLOR_NORMAL = REGLAS_MUTACION[Mutacion.NINGUNA].color        # Blanco
+    COLOR_VELOCIDAD = REGLAS_MUTACION[Mutacion.VELOCIDAD].color   # Rojo
+    COLOR_PRIORIDAD = REGLAS_MUTACION[Mutacion.PRIORIDAD].color   # Verde
     COLOR_DEPREDADOR = (0.0, 0.0, 0.0)  # Negro
     
-    def __init__(self, id, entorno, pos_inicial=None, generacion=0, mutacion='ninguna', es_depredador=False):
+    # Indexados por Mutacion
+    NOMBRES_MUTACION = ('ninguna', 'velocidad', 'prioridad')
+    
+    def __init__(self, id, entorno, pos_inicial=None, generacion=0, mutacion='ninguna', es_depredador=False,
+                 politica_rastro=RASTRO_COMPLETO, contadores=None):
         """
         Inicializa una partícula.
         
@@ -28,29 +202,20 @@ class Particula:
             entorno (Entorno): El entorno de la simulación
             pos_inicial (tuple): Posición inicial. Si es None, se asigna aleatoria
             generacion (int): Número de generación
-            mutacion (str): Tipo de mutación ('ninguna', 'velocidad', 'prioridad')
+            mutacion (str o Mutacion): Tipo de mutación ('ninguna', 'velocidad', 'prioridad')
             es_depredador (bool): Si es un depredador
+            politica_rastro (PoliticaRastro): Cómo guardar el camino del día
+            contadores (ContadoresPoblacion): Conteos de la población que la partícula
+                mantiene al día (quien la crea debe contarla con agregar)
         """
         self.id = id
         self.entorno = entorno
         self.generacion = generacion
-        self.mutacion = mutacion
+        self.tipo_mutacion = Mutacion.desde_valor(mutacion)
+        self.reglas = REGLAS_MUTACION[self.tipo_mutacion]
         self.es_depredador = es_depredador
         self.mordidas_recibidas = 0
-        
-        # Establecer color según tipo
-        if es_depredador:
-            self.color = self.COLOR_DEPREDADOR
-            self.velocidad_multiplicador = 1.0
-        elif mutacion == 'velocidad':
-            self.color = self.COLOR_VELOCIDAD
-            self.velocidad_multiplicador = 1.5
-        elif mutacion == 'prioridad':
-            self.color = self.COLOR_PRIORIDAD
-            self.velocidad_multiplicador = 1.0
-        else:  # ninguna
-            self.color = self.COLOR_NORMAL
-            self.velocidad_multiplicador = 1.0
+        self.politica_rastro = politica_rastro
         
         if pos_inicial is None:
             self.pos_inicial = entorno.obtener_posicion_inicial_aleatoria(es_depredador=es_depredador)
@@ -59,33 +224,63 @@ class Particula:
         
         self.posicion_actual = self.pos_inicial
         self.comida_consumida = 0
-        self.camino = [self.posicion_actual]
+        self.camino = politica_rastro.nuevo(self.posicion_actual)
         self.pasos_realizados = 0
         self.viva = True
         self.en_casa = True
+        self.contadores = contadores
+    
+    @property
+    def mutacion(self):
+        """Nombre de la mutación ('ninguna', 'velocidad' o 'prioridad')."""
+        return self.NOMBRES_MUTACION[self.tipo_mutacion]
+    
+    @property
+    def color(self):
+        """Color según el tipo de partícula."""
+        if self.es_depredador:
+            return self.COLOR_DEPREDADOR
+        return self.reglas.color
+    
+    @property
+    def velocidad_multiplicador(self):
+        """Multiplicador de velocidad según el tipo de partícula."""
+        if self.es_depredador:
+            return 1.0
+        return self.reglas.velocidad
+    
+    def copiar(self):
+        """
+        Copia superficial de la partícula, sin pasar por el constructor.
+        
+        La copia comparte el rastro del camino con la original.
+        
+        Returns:
+            Particula: La copia
+        """
+        copia = Particula.__new__(Particula)
+        for nombre in self.__slots__:
+            setattr(copia, nombre, getattr(self, nombre))
+        return copia
     
     def detectar_depredador_cercano(self, depredadores):
         """
         Detecta si hay un depredador a un paso de distancia.
         
+        La búsqueda usa el índice de depredadores del entorno, consultando
+        solo las cuatro celdas vecinas en lugar de recorrer la lista.
+        
         Args:
             depredadores (list): Lista de depredadores en el mapa
             
         Returns:
             tuple: Posición del depredador más cercano o None
         """
-        if not self.mutacion == 'velocidad':
+        if not self.reglas.huye_de_depredadores or not depredadores:
             return None
         
         x, y = self.posicion_actual
-        
-        for depredador in depredadores:
-            dx, dy = depredador.posicion_actual
-            # Verificar si está a exactamente un paso
-            if abs(x - dx) + abs(y - dy) == 1:
-                return depredador.posicion_actual
-        
-        return None
+        return self.entorno.depredador_adyacente(x, y)
     
     def huir_de_depredador(self, pos_depredador):
         """
@@ -109,16 +304,7 @@ class Particula:
         nueva_y = y + dir_y
         
         if self.entorno.es_posicion_valida(nueva_x, nueva_y):
-            self.posicion_actual = (nueva_x, nueva_y)
-            self.camino.append(self.posicion_actual)
-            self.pasos_realizados += 1
-            
-            # Actualizar estado de casa
-            if self.entorno.es_casa(nueva_x, nueva_y):
-                self.en_casa = True
-            else:
-                self.en_casa = False
-            
+            self._mover_a(nueva_x, nueva_y)
             return True
         
         return False
@@ -141,31 +327,23 @@ class Particula:
         if self.es_depredador:
             return self._realizar_paso_individual()
         
-        # Determinar comida mínima para quedarse en casa según mutación
-        if self.mutacion == 'velocidad':
-            comida_minima_casa = 2
-        else:
-            comida_minima_casa = 1
+        reglas = self.reglas
         
         # Si está en casa y ya tiene la comida mínima para sobrevivir, no se mueve
-        if self.en_casa and self.comida_consumida >= comida_minima_casa:
+        if self.en_casa and self.comida_consumida >= reglas.comida_minima_casa:
             return True
         
-        # Partículas rojas detectan y huyen de depredadores
-        if self.mutacion == 'velocidad' and depredadores:
+        # Las que tienen el rasgo (rojas) detectan y huyen de depredadores
+        if reglas.huye_de_depredadores and depredadores:
             pos_depredador = self.detectar_depredador_cercano(depredadores)
             if pos_depredador:
-                # Intentar huir
-                if self.huir_de_depredador(pos_depredador):
-                    # Después de huir, sigue con su movimiento normal
-                    pass
+                # Después de huir, sigue con su movimiento normal
+                self.huir_de_depredador(pos_depredador)
         
         # Calcular cuántos pasos realizar (velocidad)
         pasos_a_realizar = 1
-        if self.mutacion == 'velocidad':
-            # 50% de probabilidad de hacer un paso extra
-            if random.random() < 0.5:
-                pasos_a_realizar = 2
+        if reglas.prob_paso_extra and self.entorno.rng.random() < reglas.prob_paso_extra:
+            pasos_a_realizar = 2
         
         exito = False
         for _ in range(pasos_a_realizar):
@@ -181,40 +359,54 @@ class Particula:
         Returns:
             bool: True si el paso fue exitoso
         """
-        # Intentar movimiento aleatorio
-        max_intentos = 100
-        for _ in range(max_intentos):
-            direccion = random.choice(self.DIRECCIONES)
-            dx, dy = direccion
-            
-            nueva_x = self.posicion_actual[0] + dx
-            nueva_y = self.posicion_actual[1] + dy
-            
-            # Verificar si el movimiento es válido
-            if self.entorno.es_posicion_valida(nueva_x, nueva_y):
-                # RESTRICCIÓN: Los depredadores NO pueden entrar a la zona segura
-                if self.es_depredador and self.entorno.es_casa(nueva_x, nueva_y):
-                    continue  # Intentar otra dirección
-                
-                self.posicion_actual = (nueva_x, nueva_y)
-                self.camino.append(self.posicion_actual)
-                self.pasos_realizados += 1
-                
-                # Verificar si llegó a casa
-                if self.entorno.es_casa(nueva_x, nueva_y):
-                    self.en_casa = True
-                else:
-                    self.en_casa = False
-                
-                # Solo las partículas normales comen (depredadores no)
-                if not self.es_depredador:
-                    if self.entorno.hay_comida(nueva_x, nueva_y):
-                        if self.entorno.consumir_comida(nueva_x, nueva_y, self):
-                            self.comida_consumida += 1
-                
-                return True
+        x, y = self.posicion_actual
         
-        return False
+        # Un solo sorteo entre las direcciones válidas (los depredadores no entran a la casa)
+        opciones = self.entorno.movimientos_validos(x, y, self.es_depredador)
+        if not opciones:
+            return False
+        dx, dy = self.entorno.rng.choice(opciones)
+        nueva_x = x + dx
+        nueva_y = y + dy
+        
+        self._mover_a(nueva_x, nueva_y)
+        
+        # Solo las partículas normales comen (depredadores no)
+        if not self.es_depredador:
+            if self.entorno.hay_comida(nueva_x, nueva_y):
+                if self.entorno.consumir_comida(nueva_x, nueva_y, self):
+                    self.comida_consumida += 1
+                    if (self.comida_consumida == self.reglas.comida_supervivencia
+                            and self.contadores is not None):
+                        self.contadores.alimentadas += 1
+        
+        return True
+    
+    def _mover_a(self, nueva_x, nueva_y):
+        """
+        Mueve la partícula a una posición ya validada y actualiza su estado.
+        
+        Args:
+            nueva_x (int): Coordenada X destino
+            nueva_y (int): Coordenada Y destino
+        """
+        pos_anterior = self.posicion_actual
+        self.posicion_actual = (nueva_x, nueva_y)
+        self.camino.agregar(nueva_x, nueva_y)
+        self.pasos_realizados += 1
+        
+        # Verificar si llegó a casa (o si salió)
+        en_casa = self.entorno.es_casa(nueva_x, nueva_y)
+        if en_casa != self.en_casa:
+            self.en_casa = en_casa
+            if self.contadores is not None:
+                self.contadores.en_casa += 1 if en_casa else -1
+        
+        # Mantener los índices que usan los ataques y la huida
+        if self.es_depredador:
+            self.entorno.mover_depredador(self, pos_anterior, self.posicion_actual)
+        else:
+            self.entorno.mover_ocupante(self, pos_anterior, self.posicion_actual)
     
     def recibir_mordida(self):
         """
@@ -224,17 +416,15 @@ class Particula:
             bool: True si muere por la mordida
         """
         self.mordidas_recibidas += 1
-        
-        # Blancas y rojas mueren con 1 mordida
-        if self.mutacion in ['ninguna', 'velocidad']:
-            if self.mordidas_recibidas >= 1:
-                self.viva = False
-                return True
-        # Verdes mueren con 2 mordidas
-        elif self.mutacion == 'prioridad':
-            if self.mordidas_recibidas >= 2:
-                self.viva = False
-                return True
+        contadores = self.contadores
+        if contadores is not None and self.mordidas_recibidas == 1:
+            contadores.mordidas += 1
+        
+        if self.mordidas_recibidas >= self.reglas.mordidas_para_morir:
+            self.viva = False
+            if contadores is not None:
+                contadores.quitar(self)
+            return True
         
         return False
     
@@ -243,70 +433,65 @@ class Particula:
         Evalúa el estado de la partícula al final del día.
         
         Returns:
-            dict: Resultado con 'sobrevive', 'reproduce' y 'mutacion_hijo'
+            dict: Resultado con 'sobrevive', 'reproduce' y 'mutacion_hijo' (Mutacion)
         """
         resultado = {
             'sobrevive': False,
             'reproduce': False,
-            'mutacion_hijo': 'ninguna'
+            'mutacion_hijo': Mutacion.NINGUNA
         }
         
-        # Determinar requisitos según mutación
-        if self.mutacion == 'velocidad':
-            comida_minima_supervivencia = 2
-            comida_minima_reproduccion = 3
-        else:
-            comida_minima_supervivencia = 1
-            comida_minima_reproduccion = 2
+        reglas = self.reglas
+        comida = self.comida_consumida
         
         # Verificar supervivencia
-        if self.comida_consumida >= comida_minima_supervivencia and self.en_casa:
+        if comida >= reglas.comida_supervivencia and self.en_casa:
             resultado['sobrevive'] = True
             
             # Verificar reproducción
-            if self.comida_consumida >= comida_minima_reproduccion:
+            if comida >= reglas.comida_reproduccion:
                 resultado['reproduce'] = True
-                
-                # Determinar mutación del hijo
-                if self.mutacion == 'velocidad':
-                    if self.comida_consumida >= 3:
-                        if random.random() < 0.75:
-                            resultado['mutacion_hijo'] = 'velocidad'
-                        else:
-                            resultado['mutacion_hijo'] = 'ninguna'
-                    else:
-                        resultado['reproduce'] = False
-                        
-                elif self.mutacion == 'prioridad':
-                    if self.comida_consumida >= 3:
-                        if random.random() < 0.75:
-                            resultado['mutacion_hijo'] = 'prioridad'
-                        else:
-                            resultado['mutacion_hijo'] = 'ninguna'
-                    else:
-                        if random.random() < 0.75:
-                            resultado['mutacion_hijo'] = 'prioridad'
-                        else:
-                            resultado['mutacion_hijo'] = 'ninguna'
-                            
-                else:  # ninguna mutación
-                    if self.comida_consumida >= 3:
-                        resultado['mutacion_hijo'] = random.choice(['velocidad', 'prioridad'])
-                    else:
-                        resultado['mutacion_hijo'] = 'ninguna'
+                resultado['mutacion_hijo'] = self.sortear_mutacion_hijo(reglas, comida,
+                                                                        self.entorno.rng)
         
         # Caso especial: No comió pero está en casa
-        elif self.comida_consumida == 0 and self.en_casa:
+        elif comida == 0 and self.en_casa:
             resultado['sobrevive'] = True
         
         return resultado
     
+    @staticmethod
+    def sortear_mutacion_hijo(reglas, comida, rng):
+        """
+        Sortea la mutación del hijo según la tabla de descendencia del padre.
+        
+        Args:
+            reglas (ReglasMutacion): Reglas de la mutación del padre
+            comida (int): Comida que consumió el padre
+            rng (random.Random): Generador aleatorio
+            
+        Returns:
+            Mutacion: Mutación del hijo
+        """
+        for comida_minima, opciones in reglas.descendencia:
+            if comida >= comida_minima:
+                break
+        
+        if len(opciones) == 1:
+            return opciones[0][0]
+        
+        sorteo = rng.random()
+        for mutacion, acumulada in opciones:
+            if sorteo < acumulada:
+                return mutacion
+        return opciones[-1][0]
+    
     def preparar_nuevo_dia(self):
         """
         Prepara la partícula para un nuevo día.
         """
         self.comida_consumida = 0
-        self.camino = [self.pos_inicial]
+        self.camino = self.politica_rastro.nuevo(self.pos_inicial)
         self.pasos_realizados = 0
         self.posicion_actual = self.pos_inicial
         self.en_casa = True
@@ -318,7 +503,7 @@ class Particula:
         
         Args:
             nuevo_id (int): ID para la nueva partícula
-            mutacion_hijo (str): Tipo de mutación del hijo
+            mutacion_hijo (str o Mutacion): Tipo de mutación del hijo
             
         Returns:
             Particula: Nueva partícula hija
@@ -329,9 +514,51 @@ class Particula:
             pos_inicial=self.pos_inicial,
             generacion=self.generacion + 1,
             mutacion=mutacion_hijo,
-            es_depredador=False
+            es_depredador=False,
+            politica_rastro=self.politica_rastro,
+            contadores=self.contadores
         )
     
+    @classmethod
+    def crear_hijos(cls, padres, mutaciones, primer_id):
+        """
+        Crea de una vez los hijos de varias partículas, sin pasar por el constructor.
+        
+        Equivale a llamar a crear_hijo para cada padre con ids consecutivos.
+        
+        Args:
+            padres (list): Partículas que se reproducen
+            mutaciones (list): Mutación (Mutacion) del hijo de cada padre
+            primer_id (int): ID del primer hijo; los siguientes son consecutivos
+            
+        Returns:
+            list: Los hijos, en el orden de los padres
+        """
+        nuevo = cls.__new__
+        hijos = []
+        agregar = hijos.append
+        for nuevo_id, padre, mutacion in zip(range(primer_id, primer_id + len(padres)),
+                                             padres, mutaciones):
+            hijo = nuevo(cls)
+            hijo.id = nuevo_id
+            hijo.entorno = padre.entorno
+            hijo.generacion = padre.generacion + 1
+            hijo.tipo_mutacion = mutacion
+            hijo.reglas = REGLAS_MUTACION[mutacion]
+            hijo.es_depredador = False
+            hijo.mordidas_recibidas = 0
+            hijo.politica_rastro = padre.politica_rastro
+            hijo.pos_inicial = padre.pos_inicial
+            hijo.posicion_actual = padre.pos_inicial
+            hijo.comida_consumida = 0
+            hijo.camino = padre.politica_rastro.nuevo(padre.pos_inicial)
+            hijo.pasos_realizados = 0
+            hijo.viva = True
+            hijo.en_casa = True
+            hijo.contadores = padre.contadores
+            agregar(hijo)
+        return hijos
+    
     def obtener_info(self):
         """
         Obtiene información de la partícula.
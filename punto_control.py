@@ -0,0 +1,69 @@
+import os
+import pickle
+
+
+FORMATO = 'simulacion-poblacion/punto-control'
+VERSION = 1
+
+
+def guardar_estado(estado, ruta):
+    """
+    Escribe un estado de simulación en disco de forma atómica.
+
+    Se escribe primero en un archivo temporal junto al destino y luego se
+    reemplaza el destino, así que un corte a mitad de escritura nunca deja
+    un punto de control a medias: queda el anterior o el nuevo.
+
+    Args:
+        estado (dict): Estado devuelto por exportar_estado()
+        ruta (str): Archivo de destino
+    """
+    temporal = f"{ruta}.tmp"
+    with open(temporal, 'wb') as archivo:
+        pickle.dump({'formato': FORMATO, 'version': VERSION, 'estado': estado},
+                    archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+def cargar_estado(ruta):
+    """
+    Lee un estado de simulación escrito con guardar_estado.
+
+    Args:
+        ruta (str): Archivo del punto de control
+
+    Returns:
+        dict: El estado guardado
+
+    Raises:
+        ValueError: Si el archivo no es un punto de control de esta versión
+    """
+    with open(ruta, 'rb') as archivo:
+        contenido = pickle.load(archivo)
+    if not isinstance(contenido, dict) or contenido.get('formato') != FORMATO:
+        raise ValueError(f"{ruta} no es un punto de control de la simulacion")
+    if contenido['version'] != VERSION:
+        raise ValueError(f"Version de punto de control no soportada: {contenido['version']}")
+    return contenido['estado']
+
+
+def restaurar_simulacion(ruta):
+    """
+    Reconstruye la simulación guardada en un punto de control.
+
+    Args:
+        ruta (str): Archivo del punto de control
+
+    Returns:
+        Simulacion o SimulacionVectorizada: La simulación, lista para seguir
+    """
+    estado = cargar_estado(ruta)
+    if estado['motor'] == 'vectorizado':
+        # Importación diferida: NumPy solo se carga si el punto de control lo necesita
+        from motor_vectorizado import SimulacionVectorizada
+        return SimulacionVectorizada.desde_estado(estado)
+
+    from simulacion import Simulacion
+    return Simulacion.desde_estado(estado)
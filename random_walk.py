@@ -1,4 +1,6 @@
-import random
+import math
+
+from aleatorio import GeneradorAleatorio
 
 class RandomWalk:
     """
@@ -8,12 +10,17 @@ class RandomWalk:
     izquierda, derecha). Si un movimiento choca con las paredes, se
     descarta y se calcula uno nuevo hasta encontrar un movimiento válido.
     
+    En lugar de reintentar de verdad, cada paso elige directamente entre las
+    direcciones válidas (tablas del entorno) y sortea cuántos intentos habrían
+    chocado antes, que siguen una distribución geométrica.
+    
     Attributes:
         entorno (Entorno): El entorno donde se ejecuta el Random Walk
         posicion_actual (tuple): Posición actual (x, y) del agente
         camino (list): Lista de todas las posiciones visitadas
         pasos_realizados (int): Contador de pasos válidos realizados
         intentos_bloqueados (int): Contador de intentos inválidos (choques)
+        rng (GeneradorAleatorio): Generador aleatorio de los movimientos
     """
     
     # Direcciones posibles: arriba, abajo, izquierda, derecha
@@ -31,35 +38,68 @@ class RandomWalk:
         (1, 0): "Derecha"
     }
     
-    def __init__(self, entorno):
+    def __init__(self, entorno, rng=None):
         """
         Inicializa el Random Walk con un entorno dado.
         
         Args:
             entorno (Entorno): El entorno donde se ejecutará la simulación
+            rng (GeneradorAleatorio): Generador a usar. Por defecto, el del entorno
+                                      (o uno nuevo si el entorno no tiene)
         """
         self.entorno = entorno
+        if rng is None:
+            rng = getattr(entorno, 'rng', None) or GeneradorAleatorio()
+        self.rng = rng
         self.posicion_actual = entorno.pos_inicial
         self.camino = [self.posicion_actual]
         self.pasos_realizados = 0
         self.intentos_bloqueados = 0
     
-    def _obtener_direccion_aleatoria(self):
+    def _obtener_direccion_aleatoria(self, opciones):
         """
-        Selecciona una dirección aleatoria de las 4 posibles.
+        Selecciona una dirección aleatoria entre las válidas.
+        
+        Args:
+            opciones (tuple): Direcciones válidas desde la posición actual
         
         Returns:
             tuple: (dx, dy) representando el desplazamiento en X e Y
         """
-        return random.choice(self.DIRECCIONES)
+        return self.rng.choice(opciones)
+    
+    def _sortear_intentos_bloqueados(self, validas, max_intentos):
+        """
+        Sortea cuántos intentos al azar habrían chocado antes del primero válido.
+        
+        Con `validas` de 4 direcciones permitidas, cada intento uniforme acierta
+        con probabilidad p = validas / 4, así que los choques previos siguen una
+        distribución geométrica: se sortean con un solo número por inversión.
+        
+        Args:
+            validas (int): Cuántas direcciones son válidas
+            max_intentos (int): Tope de intentos (como en el bucle original)
+        
+        Returns:
+            int: Intentos bloqueados (max_intentos si no se encontraría ninguno)
+        """
+        total = len(self.DIRECCIONES)
+        if validas == 0:
+            return max_intentos
+        if validas == total:
+            return 0
+        
+        p = validas / total
+        bloqueados = int(math.log(1.0 - self.rng.random()) / math.log(1.0 - p))
+        return min(bloqueados, max_intentos)
     
     def realizar_paso(self, max_intentos=1000, mostrar_info=False):
         """
         Realiza un paso válido en el Random Walk.
         
-        Intenta mover el agente en una dirección aleatoria. Si el movimiento
-        choca con las paredes, descarta ese movimiento y elige otra dirección
-        aleatoria hasta encontrar un movimiento válido.
+        Elige una dirección al azar entre las que no chocan con las paredes y
+        suma a intentos_bloqueados los choques que habría tenido el método de
+        reintentar hasta acertar.
         
         Args:
             max_intentos (int): Número máximo de intentos para encontrar un
@@ -70,40 +110,35 @@ class RandomWalk:
             bool: True si se realizó un paso válido, False si no se encontró
                  ningún movimiento válido después de max_intentos
         """
-        intentos_locales = 0
+        x, y = self.posicion_actual
+        opciones = self.entorno.movimientos_validos(x, y)
         
-        while intentos_locales < max_intentos:
-            # Obtener dirección aleatoria
-            direccion = self._obtener_direccion_aleatoria()
-            dx, dy = direccion
-            
-            # Calcular nueva posición
-            nueva_x = self.posicion_actual[0] + dx
-            nueva_y = self.posicion_actual[1] + dy
-            
-            # Verificar si el movimiento es válido
-            if self.entorno.es_posicion_valida(nueva_x, nueva_y):
-                # Movimiento válido - actualizar posición
-                if mostrar_info:
-                    print(f"  ✓ Movimiento válido: {self.NOMBRES_DIRECCIONES[direccion]} "
-                          f"-> ({nueva_x}, {nueva_y})")
-                
-                self.posicion_actual = (nueva_x, nueva_y)
-                self.camino.append(self.posicion_actual)
-                self.pasos_realizados += 1
-                return True
-            else:
-                # Movimiento inválido - contar intento bloqueado
-                if mostrar_info:
-                    print(f"  ✗ Movimiento bloqueado: {self.NOMBRES_DIRECCIONES[direccion]} "
-                          f"(choque con pared)")
-                
-                self.intentos_bloqueados += 1
-                intentos_locales += 1
-        
-        # No se encontró movimiento válido
-        print(f"⚠ Advertencia: No se encontró movimiento válido después de {max_intentos} intentos")
-        return False
+        bloqueados = self._sortear_intentos_bloqueados(len(opciones), max_intentos)
+        self.intentos_bloqueados += bloqueados
+        
+        if mostrar_info and bloqueados:
+            chocan = [self.NOMBRES_DIRECCIONES[d] for d in self.DIRECCIONES if d not in opciones]
+            print(f"  ✗ {bloqueados} movimiento(s) bloqueado(s): {', '.join(chocan)} "
+                  f"(choque con pared)")
+        
+        if bloqueados >= max_intentos:
+            # No se encontró movimiento válido
+            print(f"⚠ Advertencia: No se encontró movimiento válido después de {max_intentos} intentos")
+            return False
+        
+        # Movimiento válido - actualizar posición
+        direccion = self._obtener_direccion_aleatoria(opciones)
+        nueva_x = x + direccion[0]
+        nueva_y = y + direccion[1]
+        
+        if mostrar_info:
+            print(f"  ✓ Movimiento válido: {self.NOMBRES_DIRECCIONES[direccion]} "
+                  f"-> ({nueva_x}, {nueva_y})")
+        
+        self.posicion_actual = (nueva_x, nueva_y)
+        self.camino.append(self.posicion_actual)
+        self.pasos_realizados += 1
+        return True
     
     def simular(self, num_pasos, mostrar_progreso=True, mostrar_cada=10):
         """
@@ -0,0 +1,262 @@
+from array import array
+
+
+# Código de array de las coordenadas: 16 bits alcanzan para casi todos los
+# mapas; si un lado supera COORDENADA_MAXIMA se usan enteros de 32 bits
+CODIGO_COORDENADAS = 'h'
+CODIGO_COORDENADAS_GRANDES = 'i'
+COORDENADA_MAXIMA = 32767
+
+
+class RastroCompleto:
+    """
+    Camino completo del día guardado de forma compacta.
+
+    Las coordenadas se guardan intercaladas (x0, y0, x1, y1, ...) en un
+    array('h') de enteros de 16 bits: 4 bytes por posición en lugar de los
+    ~120 de una tupla dentro de una lista. En entornos de más de 32767
+    celdas por lado se usa array('i') (ver PoliticaRastro.para_dimensiones).
+
+    Attributes:
+        datos (array): Coordenadas intercaladas
+        total (int): Posiciones agregadas en el día
+    """
+
+    __slots__ = ('datos', 'total')
+
+    def __init__(self, posicion, codigo=CODIGO_COORDENADAS):
+        """
+        Inicializa el camino en la posición de partida.
+
+        Args:
+            posicion (tuple): Posición inicial (x, y)
+            codigo (str): Código de array de las coordenadas ('h' o 'i')
+        """
+        self.datos = array(codigo, posicion)
+        self.total = 1
+
+    def agregar(self, x, y):
+        """
+        Agrega una posición al final del camino.
+
+        Args:
+            x (int): Coordenada X
+            y (int): Coordenada Y
+        """
+        self.datos.append(x)
+        self.datos.append(y)
+        self.total += 1
+
+    def coordenadas(self, hasta=None):
+        """
+        Devuelve las posiciones guardadas como arreglo de NumPy.
+
+        Args:
+            hasta (int): Si se indica, solo las posiciones agregadas antes de
+                         que total valiera este número
+
+        Returns:
+            numpy.ndarray: Arreglo (n, 2) de enteros
+        """
+        import numpy as np
+
+        n = self.total if hasta is None else min(hasta, self.total)
+        return np.frombuffer(self.datos[:2 * n], dtype=self.datos.typecode).reshape(-1, 2)
+
+    def __len__(self):
+        return len(self.datos) // 2
+
+    def __iter__(self):
+        datos = self.datos
+        return zip(datos[0::2], datos[1::2])
+
+
+class RastroAnillo:
+    """
+    Solo las últimas posiciones del camino, en un búfer circular de tamaño fijo.
+
+    Attributes:
+        longitud (int): Cuántas posiciones se conservan
+        datos (array): Búfer circular de coordenadas intercaladas
+        total (int): Posiciones agregadas en el día (incluye las ya descartadas)
+    """
+
+    __slots__ = ('longitud', 'datos', 'total')
+
+    def __init__(self, posicion, longitud, codigo=CODIGO_COORDENADAS):
+        """
+        Inicializa el búfer con la posición de partida.
+
+        Args:
+            posicion (tuple): Posición inicial (x, y)
+            longitud (int): Cuántas posiciones conservar
+            codigo (str): Código de array de las coordenadas ('h' o 'i')
+        """
+        self.longitud = longitud
+        self.datos = array(codigo, [0]) * (2 * longitud)
+        self.datos[0], self.datos[1] = posicion
+        self.total = 1
+
+    def agregar(self, x, y):
+        """
+        Agrega una posición, pisando la más vieja si el búfer está lleno.
+
+        Args:
+            x (int): Coordenada X
+            y (int): Coordenada Y
+        """
+        i = 2 * (self.total % self.longitud)
+        self.datos[i] = x
+        self.datos[i + 1] = y
+        self.total += 1
+
+    def _orden(self, hasta):
+        """Índices del búfer de las posiciones conservadas, de la más vieja a la más nueva."""
+        fin = self.total if hasta is None else min(hasta, self.total)
+        inicio = max(0, self.total - self.longitud)
+        return [i % self.longitud for i in range(inicio, fin)]
+
+    def coordenadas(self, hasta=None):
+        """
+        Devuelve las posiciones conservadas como arreglo de NumPy.
+
+        Args:
+            hasta (int): Si se indica, solo las posiciones agregadas antes de
+                         que total valiera este número
+
+        Returns:
+            numpy.ndarray: Arreglo (n, 2) de enteros, de la más vieja a la más nueva
+        """
+        import numpy as np
+
+        orden = self._orden(hasta)
+        pares = np.frombuffer(self.datos[:], dtype=self.datos.typecode).reshape(-1, 2)
+        return pares[orden]
+
+    def __len__(self):
+        return min(self.total, self.longitud)
+
+    def __iter__(self):
+        datos = self.datos
+        return ((datos[2 * i], datos[2 * i + 1]) for i in self._orden(None))
+
+
+class RastroNulo:
+    """
+    No guarda el camino; solo cuenta las posiciones.
+
+    Attributes:
+        total (int): Posiciones agregadas en el día
+    """
+
+    __slots__ = ('total',)
+
+    def __init__(self, posicion):
+        """Inicializa el contador (la posición no se guarda)."""
+        self.total = 1
+
+    def agregar(self, x, y):
+        """Cuenta una posición sin guardarla."""
+        self.total += 1
+
+    def coordenadas(self, hasta=None):
+        """Devuelve un arreglo (0, 2): no hay posiciones guardadas."""
+        import numpy as np
+
+        return np.empty((0, 2), dtype=np.int16)
+
+    def __len__(self):
+        return 0
+
+    def __iter__(self):
+        return iter(())
+
+
+class PoliticaRastro:
+    """
+    Decide cómo se guarda el camino de cada partícula.
+
+    Tipos:
+        'completo': todo el camino del día (RastroCompleto)
+        'ultimos': solo las últimas `longitud` posiciones (RastroAnillo)
+        'ninguno': no se guarda (RastroNulo)
+
+    Attributes:
+        tipo (str): Tipo de rastro
+        longitud (int): Posiciones a conservar con 'ultimos'
+        codigo (str): Código de array de las coordenadas ('h', o 'i' en mapas grandes)
+    """
+
+    TIPOS = ('completo', 'ultimos', 'ninguno')
+
+    def __init__(self, tipo='completo', longitud=None, codigo=CODIGO_COORDENADAS):
+        """
+        Inicializa la política.
+
+        Args:
+            tipo (str): 'completo', 'ultimos' o 'ninguno'
+            longitud (int): Posiciones a conservar (obligatoria con 'ultimos')
+            codigo (str): Código de array de las coordenadas ('h' o 'i')
+        """
+        if tipo not in self.TIPOS:
+            raise ValueError(f"Tipo de rastro desconocido: {tipo!r}")
+        if tipo == 'ultimos' and (longitud is None or longitud < 1):
+            raise ValueError("El rastro 'ultimos' necesita una longitud positiva")
+        self.tipo = tipo
+        self.longitud = longitud
+        self.codigo = codigo
+
+    def para_dimensiones(self, ancho, alto):
+        """
+        Política que admite las coordenadas de un entorno de ese tamaño.
+
+        Args:
+            ancho (int): Ancho del entorno
+            alto (int): Alto del entorno
+
+        Returns:
+            PoliticaRastro: Esta misma si las coordenadas caben en 16 bits, o una
+                igual que las guarda en 32 bits
+        """
+        if max(ancho, alto) - 1 <= COORDENADA_MAXIMA:
+            return self
+        return PoliticaRastro(self.tipo, self.longitud, codigo=CODIGO_COORDENADAS_GRANDES)
+
+    @staticmethod
+    def desde_valor(valor):
+        """
+        Crea una política a partir de un valor de configuración.
+
+        Args:
+            valor: None o 'completo', 'ninguno', un entero N (últimas N
+                   posiciones), o una PoliticaRastro ya creada
+
+        Returns:
+            PoliticaRastro: La política correspondiente
+        """
+        if isinstance(valor, PoliticaRastro):
+            return valor
+        if valor is None:
+            return PoliticaRastro()
+        if isinstance(valor, int) or str(valor).isdigit():
+            return PoliticaRastro('ultimos', int(valor))
+        return PoliticaRastro(valor)
+
+    def nuevo(self, posicion):
+        """
+        Crea un rastro vacío que comienza en una posición.
+
+        Args:
+            posicion (tuple): Posición inicial (x, y)
+
+        Returns:
+            RastroCompleto, RastroAnillo o RastroNulo
+        """
+        if self.tipo == 'completo':
+            return RastroCompleto(posicion, self.codigo)
+        if self.tipo == 'ultimos':
+            return RastroAnillo(posicion, self.longitud, self.codigo)
+        return RastroNulo(posicion)
+
+
+RASTRO_COMPLETO = PoliticaRastro()
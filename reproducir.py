@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+
+def crear_parser():
+    """Crea el intérprete de opciones de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Reproduce una grabacion hecha con lote.py --grabar, "
+                    "sin volver a simular."
+    )
+    parser.add_argument('directorio', help="Carpeta de la grabacion")
+    parser.add_argument('--dia', type=int, default=0,
+                        help="Dia grabado con el que empezar, desde 0 (default: 0)")
+    parser.add_argument('--paso', type=int, default=0, help="Paso con el que empezar (default: 0)")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la reproducción.
+
+    Args:
+        argv (list): Argumentos de la línea de comandos (por defecto sys.argv)
+
+    Returns:
+        int: Código de salida (0 si todo salió bien)
+    """
+    args = crear_parser().parse_args(argv)
+
+    from visualizador import Visualizador
+
+    try:
+        Visualizador.reproducir_grabacion(args.directorio, dia=args.dia, paso=args.paso)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
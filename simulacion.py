@@ -1,5 +1,12 @@
-from particula import Particula
-import copy
+from particula import ContadoresPoblacion, Mutacion, Particula
+from aleatorio import GeneradorAleatorio
+from entorno import Entorno
+from historial import AlmacenHistorial, copiar_historial
+from instrumentacion import Instrumentacion
+from rastro import PoliticaRastro
+import punto_control
+from array import array
+from collections import deque
 
 class Simulacion:
     """
@@ -8,19 +15,33 @@ class Simulacion:
     Attributes:
         entorno (Entorno): El entorno de la simulación
         particulas (list): Lista de partículas activas
+        poblacion (ContadoresPoblacion): Conteos de las partículas vivas (por tipo,
+            en casa, alimentadas y mordidas), al día en todo momento
         depredadores (list): Lista de depredadores activos
         num_particulas_inicial (int): Número inicial de partículas
         pasos_por_dia (int): Número de pasos que dura un día
         dia_actual (int): Día actual de la simulación
         contador_id (int): Contador para asignar IDs únicos
-        historial_dias (list): Historial de estadísticas por día
-        todas_particulas_dias (list): Lista de todas las partículas por día (para animación)
+        historial_dias (list): Historial de estadísticas por día (o un AlmacenHistorial)
+        todas_particulas_dias (deque): Partículas de cada día con sus caminos (para animación)
         frecuencia_depredadores (int): Cada cuántos días aparecen depredadores
         cantidad_depredadores (int): Cuántos depredadores aparecen
+        rng (GeneradorAleatorio): Generador aleatorio compartido con el entorno
+        politica_rastro (PoliticaRastro): Cómo se guardan los caminos de las partículas
+        dia_en_curso (bool): Si ya se llamó a iniciar_dia y falta cerrar_dia
+        paso_actual (int): Pasos dados en el día en curso
+        muertas_en_dia (list): Partículas muertas por depredadores en el día en curso
+        depredadores_en_dia (int): Depredadores que aparecieron en el día en curso
+        instrumentacion (Instrumentacion): Medición por fases, o None si está apagada
+        metricas_dias (list): Métricas de tiempo y conteos de cada día (con instrumentacion)
     """
     
+    # Días recientes que se conservan en todas_particulas_dias si no se indica otro valor
+    DIAS_GUARDADOS = 3
+    
     def __init__(self, entorno, num_particulas_inicial=10, pasos_por_dia=100, 
-                 frecuencia_depredadores=2, cantidad_depredadores=1):
+                 frecuencia_depredadores=2, cantidad_depredadores=1, max_dias_guardados=DIAS_GUARDADOS,
+                 semilla=None, politica_rastro=None, historial=None, instrumentar=False):
         """
         Inicializa la simulación.
         
@@ -30,21 +51,64 @@ class Simulacion:
             pasos_por_dia (int): Cuántos pasos dura un día
             frecuencia_depredadores (int): Cada cuántos días aparecen depredadores
             cantidad_depredadores (int): Cuántos depredadores aparecen
+            max_dias_guardados (int): Cuántos días recientes conservar para la animación
+                (default: DIAS_GUARDADOS). Con 0 no se copia nada; con None se
+                conservan todos, y la memoria crece con cada día
+            semilla (int): Si se indica, reemplaza el generador del entorno por uno con
+                esta semilla (y vuelve a sortear la comida del primer día)
+            politica_rastro: Cómo guardar los caminos: 'completo' (default), 'ninguno',
+                un entero N (últimas N posiciones) o una PoliticaRastro
+            historial (AlmacenHistorial): Si se indica, las estadísticas de cada día
+                se guardan en este almacén en disco en lugar de en una lista
+            instrumentar (bool): Si True, mide tiempo y llamadas por fase de cada día
+                y los deja en metricas_dias (ver Instrumentacion)
         """
         self.entorno = entorno
+        if semilla is not None:
+            entorno.usar_generador(GeneradorAleatorio(semilla))
+        self.rng = entorno.rng
+        # En mapas de más de 32767 celdas por lado los caminos usan enteros de 32 bits
+        self.politica_rastro = PoliticaRastro.desde_valor(politica_rastro).para_dimensiones(
+            entorno.ancho, entorno.alto)
         self.num_particulas_inicial = num_particulas_inicial
         self.pasos_por_dia = pasos_por_dia
         self.dia_actual = 1
         self.contador_id = 0
-        self.historial_dias = []
-        self.todas_particulas_dias = []
+        self.historial_dias = [] if historial is None else historial
+        self.todas_particulas_dias = deque(maxlen=max_dias_guardados)
         self.frecuencia_depredadores = frecuencia_depredadores
         self.cantidad_depredadores = cantidad_depredadores
         self.depredadores = []
         
+        # Estado del día en curso (ver iniciar_dia / avanzar_paso / cerrar_dia)
+        self.dia_en_curso = False
+        self.paso_actual = 0
+        self.muertas_en_dia = []
+        self.depredadores_en_dia = 0
+        
         # Crear partículas iniciales
         self.particulas = []
+        self.poblacion = ContadoresPoblacion()
         self._crear_particulas_iniciales()
+        
+        # Medición por fases (opcional): sin ella no se envuelve ningún método
+        self.metricas_dias = []
+        self.instrumentacion = None
+        if instrumentar:
+            self.activar_instrumentacion()
+    
+    def activar_instrumentacion(self):
+        """
+        Empieza a medir tiempo y llamadas por fase; cada día cerrado agrega
+        una fila a metricas_dias.
+        
+        Returns:
+            Instrumentacion: La instrumentación activa
+        """
+        if self.instrumentacion is None:
+            self.instrumentacion = Instrumentacion(self)
+        self.instrumentacion.activar()
+        return self.instrumentacion
     
     def _crear_particulas_iniciales(self):
         """Crea las partículas iniciales de la simulación."""
@@ -52,9 +116,12 @@ class Simulacion:
             particula = Particula(
                 id=self._obtener_nuevo_id(),
                 entorno=self.entorno,
-                es_depredador=False
+                es_depredador=False,
+                politica_rastro=self.politica_rastro,
+                contadores=self.poblacion
             )
             self.particulas.append(particula)
+            self.poblacion.agregar(particula)
     
     def _generar_depredadores(self):
         """Genera depredadores si corresponde al día actual."""
@@ -63,9 +130,11 @@ class Simulacion:
                 depredador = Particula(
                     id=self._obtener_nuevo_id(),
                     entorno=self.entorno,
-                    es_depredador=True
+                    es_depredador=True,
+                    politica_rastro=self.politica_rastro
                 )
                 self.depredadores.append(depredador)
+                self.entorno.registrar_depredador(depredador)
             return True
         return False
     
@@ -81,13 +150,13 @@ class Simulacion:
             if self.entorno.es_casa(pos_dep[0], pos_dep[1]):
                 continue  # No puede atacar desde la zona segura
             
-            # Buscar partículas en la misma posición
-            for particula in self.particulas:
-                if particula.viva and particula.posicion_actual == pos_dep:
-                    # La partícula tampoco debe estar en zona segura
-                    if not self.entorno.es_casa(particula.posicion_actual[0], particula.posicion_actual[1]):
-                        if particula.recibir_mordida():
-                            muertes_por_depredador += 1
+            # El índice de ocupación solo contiene partículas vivas fuera de la casa
+            ocupantes = self.entorno.ocupantes_en(pos_dep[0], pos_dep[1])
+            for particula in list(ocupantes):
+                if particula.recibir_mordida():
+                    muertes_por_depredador += 1
+                    self.muertas_en_dia.append(particula)
+                    self.entorno.retirar_ocupante(particula)
         
         return muertes_por_depredador
     
@@ -97,15 +166,15 @@ class Simulacion:
         self.contador_id += 1
         return nuevo_id
     
-    def simular_dia(self, mostrar_progreso=False):
+    def iniciar_dia(self, mostrar_progreso=False):
         """
-        Simula un día completo.
+        Comienza un nuevo día: genera los depredadores si corresponde.
         
         Args:
-            mostrar_progreso (bool): Si True, muestra información del progreso
+            mostrar_progreso (bool): Si True, muestra información del día
             
         Returns:
-            dict: Estadísticas del día
+            int: Número de depredadores que aparecieron
         """
         if mostrar_progreso:
             print(f"\n{'='*70}")
@@ -115,63 +184,113 @@ class Simulacion:
             print(f"Pasos por día: {self.pasos_por_dia}")
             print(f"Comida disponible: {self.entorno.comida_actual}")
         
+        self.paso_actual = 0
+        self.muertas_en_dia = []
+        self.depredadores_en_dia = 0
+        
         # Generar depredadores si corresponde
-        num_depredadores_generados = 0
         if self._generar_depredadores():
-            num_depredadores_generados = len(self.depredadores)
+            self.depredadores_en_dia = len(self.depredadores)
             if mostrar_progreso:
-                print(f"APARECEN {num_depredadores_generados} DEPREDADOR(ES)")
-        
-        # Guardar copia profunda de las partículas para animación
-        particulas_dia_copia = []
-        for p in self.particulas:
-            p_copia = Particula(p.id, self.entorno, p.pos_inicial, p.generacion, p.mutacion)
-            p_copia.camino = [p.pos_inicial]
-            p_copia.pasos_realizados = 0
-            p_copia.comida_consumida = 0
-            particulas_dia_copia.append(p_copia)
-        
-        # Contador de muertes por depredador
-        muertes_por_depredador_total = 0
-        
-        # Simular todos los pasos del día
-        for paso in range(self.pasos_por_dia):
+                print(f"APARECEN {self.depredadores_en_dia} DEPREDADOR(ES)")
+        
+        self.dia_en_curso = True
+        return self.depredadores_en_dia
+    
+    def avanzar_paso(self, n=1, mostrar_progreso=False):
+        """
+        Avanza n pasos del día en curso (sin pasar del final del día).
+        
+        Args:
+            n (int): Cuántos pasos avanzar
+            mostrar_progreso (bool): Si True, muestra el progreso cada 20 pasos
+            
+        Returns:
+            int: Muertes por depredador en estos pasos
+        """
+        muertes = 0
+        for _ in range(min(n, self.pasos_por_dia - self.paso_actual)):
             # Mover partículas normales
-            for i, particula in enumerate(self.particulas):
+            for particula in self.particulas:
                 particula.realizar_paso(depredadores=self.depredadores)
-                # Sincronizar con la copia
-                if i < len(particulas_dia_copia):
-                    particulas_dia_copia[i].camino = particula.camino.copy()
-                    particulas_dia_copia[i].posicion_actual = particula.posicion_actual
-                    particulas_dia_copia[i].comida_consumida = particula.comida_consumida
-                    particulas_dia_copia[i].en_casa = particula.en_casa
             
             # Mover depredadores
             for depredador in self.depredadores:
                 depredador.realizar_paso()
             
             # Procesar ataques después de cada paso
-            muertes_paso = self._procesar_ataques_depredadores()
-            muertes_por_depredador_total += muertes_paso
+            muertes += self._procesar_ataques_depredadores()
+            self.paso_actual += 1
             
-            if mostrar_progreso and (paso + 1) % 20 == 0:
-                progreso = ((paso + 1) / self.pasos_por_dia) * 100
+            if mostrar_progreso and self.paso_actual % 20 == 0:
+                progreso = (self.paso_actual / self.pasos_por_dia) * 100
                 print(f"  Progreso del día: {progreso:.0f}%")
         
+        return muertes
+    
+    @property
+    def dia_terminado(self):
+        """True si el día en curso ya dio todos sus pasos."""
+        return self.paso_actual >= self.pasos_por_dia
+    
+    def cerrar_dia(self, mostrar_progreso=False):
+        """
+        Resuelve el final del día y prepara el siguiente.
+        
+        Guarda la instantánea del día, evalúa supervivencia y reproducción,
+        retira a los depredadores y reestablece la comida.
+        
+        Args:
+            mostrar_progreso (bool): Si True, muestra el resumen del día
+            
+        Returns:
+            dict: Estadísticas del día
+        """
         # Guardar las partículas de este día
-        self.todas_particulas_dias.append(particulas_dia_copia)
+        self._guardar_instantanea_dia()
         
         # Evaluar resultados del día
-        estadisticas = self._evaluar_fin_dia(mostrar_progreso, num_depredadores_generados, muertes_por_depredador_total)
+        estadisticas = self._evaluar_fin_dia(mostrar_progreso, self.depredadores_en_dia,
+                                             len(self.muertas_en_dia))
         
         # Limpiar depredadores al final del día
         self.depredadores = []
+        self.entorno.limpiar_depredadores()
         
         # Preparar siguiente día
         self._preparar_siguiente_dia()
+        self.dia_en_curso = False
         
         return estadisticas
     
+    def simular_dia(self, mostrar_progreso=False):
+        """
+        Simula un día completo.
+        
+        Args:
+            mostrar_progreso (bool): Si True, muestra información del progreso
+            
+        Returns:
+            dict: Estadísticas del día
+        """
+        if not self.dia_en_curso:
+            self.iniciar_dia(mostrar_progreso)
+        self.avanzar_paso(self.pasos_por_dia, mostrar_progreso)
+        return self.cerrar_dia(mostrar_progreso)
+    
+    def _guardar_instantanea_dia(self):
+        """
+        Guarda una copia de las partículas del día para la animación.
+        
+        Se hace una sola vez al terminar los pasos: las copias comparten el
+        rastro del camino con la partícula original, que no se vuelve a modificar
+        porque preparar_nuevo_dia crea un rastro nuevo para el día siguiente.
+        Con max_dias_guardados=0 no se copia nada.
+        """
+        if self.todas_particulas_dias.maxlen == 0:
+            return
+        self.todas_particulas_dias.append([p.copiar() for p in self.particulas])
+    
     def _evaluar_fin_dia(self, mostrar_info=False, num_depredadores=0, muertes_por_depredador=0):
         """
         Evalúa qué partículas sobreviven y se reproducen al final del día.
@@ -184,50 +303,61 @@ class Simulacion:
         Returns:
             dict: Estadísticas del día
         """
+        # Una sola pasada: supervivencia, reproducción y mutación de los hijos,
+        # descontando muertes y sumando nacimientos en los conteos por tipo.
+        # Los hijos se crean después, todos juntos, y se ubican justo detrás
+        # de su padre (el mismo orden que crearlos uno a uno)
         sobrevivientes = []
-        reproducciones = 0
+        agregar = sobrevivientes.append
+        padres = []
+        mutaciones_hijos = []
+        lugares_hijos = []
         muertes = 0
         comida_total_consumida = 0
-        mutaciones_velocidad = 0
-        mutaciones_prioridad = 0
+        vivas = self.poblacion.vivas
+        nuevas = [0, 0, 0]
+        sortear = Particula.sortear_mutacion_hijo
+        rng = self.rng
         
         for particula in self.particulas:
-            # Solo evaluar partículas que siguen vivas
+            # Las muertas por depredadores ya no se evalúan
             if not particula.viva:
                 muertes += 1
                 continue
             
-            resultado = particula.evaluar_fin_dia()
-            comida_total_consumida += particula.comida_consumida
+            comida = particula.comida_consumida
+            comida_total_consumida += comida
+            reglas = particula.reglas
             
-            if resultado['sobrevive']:
-                sobrevivientes.append(particula)
+            # Sobrevive si está en casa y comió lo suficiente (o no comió nada)
+            if particula.en_casa and (comida >= reglas.comida_supervivencia or comida == 0):
+                agregar(particula)
                 
-                if resultado['reproduce']:
-                    # Crear partícula hija
-                    hijo = particula.crear_hijo(
-                        self._obtener_nuevo_id(),
-                        mutacion_hijo=resultado['mutacion_hijo']
-                    )
-                    sobrevivientes.append(hijo)
-                    reproducciones += 1
-                    
-                    # Contar nuevas mutaciones
-                    if resultado['mutacion_hijo'] == 'velocidad':
-                        mutaciones_velocidad += 1
-                    elif resultado['mutacion_hijo'] == 'prioridad':
-                        mutaciones_prioridad += 1
+                if comida >= reglas.comida_reproduccion and comida >= reglas.comida_supervivencia:
+                    mutacion_hijo = sortear(reglas, comida, rng)
+                    padres.append(particula)
+                    mutaciones_hijos.append(mutacion_hijo)
+                    lugares_hijos.append(len(sobrevivientes))
+                    agregar(None)
+                    vivas[mutacion_hijo] += 1
+                    nuevas[mutacion_hijo] += 1
             else:
                 muertes += 1
                 particula.viva = False
+                vivas[particula.tipo_mutacion] -= 1
+        
+        # Crear todos los hijos de una vez, con ids consecutivos
+        hijos = Particula.crear_hijos(padres, mutaciones_hijos, self.contador_id)
+        self.contador_id += len(hijos)
+        for lugar, hijo in zip(lugares_hijos, hijos):
+            sobrevivientes[lugar] = hijo
         
         # Actualizar lista de partículas
         self.particulas = sobrevivientes
-        
-        # Contar tipos de partículas
-        normales = sum(1 for p in self.particulas if p.mutacion == 'ninguna')
-        velocidad_count = sum(1 for p in self.particulas if p.mutacion == 'velocidad')
-        prioridad = sum(1 for p in self.particulas if p.mutacion == 'prioridad')
+        reproducciones = len(hijos)
+        mutaciones_velocidad = nuevas[Mutacion.VELOCIDAD]
+        mutaciones_prioridad = nuevas[Mutacion.PRIORIDAD]
+        normales, velocidad_count, prioridad = vivas
         
         estadisticas = {
             'dia': self.dia_actual,
@@ -269,23 +399,160 @@ class Simulacion:
         self.dia_actual += 1
         # Reestablecer comida
         self.entorno.reestablecer_comida()
+        # Todas las partículas vuelven a casa
+        self.entorno.limpiar_ocupacion()
         # Preparar partículas
         for particula in self.particulas:
             particula.preparar_nuevo_dia()
+        self.poblacion.nuevo_dia()
+    
+    def obtener_posiciones(self):
+        """
+        Posiciones de partículas y depredadores por columnas, para grabar el día.
+        
+        Las partículas muertas durante el día siguen en la lista (con viva=False)
+        hasta que cierra el día, así que el orden no cambia entre pasos.
+        
+        Returns:
+            dict: Arreglos de NumPy 'id', 'x', 'y', 'mutacion', 'viva' y 'depredador'
+        """
+        import numpy as np
+        
+        entidades = self.particulas + self.depredadores
+        n = len(entidades)
+        return {
+            'id': np.fromiter((e.id for e in entidades), dtype=np.int64, count=n),
+            'x': np.fromiter((e.posicion_actual[0] for e in entidades), dtype=np.int32, count=n),
+            'y': np.fromiter((e.posicion_actual[1] for e in entidades), dtype=np.int32, count=n),
+            'mutacion': np.fromiter((e.tipo_mutacion for e in entidades), dtype=np.int8, count=n),
+            'viva': np.fromiter((e.viva for e in entidades), dtype=bool, count=n),
+            'depredador': np.fromiter((e.es_depredador for e in entidades), dtype=bool, count=n),
+        }
+    
+    def exportar_estado(self):
+        """
+        Estado completo de la simulación entre dos días, para un punto de control.
+        
+        Las partículas se guardan por columnas (un array compacto por atributo)
+        en lugar de objeto por objeto. Entre días todas están en casa, sin
+        comida ni mordidas y con el camino vacío, así que basta con su
+        identidad, casa, generación y mutación. No se incluyen las
+        instantáneas de todas_particulas_dias, que solo sirven para animar.
+        
+        Returns:
+            dict: Estado serializable
+            
+        Raises:
+            ValueError: Si hay un día en curso
+        """
+        if self.dia_en_curso:
+            raise ValueError("Solo se puede exportar el estado entre dos dias")
+        
+        particulas = self.particulas
+        return {
+            'motor': 'objetos',
+            'entorno': self.entorno.exportar_estado(),
+            'num_particulas_inicial': self.num_particulas_inicial,
+            'pasos_por_dia': self.pasos_por_dia,
+            'frecuencia_depredadores': self.frecuencia_depredadores,
+            'cantidad_depredadores': self.cantidad_depredadores,
+            'max_dias_guardados': self.todas_particulas_dias.maxlen,
+            'politica_rastro': (self.politica_rastro.tipo, self.politica_rastro.longitud),
+            'dia_actual': self.dia_actual,
+            'contador_id': self.contador_id,
+            'historial_dias': copiar_historial(self.historial_dias),
+            'particulas': {
+                'id': array('q', [p.id for p in particulas]),
+                'x': array('i', [p.pos_inicial[0] for p in particulas]),
+                'y': array('i', [p.pos_inicial[1] for p in particulas]),
+                'generacion': array('i', [p.generacion for p in particulas]),
+                'mutacion': array('b', [p.tipo_mutacion for p in particulas]),
+            },
+        }
+    
+    @classmethod
+    def desde_estado(cls, estado):
+        """
+        Reconstruye una simulación a partir de exportar_estado().
+        
+        Args:
+            estado (dict): Estado guardado
+            
+        Returns:
+            Simulacion: La simulación, lista para seguir con el día guardado
+        """
+        entorno = Entorno.desde_estado(estado['entorno'])
+        tipo_rastro, longitud_rastro = estado['politica_rastro']
+        simulacion = cls(entorno, num_particulas_inicial=0,
+                         pasos_por_dia=estado['pasos_por_dia'],
+                         frecuencia_depredadores=estado['frecuencia_depredadores'],
+                         cantidad_depredadores=estado['cantidad_depredadores'],
+                         max_dias_guardados=estado['max_dias_guardados'],
+                         politica_rastro=PoliticaRastro(tipo_rastro, longitud_rastro))
+        simulacion.num_particulas_inicial = estado['num_particulas_inicial']
+        simulacion.dia_actual = estado['dia_actual']
+        simulacion.contador_id = estado['contador_id']
+        simulacion.historial_dias = copiar_historial(estado['historial_dias'])
+        
+        columnas = estado['particulas']
+        simulacion.particulas = [
+            Particula(id=id, entorno=entorno, pos_inicial=(x, y), generacion=generacion,
+                      mutacion=mutacion, politica_rastro=simulacion.politica_rastro,
+                      contadores=simulacion.poblacion)
+            for id, x, y, generacion, mutacion in zip(columnas['id'], columnas['x'], columnas['y'],
+                                                      columnas['generacion'], columnas['mutacion'])
+        ]
+        for particula in simulacion.particulas:
+            simulacion.poblacion.agregar(particula)
+        return simulacion
+    
+    def guardar_punto_control(self, ruta):
+        """
+        Guarda el estado de la simulación en un archivo binario (escritura atómica).
+        
+        Args:
+            ruta (str): Archivo de destino
+        """
+        punto_control.guardar_estado(self.exportar_estado(), ruta)
+    
+    @classmethod
+    def desde_punto_control(cls, ruta):
+        """
+        Restaura una simulación guardada con guardar_punto_control.
+        
+        Args:
+            ruta (str): Archivo del punto de control
+            
+        Returns:
+            Simulacion: La simulación restaurada
+        """
+        return cls.desde_estado(punto_control.cargar_estado(ruta))
     
-    def ejecutar_simulacion_completa(self, max_dias=100, mostrar_progreso=True):
+    def ejecutar_simulacion_completa(self, max_dias=100, mostrar_progreso=True,
+                                     ruta_punto_control=None, cada_n_dias=10, grabador=None):
         """
         Ejecuta la simulación completa hasta que no queden partículas o se alcance el límite.
         
+        Si la simulación viene de un punto de control, continúa desde el día
+        guardado y produce exactamente lo mismo que una ejecución sin cortes.
+        
         Args:
             max_dias (int): Número máximo de días a simular
             mostrar_progreso (bool): Si True, muestra el progreso
+            ruta_punto_control (str): Si se indica, guarda ahí un punto de control
+                cada cada_n_dias días y al terminar
+            cada_n_dias (int): Cada cuántos días guardar el punto de control
+            grabador (GrabadorTrayectorias): Si se indica, graba cada paso para
+                reproducirlo después con Visualizador.reproducir_grabacion
             
         Returns:
             list: Historial completo de la simulación
         """
         print(f"\n{'='*70}")
-        print("INICIANDO SIMULACIÓN DE POBLACIÓN")
+        if self.dia_actual > 1:
+            print(f"REANUDANDO SIMULACIÓN DE POBLACIÓN EN EL DÍA {self.dia_actual}")
+        else:
+            print("INICIANDO SIMULACIÓN DE POBLACIÓN")
         print(f"{'='*70}")
         print(f"Dimensiones del entorno: {self.entorno.obtener_dimensiones()}")
         print(f"Partículas iniciales: {self.num_particulas_inicial}")
@@ -294,10 +561,22 @@ class Simulacion:
         print(f"{'='*70}\n")
         
         while len(self.particulas) > 0 and self.dia_actual <= max_dias:
-            estadisticas = self.simular_dia(mostrar_progreso=mostrar_progreso)
+            if grabador is not None:
+                estadisticas = grabador.simular_dia(self, mostrar_progreso=mostrar_progreso)
+            else:
+                estadisticas = self.simular_dia(mostrar_progreso=mostrar_progreso)
             
             if not mostrar_progreso and self.dia_actual % 5 == 0:
                 print(f"Día {self.dia_actual - 1}: {estadisticas['particulas_finales']} partículas vivas")
+            
+            if ruta_punto_control and (self.dia_actual - 1) % cada_n_dias == 0:
+                self.guardar_punto_control(ruta_punto_control)
+        
+        if ruta_punto_control:
+            self.guardar_punto_control(ruta_punto_control)
+        
+        if isinstance(self.historial_dias, AlmacenHistorial):
+            self.historial_dias.guardar()
         
         print(f"\n{'='*70}")
         print("SIMULACIÓN FINALIZADA")
@@ -323,6 +602,7 @@ class Simulacion:
         return {
             'dia': self.dia_actual,
             'num_particulas': len(self.particulas),
+            'poblacion': self.poblacion.como_dict(),
             'particulas': [p.obtener_info() for p in self.particulas],
             'comida_restante': self.entorno.comida_actual,
             'historial': self.historial_dias
@@ -1,12 +1,346 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
-from matplotlib.widgets import Slider
-import numpy as np
+import queue
+import threading
+import time
+
+
+class ProductorSimulacion:
+    """
+    Ejecuta la simulación en un hilo de fondo y publica fotogramas compactos.
+    
+    La simulación avanza a su propio ritmo (controlado por velocidad) y deja
+    cada fotograma en una cola acotada. Si quien dibuja se atrasa, los
+    fotogramas más viejos se descartan, pero sus cambios de comida se
+    trasladan al siguiente para que ninguno se pierda.
+    
+    Attributes:
+        simulacion (Simulacion): La simulación que se ejecuta
+        cola (queue.Queue): Cola acotada de fotogramas pendientes
+        velocidad (int): Nivel del slider; se dan ~33 * (1 + velocidad) pasos por segundo
+    """
+    
+    PASOS_POR_SEGUNDO_BASE = 1 / 0.030
+    
+    def __init__(self, simulacion, capacidad=4):
+        """
+        Inicializa el productor.
+        
+        Args:
+            simulacion (Simulacion): La simulación a ejecutar
+            capacidad (int): Máximo de fotogramas en espera
+        """
+        self.simulacion = simulacion
+        self.cola = queue.Queue(maxsize=capacidad)
+        self.velocidad = 0
+        self._detener = threading.Event()
+        self._hilo = threading.Thread(target=self._ejecutar, daemon=True)
+        self._comida_reinicio = None
+    
+    def iniciar(self):
+        """Arranca el hilo de la simulación."""
+        self.simulacion.entorno.activar_registro_consumo()
+        self._hilo.start()
+    
+    def detener(self):
+        """Pide al hilo que termine y espera a que lo haga."""
+        self._detener.set()
+        if self._hilo.is_alive() and self._hilo is not threading.current_thread():
+            self._hilo.join()
+    
+    def extraer_pendientes(self):
+        """
+        Saca todos los fotogramas en espera, del más viejo al más nuevo.
+        
+        Returns:
+            list: Fotogramas pendientes (puede estar vacía)
+        """
+        pendientes = []
+        while True:
+            try:
+                pendientes.append(self.cola.get_nowait())
+            except queue.Empty:
+                return pendientes
+    
+    def _ejecutar(self):
+        """Bucle del hilo: avanza pasos y publica un fotograma tras cada uno."""
+        simulacion = self.simulacion
+        while not self._detener.is_set():
+            inicio = time.perf_counter()
+            
+            if len(simulacion.particulas) == 0:
+                print(f"\n{'='*70}")
+                print("SIMULACION TERMINADA - EXTINCION TOTAL")
+                print(f"{'='*70}\n")
+                self._publicar(self._tomar_fotograma(finalizada=True))
+                return
+            
+            self._realizar_paso()
+            self._publicar(self._tomar_fotograma())
+            
+            espera = 1 / (self.PASOS_POR_SEGUNDO_BASE * (1 + self.velocidad))
+            self._detener.wait(max(0.0, espera - (time.perf_counter() - inicio)))
+    
+    def _realizar_paso(self):
+        """Avanza un paso de la simulación y cierra el día cuando corresponde."""
+        simulacion = self.simulacion
+        entorno = simulacion.entorno
+        
+        if not simulacion.dia_en_curso:
+            self._iniciar_dia()
+        
+        # Avanzar y reportar las muertes del paso
+        muertas_antes = len(simulacion.muertas_en_dia)
+        simulacion.avanzar_paso()
+        for particula in simulacion.muertas_en_dia[muertas_antes:]:
+            print(f"  Particula #{particula.id} murio por depredador")
+        
+        # Verificar fin de día
+        if not simulacion.dia_terminado:
+            return
+        
+        estadisticas = simulacion.cerrar_dia()
+        self._comida_reinicio = entorno.obtener_coordenadas_comida()
+        
+        print(f"\n{'='*70}")
+        print(f"FIN DEL DIA {estadisticas['dia']}")
+        print(f"{'='*70}")
+        print(f"Sobrevivientes: {estadisticas['particulas_finales']}")
+        print(f"Muertes: {estadisticas['muertes']}")
+        if estadisticas['muertes_por_depredador'] > 0:
+            print(f"  - Por depredadores: {estadisticas['muertes_por_depredador']}")
+        print(f"Reproducciones: {estadisticas['reproducciones']}")
+        print(f"{'='*70}\n")
+        print(f"Comida reestablecida: {entorno.comida_actual} unidades")
+        
+        if simulacion.particulas:
+            self._iniciar_dia()
+    
+    def _iniciar_dia(self):
+        """Comienza el día siguiente y avisa si aparecen depredadores."""
+        if self.simulacion.iniciar_dia():
+            print(f"APARECEN {len(self.simulacion.depredadores)} DEPREDADOR(ES)")
+        print()
+    
+    def _tomar_fotograma(self, finalizada=False):
+        """
+        Copia el estado visible de la simulación en un fotograma compacto.
+        
+        Solo se guardan columnas crudas (posición, id, tipo, comida y
+        mordidas de cada entidad): los colores, los textos y la información
+        del hover se arman al dibujar, y solo para el fotograma que se dibuja
+        (ver estilo_fotograma y texto_hover).
+        
+        Los caminos no se copian: se guarda el rastro y su total actual,
+        porque durante el día solo crecen y al día siguiente se reemplazan.
+        
+        Args:
+            finalizada (bool): Si la simulación terminó por extinción
+            
+        Returns:
+            dict: Fotograma listo para dibujar
+        """
+        import numpy as np
+        
+        simulacion = self.simulacion
+        entidades = simulacion.particulas + simulacion.depredadores
+        n = len(entidades)
+        
+        posiciones = np.fromiter((c for e in entidades for c in e.posicion_actual),
+                                 dtype=float, count=2 * n).reshape(n, 2)
+        muertos = simulacion.muertas_en_dia
+        fotograma = {
+            'dia': simulacion.dia_actual,
+            'paso': simulacion.paso_actual,
+            'finalizada': finalizada,
+            'poblacion': simulacion.poblacion.como_dict(),
+            'num_depredadores': len(simulacion.depredadores),
+            'comida_actual': simulacion.entorno.comida_actual,
+            'comida_reinicio': self._comida_reinicio,
+            'comida_consumida': simulacion.entorno.extraer_registro_consumo(),
+            'posiciones': posiciones,
+            'ids': np.fromiter((e.id for e in entidades), dtype=np.int64, count=n),
+            'mutacion': np.fromiter((e.tipo_mutacion for e in entidades), dtype=np.int8, count=n),
+            'depredador': np.fromiter((e.es_depredador for e in entidades), dtype=bool, count=n),
+            'comida': np.fromiter((e.comida_consumida for e in entidades), dtype=np.int32, count=n),
+            'mordidas': np.fromiter((e.mordidas_recibidas for e in entidades), dtype=np.int32,
+                                    count=n),
+            'caminos': [(e.camino, e.camino.total) for e in entidades],
+            'pos_muertos': np.array([p.posicion_actual for p in muertos], dtype=float).reshape(-1, 2),
+            'colores_muertos': [p.color for p in muertos],
+        }
+        self._comida_reinicio = None
+        return fotograma
+    
+    def _publicar(self, fotograma):
+        """
+        Deja un fotograma en la cola sin bloquear la simulación.
+        
+        Si la cola está llena se descarta el fotograma más viejo, y sus
+        cambios de comida se anteponen a los del nuevo.
+        
+        Args:
+            fotograma (dict): Fotograma a publicar
+        """
+        while True:
+            try:
+                self.cola.put_nowait(fotograma)
+                return
+            except queue.Full:
+                try:
+                    descartado = self.cola.get_nowait()
+                except queue.Empty:
+                    continue
+                if fotograma['comida_reinicio'] is None:
+                    fotograma['comida_reinicio'] = descartado['comida_reinicio']
+                    fotograma['comida_consumida'] = (descartado['comida_consumida'] +
+                                                     fotograma['comida_consumida'])
+
+
+def estilo_fotograma(fotograma):
+    """
+    Colores, bordes, grosores, tamaños y textos de las entidades de un fotograma.
+    
+    Se calcula con operaciones sobre las columnas del fotograma, solo para
+    el que efectivamente se dibuja.
+    
+    Args:
+        fotograma (dict): Fotograma de ProductorSimulacion
+        
+    Returns:
+        dict: 'colores', 'colores_base' (sin el resaltado de las mordidas),
+              'bordes', 'grosores' y 'tamanos' por entidad, y 'textos_comida'
+              y 'textos_mordidas' como listas de (x, y, texto)
+    """
+    import numpy as np
+    from particula import REGLAS_MUTACION, Mutacion, Particula
+    
+    mutacion = fotograma['mutacion']
+    depredador = fotograma['depredador']
+    mordidas = fotograma['mordidas']
+    comida = fotograma['comida']
+    x, y = fotograma['posiciones'].T
+    
+    colores_base = np.array([r.color for r in REGLAS_MUTACION])[mutacion]
+    colores_base[depredador] = Particula.COLOR_DEPREDADOR
+    # Las de prioridad con una mordida se resaltan: verde oscuro con borde rojo
+    resaltadas = ~depredador & (mutacion == Mutacion.PRIORIDAD) & (mordidas == 1)
+    colores = colores_base.copy()
+    colores[resaltadas] = (0.0, 0.5, 0.0)
+    bordes = np.zeros_like(colores)
+    bordes[resaltadas] = (1.0, 0.0, 0.0)
+    
+    con_comida = np.flatnonzero(~depredador & (comida > 0))
+    mordidas_i = np.flatnonzero(~depredador & (mordidas > 0))
+    return {
+        'colores': colores,
+        'colores_base': colores_base,
+        'bordes': bordes,
+        'grosores': np.where(resaltadas, 6, 3),
+        'tamanos': np.where(depredador, 400, 300),
+        'textos_comida': [(x[i], y[i], f'{comida[i]}') for i in con_comida.tolist()],
+        'textos_mordidas': [(x[i] + 1.2, y[i] - 1.2, f'!{mordidas[i]}')
+                            for i in mordidas_i.tolist()],
+    }
+
+
+def texto_hover(fotograma, i):
+    """
+    Texto del hover de una entidad de un fotograma.
+    
+    Args:
+        fotograma (dict): Fotograma de ProductorSimulacion
+        i (int): Índice de la entidad en el fotograma
+        
+    Returns:
+        str: Identificador, tipo, comida y mordidas de la entidad
+    """
+    id = int(fotograma['ids'][i])
+    if fotograma['depredador'][i]:
+        return f"Depredador #{id}"
+    tipo = {1: " (Velocidad)", 2: " (Prioridad)"}.get(int(fotograma['mutacion'][i]), "")
+    texto = f"#{id}{tipo}\nComida: {fotograma['comida'][i]}"
+    if fotograma['mordidas'][i] > 0:
+        texto += f"\nMordidas: {fotograma['mordidas'][i]}"
+    return texto
+
+
+class IndiceCercania:
+    """
+    Índice de rejilla para encontrar la entidad bajo el mouse.
+    
+    Las posiciones se agrupan en celdas del tamaño del radio de búsqueda,
+    ordenadas por celda, así que una consulta solo mira las nueve celdas
+    alrededor del punto en lugar de recorrer todas las entidades. Se arma una
+    vez por fotograma.
+    
+    Attributes:
+        radio (float): Distancia máxima para considerar que el mouse está sobre una entidad
+    """
+    
+    def __init__(self, posiciones, radio=2.0):
+        """
+        Arma el índice.
+        
+        Args:
+            posiciones (ndarray): Arreglo (n, 2) con las posiciones x, y
+            radio (float): Distancia máxima de búsqueda
+        """
+        import numpy as np
+        
+        self.radio = radio
+        self._posiciones = np.asarray(posiciones, dtype=float).reshape(-1, 2)
+        celdas = np.floor(self._posiciones / radio).astype(np.int64)
+        # Margen de una celda para que las vecinas de los bordes no se mezclen
+        self._minimo = celdas.min(axis=0) - 1 if len(celdas) else np.zeros(2, dtype=np.int64)
+        self._alto = (celdas[:, 1].max() - self._minimo[1] + 2) if len(celdas) else 1
+        claves = self._clave(celdas[:, 0], celdas[:, 1])
+        self._orden = np.argsort(claves, kind='stable')
+        self._claves = claves[self._orden]
+    
+    def _clave(self, cx, cy):
+        return (cx - self._minimo[0]) * self._alto + (cy - self._minimo[1])
+    
+    def buscar(self, x, y):
+        """
+        Busca la entidad más cercana a un punto, dentro del radio.
+        
+        Args:
+            x (float): Coordenada X del punto
+            y (float): Coordenada Y del punto
+            
+        Returns:
+            int: Índice de la entidad en las posiciones (la primera si hay
+                 varias a la misma distancia), o None si no hay ninguna cerca
+        """
+        import numpy as np
+        
+        if not len(self._claves):
+            return None
+        cx = int(np.floor(x / self.radio))
+        cy = int(np.floor(y / self.radio))
+        candidatos = []
+        for vx in (cx - 1, cx, cx + 1):
+            # Las tres celdas de una columna tienen claves consecutivas
+            primera = self._clave(vx, cy - 1)
+            inicio = np.searchsorted(self._claves, primera, side='left')
+            fin = np.searchsorted(self._claves, primera + 2, side='right')
+            candidatos.append(self._orden[inicio:fin])
+        candidatos = np.concatenate(candidatos)
+        if not len(candidatos):
+            return None
+        candidatos.sort()
+        distancias = ((self._posiciones[candidatos] - (x, y)) ** 2).sum(axis=1)
+        mejor = int(np.argmin(distancias))
+        if distancias[mejor] >= self.radio ** 2:
+            return None
+        return int(candidatos[mejor])
+
 
 class Visualizador:
     """
     Clase para visualizar la simulación de población en tiempo real.
+    
+    matplotlib se importa dentro de cada método, de modo que importar este
+    módulo (o usar Simulacion sin interfaz) no carga la librería gráfica.
     """
     
     @staticmethod
@@ -17,6 +351,14 @@ class Visualizador:
         Args:
             simulacion (Simulacion): La simulación a ejecutar
         """
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as patches
+        from matplotlib.animation import FuncAnimation
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+        from matplotlib.widgets import Slider
+        import numpy as np
+        
         entorno = simulacion.entorno
         pasos_por_dia = simulacion.pasos_por_dia
         
@@ -54,9 +396,10 @@ class Visualizador:
         ax.set_xlabel('X', fontsize=14, fontweight='bold')
         ax.set_ylabel('Y', fontsize=14, fontweight='bold')
         
-        # Título principal
-        titulo = ax.text(0.5, 1.06, '', transform=ax.transAxes, 
-                        fontsize=16, fontweight='bold', ha='center',
+        # Título principal: dentro de los ejes, porque el blitting solo
+        # redibuja el área de ax y lo que quede fuera nunca se actualizaría
+        titulo = ax.text(0.5, 0.985, '', transform=ax.transAxes, 
+                        fontsize=16, fontweight='bold', ha='center', va='top', zorder=10,
                         bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
         
         # Panel de información
@@ -74,8 +417,29 @@ class Visualizador:
                                    marker='o', zorder=3, 
                                    edgecolors='#c44616', linewidths=1.5)
         
+        # Artistas persistentes: se crean una sola vez y en cada frame solo se
+        # actualizan sus datos (posiciones, colores y segmentos)
+        trazos = LineCollection([], linewidths=2.5, alpha=0.6, zorder=2)
+        ax.add_collection(trazos)
+        scatter_muertos = ax.scatter([], [], s=300, edgecolors='gray', linewidths=2,
+                                     zorder=4, alpha=0.3)
+        scatter_entidades = ax.scatter([], [], zorder=5, alpha=1.0)
+        scatter_cruces = ax.scatter([], [], c='red', s=600, marker='X', linewidths=5,
+                                    zorder=9, alpha=1.0, edgecolors='darkred')
+        textos_comida = []
+        textos_mordidas = []
+        
+        def crear_texto_comida():
+            return ax.text(0, 0, '', fontsize=10, ha='center', va='center',
+                           color='white', fontweight='bold', zorder=7,
+                           bbox=dict(boxstyle='circle,pad=0.1', 
+                                     facecolor='black', alpha=0.7, edgecolor='none'))
+        
+        def crear_texto_mordida():
+            return ax.text(0, 0, '', fontsize=11, ha='center', va='center',
+                           color='red', fontweight='bold', zorder=8)
+        
         # Leyenda compacta
-        from matplotlib.lines import Line2D
         legend_elements = [
             Line2D([0], [0], marker='o', color='w', markerfacecolor='white', 
                    markersize=8, label='Normal', markeredgecolor='black', linewidth=1.5),
@@ -92,10 +456,8 @@ class Visualizador:
                  framealpha=0.85, ncol=5, borderpad=0.3, labelspacing=0.2,
                  columnspacing=0.5, handletextpad=0.3)
         
-        # SLIDER DE VELOCIDAD con sistema que SÍ funciona
-        # Número de frames a saltar (skip)
-        frame_skip = {'valor': 0}  # 0 = no saltar, 1 = saltar 1 frame, etc.
-        
+        # SLIDER DE VELOCIDAD: controla el ritmo de la simulación en segundo plano,
+        # independiente de la velocidad de dibujo
         velocidad_slider = Slider(
             ax=ax_slider,
             label='Velocidad (derecha = mas rapido)',
@@ -106,18 +468,17 @@ class Visualizador:
             color='lightblue'
         )
         
+        productor = ProductorSimulacion(simulacion)
+        
         def update_speed(val):
-            frame_skip['valor'] = int(val)
+            productor.velocidad = int(val)
         
         velocidad_slider.on_changed(update_speed)
         
-        # Variables de estado
-        paso_en_dia = [0]
-        dia_actual = [1]
-        elementos_particulas = []
-        simulacion_activa = [True]
-        particulas_muertas_depredador = []
-        frame_counter = [0]
+        # Estado del lado del dibujo: el último fotograma y la comida visible
+        ultimo_fotograma = [None]
+        comida_visible = np.zeros((entorno.ancho, entorno.alto), dtype=bool)
+        comida_visible[tuple(entorno.obtener_coordenadas_comida().T)] = True
         
         # Variable para el hover
         hover_annotation = ax.annotate("", xy=(0,0), xytext=(10,10), textcoords="offset points",
@@ -125,318 +486,167 @@ class Visualizador:
                                                edgecolor='black', linewidth=2),
                                       fontsize=9, fontweight='bold', zorder=100, visible=False)
         
+        # Índice de cercanía del último fotograma (se arma al primer movimiento
+        # del mouse sobre ese fotograma) y la entrada (x, y, texto) mostrada
+        indice_hover = [None, None]
+        hover_actual = [None]
+        
         def on_mouse_move(event):
             """Maneja el movimiento del mouse para mostrar IDs"""
-            if event.inaxes != ax:
-                hover_annotation.set_visible(False)
-                fig.canvas.draw_idle()
-                return
+            fotograma = ultimo_fotograma[0]
+            entrada = None
+            if (event.inaxes == ax and fotograma is not None and len(fotograma['ids'])
+                    and event.xdata is not None and event.ydata is not None):
+                if indice_hover[0] is not fotograma:
+                    indice_hover[:] = [fotograma, IndiceCercania(fotograma['posiciones'])]
+                i = indice_hover[1].buscar(event.xdata, event.ydata)
+                if i is not None:
+                    # El texto se arma solo para la entidad bajo el mouse
+                    x, y = fotograma['posiciones'][i]
+                    entrada = (x, y, texto_hover(fotograma, i))
             
-            if not simulacion.particulas and not simulacion.depredadores:
-                hover_annotation.set_visible(False)
-                fig.canvas.draw_idle()
+            # Solo redibujar si cambió lo que se muestra
+            if entrada == hover_actual[0]:
                 return
-            
-            todas_entidades = list(simulacion.particulas) + list(simulacion.depredadores)
-            for entidad in todas_entidades:
-                x, y = entidad.posicion_actual
-                if event.xdata is not None and event.ydata is not None:
-                    dist = ((event.xdata - x)**2 + (event.ydata - y)**2)**0.5
-                    if dist < 2.0:
-                        if entidad.es_depredador:
-                            info_text = f"Depredador #{entidad.id}"
-                        else:
-                            tipo = ""
-                            if entidad.mutacion == 'velocidad':
-                                tipo = " (Velocidad)"
-                            elif entidad.mutacion == 'prioridad':
-                                tipo = " (Prioridad)"
-                            info_text = f"#{entidad.id}{tipo}\nComida: {entidad.comida_consumida}"
-                            if entidad.mordidas_recibidas > 0:
-                                info_text += f"\nMordidas: {entidad.mordidas_recibidas}"
-                        
-                        hover_annotation.xy = (x, y)
-                        hover_annotation.set_text(info_text)
-                        hover_annotation.set_visible(True)
-                        fig.canvas.draw_idle()
-                        return
-            
-            hover_annotation.set_visible(False)
+            hover_actual[0] = entrada
+            if entrada is None:
+                hover_annotation.set_visible(False)
+            else:
+                x, y, info_text = entrada
+                hover_annotation.xy = (x, y)
+                hover_annotation.set_text(info_text)
+                hover_annotation.set_visible(True)
             fig.canvas.draw_idle()
         
         fig.canvas.mpl_connect('motion_notify_event', on_mouse_move)
+        fig.canvas.mpl_connect('close_event', lambda event: productor.detener())
         
         def init():
             # Mostrar comida inicial
-            if entorno.posiciones_comida:
-                comida_x = [pos[0] for pos in entorno.posiciones_comida]
-                comida_y = [pos[1] for pos in entorno.posiciones_comida]
-                scatter_comida.set_offsets(np.column_stack([comida_x, comida_y]))
+            scatter_comida.set_offsets(np.argwhere(comida_visible))
             
             titulo.set_text('Simulacion de Poblacion - INICIANDO...')
             contador_texto.set_text(
-                f'Particulas: {len(simulacion.particulas)}\n'
-                f'Comida: {len(entorno.posiciones_comida)}\n'
+                f'Particulas: {simulacion.poblacion.total}\n'
+                f'Comida: {entorno.comida_actual}\n'
                 f'Dia: 1\n'
                 f'Paso: 0/{pasos_por_dia}'
             )
-            return [scatter_comida, titulo, contador_texto]
+            return artistas()
+        
+        def artistas():
+            """Artistas que se redibujan en cada frame (blitting)."""
+            return ([scatter_comida, trazos, scatter_muertos, scatter_entidades, scatter_cruces,
+                     titulo, contador_texto, hover_annotation] + textos_comida + textos_mordidas)
+        
+        def actualizar_textos(pool, datos, crear):
+            """Reutiliza los textos del pool, creando solo los que falten."""
+            for i, (x, y, texto) in enumerate(datos):
+                if i == len(pool):
+                    pool.append(crear())
+                pool[i].set_position((x, y))
+                pool[i].set_text(texto)
+                pool[i].set_visible(True)
+            for sobrante in pool[len(datos):]:
+                sobrante.set_visible(False)
+        
+        def aplicar_comida(fotograma):
+            """Aplica los cambios de comida de un fotograma; True si hubo cambios."""
+            cambio = False
+            if fotograma['comida_reinicio'] is not None:
+                comida_visible[:] = False
+                comida_visible[tuple(fotograma['comida_reinicio'].T)] = True
+                cambio = True
+            for x, y in fotograma['comida_consumida']:
+                comida_visible[x, y] = False
+                cambio = True
+            return cambio
+        
+        def dibujar_fotograma(fotograma):
+            """Actualiza los datos de los artistas persistentes con un fotograma."""
+            # Partículas muertas por depredadores
+            scatter_muertos.set_offsets(fotograma['pos_muertos'])
+            scatter_muertos.set_facecolors(fotograma['colores_muertos'])
+            scatter_cruces.set_offsets(fotograma['pos_muertos'])
+            
+            estilo = estilo_fotograma(fotograma)
+            
+            # Trazos: cada camino se recorta a lo que tenía al tomar el fotograma.
+            # El rastro solo crece, así que len(camino) > 1 descarta rápido los vacíos
+            segmentos = []
+            colores_trazos = []
+            for (camino, n), color in zip(fotograma['caminos'], estilo['colores_base']):
+                if len(camino) > 1:
+                    coordenadas = camino.coordenadas(n)
+                    if len(coordenadas) > 1:
+                        segmentos.append(coordenadas.astype(float))
+                        colores_trazos.append(color)
+            trazos.set_segments(segmentos)
+            trazos.set_colors(colores_trazos)
+            
+            # Partículas vivas y depredadores
+            scatter_entidades.set_offsets(fotograma['posiciones'])
+            scatter_entidades.set_facecolors(estilo['colores'])
+            scatter_entidades.set_edgecolors(estilo['bordes'])
+            scatter_entidades.set_linewidths(estilo['grosores'])
+            scatter_entidades.set_sizes(estilo['tamanos'])
+            
+            actualizar_textos(textos_comida, estilo['textos_comida'], crear_texto_comida)
+            actualizar_textos(textos_mordidas, estilo['textos_mordidas'], crear_texto_mordida)
         
         def animate(frame):
-            nonlocal elementos_particulas, particulas_muertas_depredador
+            # Tomar todos los fotogramas pendientes: la comida se aplica en orden,
+            # pero solo se dibuja el más reciente
+            fotograma = None
+            comida_cambio = False
+            for pendiente in productor.extraer_pendientes():
+                comida_cambio = aplicar_comida(pendiente) or comida_cambio
+                fotograma = pendiente
             
-            if not simulacion_activa[0]:
-                return [scatter_comida, titulo, contador_texto]
+            if fotograma is None:
+                return artistas()
+            ultimo_fotograma[0] = fotograma
             
-            # Sistema de skip frames para velocidad
-            skip = frame_skip['valor']
+            if comida_cambio:
+                scatter_comida.set_offsets(np.argwhere(comida_visible))
             
-            # Limpiar elementos anteriores
-            for elemento in elementos_particulas:
-                try:
-                    elemento.remove()
-                except:
-                    pass
-            elementos_particulas.clear()
+            dibujar_fotograma(fotograma)
             
-            # Verificar si hay partículas
-            if len(simulacion.particulas) == 0:
+            if fotograma['finalizada']:
                 titulo.set_text('SIMULACION FINALIZADA - Todas las particulas murieron')
                 contador_texto.set_text(
-                    f'Dia final: {dia_actual[0] - 1}\n'
+                    f'Dia final: {fotograma["dia"] - 1}\n'
                     f'Particulas: 0\n'
                     f'Estado: EXTINCION'
                 )
-                simulacion_activa[0] = False
-                print(f"\n{'='*70}")
-                print("SIMULACION TERMINADA - EXTINCION TOTAL")
-                print(f"{'='*70}\n")
-                
-                # Dibujar partículas muertas
-                for pos, particula in particulas_muertas_depredador:
-                    x, y = pos
-                    punto = ax.scatter([x], [y], c=[particula.color], 
-                                     s=300, edgecolors='gray', linewidths=2, 
-                                     zorder=4, alpha=0.3)
-                    elementos_particulas.append(punto)
-                    
-                    x_marca = ax.scatter([x], [y], c='red', s=600, marker='X', 
-                                        linewidths=5, zorder=9, alpha=1.0, edgecolors='darkred')
-                    elementos_particulas.append(x_marca)
-                
-                return [scatter_comida, titulo, contador_texto, hover_annotation] + elementos_particulas
-            
-            # Realizar múltiples pasos según la velocidad
-            pasos_a_realizar = 1 + skip
-            
-            for _ in range(pasos_a_realizar):
-                if len(simulacion.particulas) == 0:
-                    break
-                
-                # Guardar estado anterior
-                particulas_vivas_antes = {p.id: (p, p.posicion_actual) for p in simulacion.particulas if p.viva}
-                
-                # Realizar pasos
-                for particula in simulacion.particulas:
-                    particula.realizar_paso(depredadores=simulacion.depredadores)
-                
-                for depredador in simulacion.depredadores:
-                    depredador.realizar_paso()
-                
-                # Procesar ataques
-                muertes_paso = simulacion._procesar_ataques_depredadores()
-                
-                # Detectar muertes
-                for pid, (particula, pos_anterior) in particulas_vivas_antes.items():
-                    if not particula.viva:
-                        particulas_muertas_depredador.append((particula.posicion_actual, particula))
-                        print(f"  Particula #{particula.id} murio por depredador")
-                
-                paso_en_dia[0] += 1
-                
-                # Verificar fin de día
-                if paso_en_dia[0] >= pasos_por_dia:
-                    # Procesar ataques finales
-                    muertes_depredador_final = simulacion._procesar_ataques_depredadores()
-                    num_depredadores = len(simulacion.depredadores)
-                    
-                    # Limpiar depredadores
-                    simulacion.depredadores = []
-                    particulas_muertas_depredador.clear()
-                    
-                    sobrevivientes = []
-                    reproducciones = 0
-                    muertes = 0
-                    muertes_totales_depredador = 0
-                    mutaciones_velocidad = 0
-                    mutaciones_prioridad = 0
-                    
-                    for particula in simulacion.particulas:
-                        if not particula.viva:
-                            muertes += 1
-                            # Contar si murió por depredador
-                            if particula.mordidas_recibidas > 0:
-                                muertes_totales_depredador += 1
-                            continue
-                        
-                        resultado = particula.evaluar_fin_dia()
-                        
-                        if resultado['sobrevive']:
-                            sobrevivientes.append(particula)
-                            
-                            if resultado['reproduce']:
-                                hijo = particula.crear_hijo(
-                                    simulacion._obtener_nuevo_id(),
-                                    mutacion_hijo=resultado['mutacion_hijo']
-                                )
-                                sobrevivientes.append(hijo)
-                                reproducciones += 1
-                                
-                                if resultado['mutacion_hijo'] == 'velocidad':
-                                    mutaciones_velocidad += 1
-                                elif resultado['mutacion_hijo'] == 'prioridad':
-                                    mutaciones_prioridad += 1
-                        else:
-                            muertes += 1
-                            particula.viva = False
-                    
-                    simulacion.particulas = sobrevivientes
-                    
-                    normales = sum(1 for p in simulacion.particulas if p.mutacion == 'ninguna')
-                    velocidad_count = sum(1 for p in simulacion.particulas if p.mutacion == 'velocidad')
-                    prioridad = sum(1 for p in simulacion.particulas if p.mutacion == 'prioridad')
-                    
-                    estadisticas = {
-                        'dia': dia_actual[0],
-                        'particulas_finales': len(simulacion.particulas),
-                        'muertes': muertes,
-                        'reproducciones': reproducciones,
-                        'comida_restante': entorno.comida_actual,
-                        'comida_inicial': entorno.comida_total,
-                        'porcentaje_comida': entorno.porcentaje_comida_actual,
-                        'tipo_dia': entorno.obtener_info_comida()['tipo_dia'],
-                        'normales': normales,
-                        'velocidad': velocidad_count,
-                        'prioridad': prioridad,
-                        'nuevas_mutaciones_velocidad': mutaciones_velocidad,
-                        'nuevas_mutaciones_prioridad': mutaciones_prioridad,
-                        'depredadores_aparecidos': num_depredadores,
-                        'muertes_por_depredador': muertes_totales_depredador
-                    }
-                    simulacion.historial_dias.append(estadisticas)
-                    
-                    print(f"\n{'='*70}")
-                    print(f"FIN DEL DIA {dia_actual[0]}")
-                    print(f"{'='*70}")
-                    print(f"Sobrevivientes: {len(simulacion.particulas)}")
-                    print(f"Muertes: {muertes}")
-                    if muertes_totales_depredador > 0:
-                        print(f"  - Por depredadores: {muertes_totales_depredador}")
-                    print(f"Reproducciones: {reproducciones}")
-                    print(f"{'='*70}\n")
-                    
-                    entorno.reestablecer_comida()
-                    info_comida = entorno.obtener_info_comida()
-                    print(f"Comida reestablecida: {entorno.comida_actual} unidades")
-                    
-                    if simulacion._generar_depredadores():
-                        print(f"APARECEN {len(simulacion.depredadores)} DEPREDADOR(ES)")
-                    print()
-                    
-                    dia_actual[0] += 1
-                    paso_en_dia[0] = 0
-                    simulacion.dia_actual = dia_actual[0]
-                    
-                    for particula in simulacion.particulas:
-                        particula.preparar_nuevo_dia()
-                    
-                    break  # Salir del bucle de pasos múltiples
-            
-            # Actualizar comida
-            if entorno.posiciones_comida:
-                comida_x = [pos[0] for pos in entorno.posiciones_comida]
-                comida_y = [pos[1] for pos in entorno.posiciones_comida]
-                scatter_comida.set_offsets(np.column_stack([comida_x, comida_y]))
-            else:
-                scatter_comida.set_offsets(np.empty((0, 2)))
-            
-            # Dibujar partículas muertas
-            for pos, particula in particulas_muertas_depredador:
-                x, y = pos
-                punto = ax.scatter([x], [y], c=[particula.color], 
-                                 s=300, edgecolors='gray', linewidths=2, 
-                                 zorder=4, alpha=0.3)
-                elementos_particulas.append(punto)
-                
-                x_marca = ax.scatter([x], [y], c='red', s=600, marker='X', 
-                                    linewidths=5, zorder=9, alpha=1.0, edgecolors='darkred')
-                elementos_particulas.append(x_marca)
-            
-            # Dibujar partículas vivas
-            todas_entidades = list(simulacion.particulas) + list(simulacion.depredadores)
-            
-            for entidad in todas_entidades:
-                if len(entidad.camino) > 1:
-                    xs = [pos[0] for pos in entidad.camino]
-                    ys = [pos[1] for pos in entidad.camino]
-                    linea, = ax.plot(xs, ys, '-', linewidth=2.5, 
-                                   color=entidad.color, alpha=0.6, zorder=2)
-                    elementos_particulas.append(linea)
-                
-                x, y = entidad.posicion_actual
-                tamano = 400 if entidad.es_depredador else 300
-                
-                color_actual = entidad.color
-                borde_color = 'black'
-                borde_grosor = 3
-                
-                if not entidad.es_depredador and entidad.mutacion == 'prioridad' and entidad.mordidas_recibidas == 1:
-                    color_actual = (0.0, 0.5, 0.0)
-                    borde_color = 'red'
-                    borde_grosor = 6
-                
-                punto = ax.scatter([x], [y], c=[color_actual], 
-                                 s=tamano, edgecolors=borde_color, linewidths=borde_grosor, 
-                                 zorder=5, alpha=1.0)
-                elementos_particulas.append(punto)
-                
-                if not entidad.es_depredador and entidad.comida_consumida > 0:
-                    comida_text = ax.text(x, y, f'{entidad.comida_consumida}', 
-                                        fontsize=10, ha='center', va='center',
-                                        color='white', fontweight='bold',
-                                        zorder=7,
-                                        bbox=dict(boxstyle='circle,pad=0.1', 
-                                                facecolor='black', alpha=0.7, edgecolor='none'))
-                    elementos_particulas.append(comida_text)
-                
-                if not entidad.es_depredador and entidad.mordidas_recibidas > 0:
-                    mordida_text = ax.text(x + 1.2, y - 1.2, f'!{entidad.mordidas_recibidas}', 
-                                          fontsize=11, ha='center', va='center',
-                                          color='red', fontweight='bold', zorder=8)
-                    elementos_particulas.append(mordida_text)
+                return artistas()
             
             # Actualizar título
-            progreso = (paso_en_dia[0] / pasos_por_dia) * 100
-            titulo.set_text(f'Simulacion de Poblacion - DIA {dia_actual[0]} - {progreso:.1f}% completado')
+            progreso = (fotograma['paso'] / pasos_por_dia) * 100
+            titulo.set_text(f'Simulacion de Poblacion - DIA {fotograma["dia"]} - {progreso:.1f}% completado')
             
+            poblacion = fotograma['poblacion']
             contador_texto.set_text(
-                f'Particulas: {len(simulacion.particulas)}\n'
-                f'Depredadores: {len(simulacion.depredadores)}\n'
-                f'Comida: {len(entorno.posiciones_comida)}\n'
-                f'Dia: {dia_actual[0]}\n'
-                f'Paso: {paso_en_dia[0]}/{pasos_por_dia}\n'
-                f'Velocidad: x{1+skip}'
+                f'Particulas: {poblacion["vivas"]} '
+                f'(N {poblacion["normales"]} V {poblacion["velocidad"]} P {poblacion["prioridad"]})\n'
+                f'En casa: {poblacion["en_casa"]}  Alimentadas: {poblacion["alimentadas"]}\n'
+                f'Mordidas: {poblacion["mordidas"]}\n'
+                f'Depredadores: {fotograma["num_depredadores"]}\n'
+                f'Comida: {fotograma["comida_actual"]}\n'
+                f'Dia: {fotograma["dia"]}\n'
+                f'Paso: {fotograma["paso"]}/{pasos_por_dia}\n'
+                f'Velocidad: x{1 + productor.velocidad}'
             )
             
-            return [scatter_comida, titulo, contador_texto, hover_annotation] + elementos_particulas
+            return artistas()
         
         print(f"\n{'='*70}")
         print("INICIANDO SIMULACION VISUAL")
         print(f"{'='*70}")
         print("Usa el SLIDER para cambiar la velocidad:")
-        print("  - 0 = Normal (1 paso por frame)")
-        print("  - 5 = Rapido (6 pasos por frame)")
-        print("  - 10 = Muy rapido (11 pasos por frame)")
+        print("  - 0 = Normal (~33 pasos por segundo)")
+        print("  - 5 = Rapido (6 veces mas pasos por segundo)")
+        print("  - 10 = Muy rapido (11 veces mas pasos por segundo)")
         print(f"{'='*70}\n")
         
         # Crear animación
@@ -446,14 +656,163 @@ class Visualizador:
             init_func=init,
             frames=100000,
             interval=30,  # Intervalo fijo de 30ms
-            blit=False,
+            blit=True,
             repeat=False,
             cache_frame_data=False
         )
         
-        plt.tight_layout()
-        plt.show()
+        productor.iniciar()
+        try:
+            plt.tight_layout()
+            plt.show()
+        finally:
+            # Al cerrar la ventana se detiene la simulación en segundo plano
+            productor.detener()
+        
+        return anim
+    
+    @staticmethod
+    def reproducir_grabacion(directorio, dia=0, paso=0):
+        """
+        Reproduce una grabación hecha con GrabadorTrayectorias, sin volver a simular.
+        
+        Los sliders permiten ir a cualquier día y paso al instante: cada
+        fotograma se lee directamente de los archivos mapeados en memoria.
+        La barra espaciadora pausa o reanuda la reproducción.
+        
+        Args:
+            directorio (str): Carpeta de la grabación
+            dia (int): Índice del día grabado con el que empezar
+            paso (int): Paso con el que empezar
+            
+        Raises:
+            ValueError: Si dia o paso están fuera de la grabación
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+        from matplotlib.collections import LineCollection
+        from matplotlib.widgets import Slider
+        import numpy as np
+        from grabador import COLORES_TIPO, TIPO_DEPREDADOR, Grabacion
+        
+        grabacion = Grabacion(directorio)
+        if grabacion.num_dias == 0:
+            print("La grabacion no tiene dias")
+            return
+        grabacion.validar_posicion(dia, paso)
+        indice = grabacion.indice
+        pasos_por_dia = grabacion.pasos_por_dia
+        colores_tipo = np.array(COLORES_TIPO)
+        
+        fig = plt.figure(figsize=(14, 15))
+        ax = plt.subplot2grid((20, 1), (0, 0), rowspan=17)
+        ax_dia = plt.subplot2grid((20, 1), (18, 0))
+        ax_paso = plt.subplot2grid((20, 1), (19, 0))
+        
+        margen = 2
+        ax.set_xlim(-margen, indice['ancho'] + margen)
+        ax.set_ylim(-margen, indice['alto'] + margen)
+        ax.set_aspect('equal')
+        ax.set_facecolor('#e8f4f8')
+        ax.grid(True, alpha=0.2, linestyle='--', linewidth=0.5)
+        ax.invert_yaxis()
+        
+        titulo = ax.text(0.5, 1.03, '', transform=ax.transAxes, fontsize=15,
+                         fontweight='bold', ha='center',
+                         bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+        contador_texto = ax.text(0.02, 0.98, '', transform=ax.transAxes, fontsize=12,
+                                 fontweight='bold', verticalalignment='top', zorder=10,
+                                 family='monospace',
+                                 bbox=dict(boxstyle='round,pad=0.8', facecolor='white',
+                                           alpha=0.95, edgecolor='black', linewidth=2))
+        
+        scatter_comida = ax.scatter([], [], c='#ff6b35', s=80, alpha=0.9, marker='o',
+                                    zorder=3, edgecolors='#c44616', linewidths=1.5)
+        trazos = LineCollection([], linewidths=2.5, alpha=0.6, zorder=2)
+        ax.add_collection(trazos)
+        scatter_entidades = ax.scatter([], [], s=300, edgecolors='black', linewidths=3, zorder=5)
+        scatter_cruces = ax.scatter([], [], c='red', s=600, marker='X', linewidths=5,
+                                    zorder=9, edgecolors='darkred')
+        
+        slider_dia = Slider(ax=ax_dia, label='Dia', valmin=0, valmax=grabacion.num_dias - 1,
+                            valinit=dia, valstep=1, color='lightblue')
+        slider_paso = Slider(ax=ax_paso, label='Paso', valmin=0, valmax=pasos_por_dia,
+                             valinit=paso, valstep=1, color='lightblue')
         
+        # Día y paso mostrados, y si la reproducción avanza sola
+        estado = {'dia': dia, 'paso': paso, 'reproduciendo': True, 'moviendo_sliders': False}
+        
+        def dibujar():
+            d, p = estado['dia'], estado['paso']
+            fotograma = grabacion.fotograma(d, p)
+            posiciones = fotograma['posiciones'].astype(float)
+            vivas = fotograma['vivas']
+            tipos = fotograma['tipos']
+            
+            if fotograma['comida'] is not None:
+                scatter_comida.set_offsets(fotograma['comida'])
+            
+            caminos = grabacion.caminos(d, p).astype(float)
+            trazos.set_segments(list(caminos[vivas]))
+            trazos.set_colors(colores_tipo[tipos[vivas]])
+            
+            scatter_entidades.set_offsets(posiciones[vivas].reshape(-1, 2))
+            scatter_entidades.set_facecolors(colores_tipo[tipos[vivas]])
+            scatter_cruces.set_offsets(posiciones[~vivas].reshape(-1, 2))
+            
+            datos_dia = indice['dias'][d]
+            particulas = int((vivas & (tipos != TIPO_DEPREDADOR)).sum())
+            titulo.set_text(f"Reproduccion - DIA {datos_dia['dia']} - paso {p}/{pasos_por_dia}")
+            contador_texto.set_text(
+                f"Particulas: {particulas}\n"
+                f"Depredadores: {int((tipos == TIPO_DEPREDADOR).sum())}\n"
+                f"Muertes en el dia: {sum(1 for _, paso_muerte in datos_dia['muertes'] if paso_muerte <= p)}\n"
+                f"Nacen al cerrar: {len(datos_dia['nacimientos'])}\n"
+                f"{'' if estado['reproduciendo'] else 'EN PAUSA (espacio)'}"
+            )
+            
+            # Mantener los sliders en sincronía sin volver a dibujar
+            estado['moviendo_sliders'] = True
+            slider_dia.set_val(d)
+            slider_paso.set_val(p)
+            estado['moviendo_sliders'] = False
+        
+        def ir_a(dia_nuevo=None, paso_nuevo=None):
+            if estado['moviendo_sliders']:
+                return
+            if dia_nuevo is not None:
+                estado['dia'] = int(dia_nuevo)
+            if paso_nuevo is not None:
+                estado['paso'] = int(paso_nuevo)
+            dibujar()
+            fig.canvas.draw_idle()
+        
+        slider_dia.on_changed(lambda val: ir_a(dia_nuevo=val))
+        slider_paso.on_changed(lambda val: ir_a(paso_nuevo=val))
+        
+        def on_key(event):
+            if event.key == ' ':
+                estado['reproduciendo'] = not estado['reproduciendo']
+                dibujar()
+                fig.canvas.draw_idle()
+        
+        fig.canvas.mpl_connect('key_press_event', on_key)
+        
+        def animate(frame):
+            if not estado['reproduciendo']:
+                return
+            if estado['paso'] < pasos_por_dia:
+                estado['paso'] += 1
+            elif estado['dia'] < grabacion.num_dias - 1:
+                estado['dia'] += 1
+                estado['paso'] = 0
+            else:
+                estado['reproduciendo'] = False
+            dibujar()
+        
+        dibujar()
+        anim = FuncAnimation(fig, animate, interval=30, cache_frame_data=False)
+        plt.show()
         return anim
     
     @staticmethod
@@ -462,30 +821,28 @@ class Visualizador:
         Crea gráficos de las estadísticas de la simulación.
         
         Args:
-            historial (list): Historial de días de la simulación
+            historial: Historial de días de la simulación (lista o AlmacenHistorial)
         """
+        import matplotlib.pyplot as plt
+        from historial import columna
+        
         if not historial:
             print("No hay datos para graficar")
             return
         
-        dias = [d['dia'] for d in historial]
-        particulas = [d['particulas_finales'] for d in historial]
-        muertes = [d['muertes'] for d in historial]
-        reproducciones = [d['reproducciones'] for d in historial]
+        # Por columnas: con un AlmacenHistorial cada una se lee con un memmap
+        dias = columna(historial, 'dia')
+        particulas = columna(historial, 'particulas_finales')
+        muertes = columna(historial, 'muertes')
+        reproducciones = columna(historial, 'reproducciones')
         
-        normales = [d.get('normales', 0) for d in historial]
-        velocidad = [d.get('velocidad', 0) for d in historial]
-        prioridad = [d.get('prioridad', 0) for d in historial]
+        normales = columna(historial, 'normales')
+        velocidad = columna(historial, 'velocidad')
+        prioridad = columna(historial, 'prioridad')
         
         # CORRECCIÓN CRÍTICA: Asegurar que siempre haya datos de depredadores
-        muertes_depredador = []
-        for d in historial:
-            # Intentar obtener el valor, si no existe usar 0
-            valor = d.get('muertes_por_depredador', 0)
-            # Asegurar que sea un número válido
-            if valor is None:
-                valor = 0
-            muertes_depredador.append(valor)
+        # (columna() cuenta como 0 los días sin el dato o con None)
+        muertes_depredador = columna(historial, 'muertes_por_depredador')
         
         # Crear figura con mejor espaciado
         fig = plt.figure(figsize=(20, 11))
@@ -524,7 +881,7 @@ class Visualizador:
         ax3.grid(True, alpha=0.3)
         
         # Gráfico 4: Comida
-        comida_restante = [d['comida_restante'] for d in historial]
+        comida_restante = columna(historial, 'comida_restante')
         ax4 = plt.subplot(2, 3, 4)
         ax4.plot(dias, comida_restante, 'orange', linewidth=2.5, marker='o', markersize=7)
         ax4.set_xlabel('Dia', fontsize=12, fontweight='bold')
@@ -536,7 +893,7 @@ class Visualizador:
         ax5 = plt.subplot(2, 3, 5)
         
         # Verificar si hay datos de depredadores
-        total_muertes_dep = sum(muertes_depredador)
+        total_muertes_dep = muertes_depredador.sum()
         
         if total_muertes_dep > 0:
             # Hay muertes, mostrar el gráfico normal
@@ -563,9 +920,9 @@ class Visualizador:
         
         total_dias = len(historial)
         particulas_final = historial[-1]['particulas_finales']
-        total_muertes = sum(muertes)
-        total_reproducciones = sum(reproducciones)
-        total_muertes_depredador = sum(muertes_depredador)
+        total_muertes = int(muertes.sum())
+        total_reproducciones = int(reproducciones.sum())
+        total_muertes_depredador = int(muertes_depredador.sum())
         
         if particulas_final > 0:
             pct_normales = (normales[-1] / particulas_final * 100)
@@ -592,9 +949,9 @@ POBLACION:
   Reproducciones: {total_reproducciones}
 
 DISTRIBUCION FINAL:
-  Normales: {normales[-1] if normales else 0} ({pct_normales:.1f}%)
-  Velocidad: {velocidad[-1] if velocidad else 0} ({pct_velocidad:.1f}%)
-  Prioridad: {prioridad[-1] if prioridad else 0} ({pct_prioridad:.1f}%)
+  Normales: {normales[-1]} ({pct_normales:.1f}%)
+  Velocidad: {velocidad[-1]} ({pct_velocidad:.1f}%)
+  Prioridad: {prioridad[-1]} ({pct_prioridad:.1f}%)
 
 DEPREDADORES:
   Muertes causadas: {total_muertes_depredador}
@@ -620,6 +977,9 @@ DEPREDADORES:
             simulacion (Simulacion): La simulación a visualizar
             mostrar_comida (bool): Si True, muestra la comida en el mapa
         """
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as patches
+        
         entorno = simulacion.entorno
         particulas = simulacion.particulas
         
@@ -642,17 +1002,15 @@ DEPREDADORES:
         ax.add_patch(patches.Rectangle((entorno.ancho - 1, 0), 0.5, entorno.alto - 1, 
                                       color=casa_color, alpha=0.5))
         
-        if mostrar_comida and len(entorno.posiciones_comida) > 0:
-            comida_x = [pos[0] for pos in entorno.posiciones_comida]
-            comida_y = [pos[1] for pos in entorno.posiciones_comida]
-            ax.scatter(comida_x, comida_y, c='orange', s=20, alpha=0.6, 
+        if mostrar_comida and entorno.comida_actual > 0:
+            comida = entorno.obtener_coordenadas_comida()
+            ax.scatter(comida[:, 0], comida[:, 1], c='orange', s=20, alpha=0.6, 
                       marker='o', label='Comida')
         
         for particula in particulas:
             if len(particula.camino) > 1:
-                xs = [pos[0] for pos in particula.camino]
-                ys = [pos[1] for pos in particula.camino]
-                ax.plot(xs, ys, '-', linewidth=1.5, color=particula.color, alpha=0.6)
+                camino = particula.camino.coordenadas()
+                ax.plot(camino[:, 0], camino[:, 1], '-', linewidth=1.5, color=particula.color, alpha=0.6)
         
         for particula in particulas:
             x, y = particula.posicion_actual